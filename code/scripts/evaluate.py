@@ -5,6 +5,9 @@
 사용 예시:
     uv run python scripts/evaluate.py --true_df data/train_dataset.csv --pred_df submission.csv
     uv run python scripts/evaluate.py --true_df data/train_dataset.csv --pred_df submission.csv --output analysis.csv
+    uv run python scripts/evaluate.py --true_df data/train_dataset.csv --pred_df submission.csv --workers 8
+    uv run python scripts/evaluate.py --true_df data/train_dataset.csv --pred_df submission.csv --golden-cache outputs/cache/golden
+    uv run python scripts/evaluate.py --true_df data/train_dataset.csv --pred_df outputs/enhanced.csv outputs/chain.csv
 """
 
 import sys
@@ -29,6 +32,9 @@ def main():
 Examples:
   python scripts/evaluate.py --true_df data/train_dataset.csv --pred_df submission.csv
   python scripts/evaluate.py --true_df data/train_dataset.csv --pred_df submission.csv --output analysis.csv
+  python scripts/evaluate.py --true_df data/train_dataset.csv --pred_df submission.csv --workers 8
+  python scripts/evaluate.py --true_df data/train_dataset.csv --pred_df submission.csv --golden-cache outputs/cache/golden
+  python scripts/evaluate.py --true_df data/train_dataset.csv --pred_df outputs/enhanced.csv outputs/chain.csv
         """
     )
 
@@ -39,13 +45,26 @@ Examples:
     )
     parser.add_argument(
         "--pred_df",
-        default="submission.csv",
-        help="Path to submission CSV containing cor_sentence"
+        nargs="+",
+        default=["submission.csv"],
+        help="Path(s) to submission CSV containing cor_sentence; with several files only the rows "
+             "that differ from the previous file are rescored"
     )
     parser.add_argument(
         "--output",
         default="analysis.csv",
-        help="Path to save analysis DataFrame as CSV (optional)"
+        help="Path to save analysis DataFrame as CSV (optional); with several predictions "
+             "each is saved as <output stem>_<prediction stem>.csv"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of scoring processes (default: 1 = sequential)"
+    )
+    parser.add_argument(
+        "--golden-cache",
+        help="Directory for precomputed truth-side diffs, reused while the truth CSV is unchanged"
     )
 
     args = parser.parse_args()
@@ -58,26 +77,34 @@ Examples:
         print(f"Error: Truth file not found: {args.true_df}")
         sys.exit(1)
 
-    try:
-        pred_df = pd.read_csv(args.pred_df)
-        print(f"Loaded prediction data: {args.pred_df} ({len(pred_df)} rows)")
-    except FileNotFoundError:
-        print(f"Error: Prediction file not found: {args.pred_df}")
-        sys.exit(1)
+    # 예측 파일이 여러 개면 같은 정답으로 반복 평가하므로 달라진 행만 다시 채점
+    evaluator = Evaluator(golden_cache_dir=args.golden_cache, incremental=len(args.pred_df) > 1)
+    output_root, output_ext = os.path.splitext(args.output or "")
 
-    # 평가 수행
-    try:
-        evaluator = Evaluator()
-        results = evaluator.evaluate(true_df, pred_df)
+    for pred_path in args.pred_df:
+        try:
+            pred_df = pd.read_csv(pred_path)
+            print(f"\nLoaded prediction data: {pred_path} ({len(pred_df)} rows)")
+        except FileNotFoundError:
+            print(f"Error: Prediction file not found: {pred_path}")
+            sys.exit(1)
 
-        # 분석 결과 저장
-        if args.output:
-            results['analysis_df'].to_csv(args.output, index=False)
-            print(f"\nAnalysis results saved to {args.output}")
+        # 평가 수행
+        try:
+            results = evaluator.evaluate(true_df, pred_df, workers=args.workers)
 
-    except Exception as e:
-        print(f"Error during evaluation: {e}")
-        sys.exit(1)
+            # 분석 결과 저장
+            if args.output:
+                output_path = args.output
+                if len(args.pred_df) > 1:
+                    pred_stem = os.path.splitext(os.path.basename(pred_path))[0]
+                    output_path = f"{output_root}_{pred_stem}{output_ext}"
+                results['analysis_df'].to_csv(output_path, index=False)
+                print(f"Analysis results saved to {output_path}")
+
+        except Exception as e:
+            print(f"Error during evaluation: {e}")
+            sys.exit(1)
 
 
 if __name__ == "__main__":
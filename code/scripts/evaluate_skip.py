@@ -0,0 +1,109 @@
+"""
+교정 불필요 문장 사전 분류기 평가 스크립트
+Train 데이터 일부로 분류기를 학습하고 나머지(holdout)에서 threshold별 건너뛰기 비율과 Recall/Precision 영향을 보고
+
+사용 예시:
+    uv run python scripts/evaluate_skip.py --train data/train_dataset.csv
+    uv run python scripts/evaluate_skip.py --train data/train_dataset.csv --pred outputs/baseline_train.csv --thresholds 0.8 0.9 0.95
+"""
+
+import sys
+import os
+import argparse
+
+# src 모듈 import를 위한 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pandas as pd
+from src.clean_classifier import CleanSentenceClassifier, skip_impact_report
+
+
+def main():
+    """
+    사전 분류기 평가 스크립트 실행
+    """
+    parser = argparse.ArgumentParser(
+        description="Report skip rate and recall impact of the clean-sentence pre-classifier",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python scripts/evaluate_skip.py --train data/train_dataset.csv
+  python scripts/evaluate_skip.py --train data/train_dataset.csv --pred outputs/baseline_train.csv
+  python scripts/evaluate_skip.py --train data/train_dataset.csv --thresholds 0.8 0.9 0.95 --holdout 0.3 --output skip_report.csv
+        """
+    )
+
+    parser.add_argument(
+        "--train",
+        default="data/train_dataset.csv",
+        help="Train CSV containing err_sentence, cor_sentence"
+    )
+    parser.add_argument(
+        "--pred",
+        help="Model predictions for the same rows without skipping (cor_sentence); "
+             "default: use the truth, i.e. the largest recall the skip can cost"
+    )
+    parser.add_argument(
+        "--thresholds",
+        type=float,
+        nargs="+",
+        default=[0.8, 0.9, 0.95, 0.99],
+        help="Confidence thresholds to compare (default: 0.8 0.9 0.95 0.99)"
+    )
+    parser.add_argument(
+        "--holdout",
+        type=float,
+        default=0.2,
+        help="Fraction of rows held out for evaluation; the rest trains the classifier (default: 0.2)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=42,
+        help="Random seed for the holdout split (default: 42)"
+    )
+    parser.add_argument(
+        "--output",
+        help="Path to save the report CSV (optional)"
+    )
+
+    args = parser.parse_args()
+
+    if not 0.0 < args.holdout < 1.0:
+        parser.error("--holdout must be between 0 and 1")
+
+    try:
+        true_df = pd.read_csv(args.train)
+        pred_df = pd.read_csv(args.pred) if args.pred else true_df
+        if len(pred_df) != len(true_df):
+            raise ValueError(f"Length mismatch: train={len(true_df)} vs pred={len(pred_df)}")
+
+        # 평가 행은 학습에 쓰지 않음 (같은 행으로 학습·평가하면 Recall 손실이 과소평가됨)
+        eval_index = true_df.sample(frac=args.holdout, random_state=args.seed).index.sort_values()
+        fit_df = true_df.drop(eval_index)
+        classifier = CleanSentenceClassifier().fit(
+            fit_df["err_sentence"].astype(str), fit_df["cor_sentence"].astype(str)
+        )
+        print(f"Classifier trained on {len(fit_df)} rows, evaluated on {len(eval_index)} held-out rows")
+
+        report = skip_impact_report(
+            classifier,
+            true_df.loc[eval_index].reset_index(drop=True),
+            pred_df.loc[eval_index].reset_index(drop=True),
+            thresholds=args.thresholds
+        )
+
+        print("\n=== 사전 분류기 Recall 영향 ===")
+        print(report.to_string(index=False, float_format=lambda value: f"{value:.2f}"))
+
+        if args.output:
+            report.to_csv(args.output, index=False)
+            print(f"\nReport saved to {args.output}")
+
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,7 +14,12 @@ import argparse
 # src 모듈 import를 위한 경로 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from src.api.cache import ResponseCache
+from src.api.rate_limiter import RateLimiter
+from src.clean_classifier import CleanSentenceClassifier
+from src.checkpoint import default_journal_path
 from src.generator import SentenceGenerator
+from src.raw_store import default_raw_path
 from src.prompts.registry import get_registry, register_default_prompts
 
 
@@ -30,6 +35,16 @@ Examples:
   python scripts/generate.py --prompt baseline --input data/train.csv --output baseline.csv
   python scripts/generate.py --prompt fewshot_v2 --input data/test.csv --output fewshot.csv
   python scripts/generate.py --prompt errortypes_v3 --input data/train.csv --output errors.csv
+  python scripts/generate.py --prompt baseline --input data/train.csv --output baseline.csv --concurrency 16
+  python scripts/generate.py --prompt baseline --input data/train.csv --output baseline.csv --cache outputs/cache/responses.sqlite
+  python scripts/generate.py --prompt baseline --concurrency 32 --adaptive-concurrency --rpm 100 --tpm 100000
+  python scripts/generate.py --prompt baseline --input data/train.csv --output baseline.csv --resume
+  python scripts/generate.py --prompt baseline --input data/big.csv --output big.csv --chunksize 1000 --resume
+  python scripts/generate.py --prompt baseline --output baseline.csv --raw-output outputs/raw/baseline.csv
+  python scripts/generate.py --prompt baseline --input data/big.csv --output big.csv --pack-size 8 --concurrency 8
+  python scripts/generate.py --prompt baseline --input data/big.csv --output big.csv --batch-job outputs/batch/big.jsonl
+  python scripts/generate.py --prompt baseline --input data/test.csv --output test.csv --skip-clean-train data/train_dataset.csv
+  python scripts/generate.py --prompt baseline --output baseline.csv --enhanced-postprocess --log-path outputs/logs/postprocess.jsonl
         """
     )
 
@@ -62,6 +77,118 @@ Examples:
         action="store_true",
         help="Disable postprocessing (no rule application, metadata only)"
     )
+    parser.add_argument(
+        "--enhanced-postprocess",
+        action="store_true",
+        help="Use the enhanced postprocessor (metadata removal + grammar rule pack) instead of minimal_rule"
+    )
+    parser.add_argument(
+        "--log-max-entries",
+        type=int,
+        default=1000,
+        help="Recent enhanced-postprocessor log entries kept in memory (default: 1000; "
+             "summary statistics always cover every row); 0 keeps none, -1 keeps all"
+    )
+    parser.add_argument(
+        "--log-path",
+        help="JSONL file receiving every enhanced-postprocessor log entry (written in the background)"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of API requests in flight (default: 1 = sequential)"
+    )
+    parser.add_argument(
+        "--pack-size",
+        type=int,
+        default=1,
+        help="Sentences per API request using the packed prompt variant; groups whose response "
+             "cannot be split fall back to single-sentence calls (default: 1 = no packing)"
+    )
+    parser.add_argument(
+        "--no-dedup",
+        action="store_true",
+        help="Send a request for every row even when inputs repeat (default: identical inputs share one request)"
+    )
+    parser.add_argument(
+        "--skip-clean-train",
+        help="Train CSV (err_sentence, cor_sentence) for the clean-sentence pre-classifier; sentences it "
+             "classifies as already correct are written unchanged without an API call"
+    )
+    parser.add_argument(
+        "--skip-clean-threshold",
+        type=float,
+        default=0.9,
+        help="Minimum pre-classifier confidence to skip the model (default: 0.9); "
+             "check the recall impact with scripts/evaluate_skip.py"
+    )
+    parser.add_argument(
+        "--batch-job",
+        help="Submit all rows as one offline batch job through the /batches endpoint; the request JSONL is "
+             "written here and submission state to <batch-job>.state.json, so rerunning resumes polling "
+             "(no --resume/--journal needed; they cannot be combined)"
+    )
+    parser.add_argument(
+        "--batch-poll-interval",
+        type=float,
+        default=30.0,
+        help="Seconds between batch status checks (default: 30)"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip rows already recorded in the checkpoint journal"
+    )
+    parser.add_argument(
+        "--journal",
+        help="Checkpoint journal path (default: <output>.journal.jsonl)"
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        help="Stream the input in chunks of N rows and append each to the output (default: load all)"
+    )
+    parser.add_argument(
+        "--raw-output",
+        help="CSV for raw model outputs before postprocessing (default: <output>.raw.csv); "
+             "re-apply postprocessors later with scripts/repostprocess.py"
+    )
+    parser.add_argument(
+        "--no-raw-output",
+        action="store_true",
+        help="Do not store raw model outputs"
+    )
+    parser.add_argument(
+        "--rpm",
+        type=float,
+        help="Requests-per-minute quota (default: unlimited)"
+    )
+    parser.add_argument(
+        "--tpm",
+        type=float,
+        help="Tokens-per-minute quota (default: unlimited)"
+    )
+    parser.add_argument(
+        "--adaptive-concurrency",
+        action="store_true",
+        help="Shrink/grow the in-flight window on 429s/timeouts (AIMD), capped by --concurrency"
+    )
+    parser.add_argument(
+        "--cache",
+        help="SQLite response cache path (e.g., outputs/cache/responses.sqlite)"
+    )
+    parser.add_argument(
+        "--cache-readonly",
+        action="store_true",
+        help="Replay responses from --cache only; never call the API"
+    )
+    parser.add_argument(
+        "--cache-max-entries",
+        type=int,
+        default=100_000,
+        help="Maximum cached responses before LRU eviction (default: 100000)"
+    )
 
     args = parser.parse_args()
 
@@ -79,21 +206,78 @@ Examples:
     if not args.prompt:
         parser.error("--prompt is required when not using --list-prompts")
 
+    if args.cache_readonly and not args.cache:
+        parser.error("--cache-readonly requires --cache")
+
+    if args.log_max_entries < -1:
+        parser.error("--log-max-entries must be >= -1")
+
+    if args.chunksize is not None and args.chunksize < 1:
+        parser.error("--chunksize must be >= 1")
+
+    if args.pack_size < 1:
+        parser.error("--pack-size must be >= 1")
+
+    if args.batch_job and (args.chunksize is not None or args.pack_size > 1):
+        parser.error("--batch-job cannot be combined with --chunksize or --pack-size")
+
+    if args.batch_job and (args.resume or args.journal):
+        parser.error("--batch-job resumes from <batch-job>.state.json and cannot be combined with --resume or --journal")
+
     # 생성기 초기화 및 실행
     try:
+        cache = None
+        if args.cache:
+            cache = ResponseCache(
+                args.cache,
+                max_entries=args.cache_max_entries,
+                readonly=args.cache_readonly
+            )
+
+        rate_limiter = None
+        if args.rpm or args.tpm:
+            rate_limiter = RateLimiter(
+                requests_per_minute=args.rpm,
+                tokens_per_minute=args.tpm
+            )
+
+        clean_classifier = None
+        if args.skip_clean_train:
+            clean_classifier = CleanSentenceClassifier.from_csv(
+                args.skip_clean_train, threshold=args.skip_clean_threshold
+            )
+
         generator = SentenceGenerator(
             prompt_name=args.prompt,
             model=args.model,
-            enable_postprocessing=not args.no_postprocess
+            enable_postprocessing=not args.no_postprocess,
+            use_enhanced_postprocessor=args.enhanced_postprocess,
+            max_concurrency=args.concurrency,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            adaptive_concurrency=args.adaptive_concurrency,
+            pack_size=args.pack_size,
+            deduplicate=not args.no_dedup,
+            clean_classifier=clean_classifier,
+            log_max_entries=None if args.log_max_entries == -1 else args.log_max_entries,
+            log_path=args.log_path
         )
 
         print(f"Postprocessing: {'Disabled' if args.no_postprocess else 'Enabled'}")
 
         generator.generate_from_csv(
             input_path=args.input,
-            output_path=args.output
+            output_path=args.output,
+            resume=args.resume,
+            journal_path=None if args.batch_job else (args.journal or default_journal_path(args.output)),
+            chunksize=args.chunksize,
+            raw_output_path=None if args.no_raw_output else (args.raw_output or default_raw_path(args.output)),
+            batch_job_path=args.batch_job,
+            batch_poll_interval=args.batch_poll_interval
         )
 
+    except KeyboardInterrupt:
+        sys.exit(130)
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
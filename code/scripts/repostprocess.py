@@ -0,0 +1,107 @@
+"""
+후처리 재적용 스크립트
+생성 시 저장한 모델 원본 출력(<output>.raw.csv)에 후처리기(또는 체인)를 다시 적용하여
+API 호출 없이 새 제출 파일 생성
+
+사용 예시:
+    uv run python scripts/repostprocess.py --raw outputs/baseline.csv.raw.csv --postprocessor enhanced --output outputs/baseline_enhanced.csv
+    uv run python scripts/repostprocess.py --raw outputs/baseline.csv.raw.csv --postprocessor enhanced minimal_rule --output outputs/chain.csv
+"""
+
+import sys
+import os
+import argparse
+import time
+
+# src 모듈 import를 위한 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.postprocessors.registry import create_postprocessor, list_postprocessors
+from src.raw_store import apply_postprocessor, read_raw_outputs
+
+
+def main():
+    """
+    후처리 재적용 스크립트 실행
+    """
+    parser = argparse.ArgumentParser(
+        description="Re-apply postprocessors to stored raw model outputs (no API calls)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python scripts/repostprocess.py --raw outputs/baseline.csv.raw.csv --postprocessor enhanced --output enhanced.csv
+  python scripts/repostprocess.py --raw outputs/baseline.csv.raw.csv --postprocessor enhanced minimal_rule --output chain.csv
+  python scripts/repostprocess.py --raw outputs/baseline.csv.raw.csv --postprocessor none --output raw.csv
+  python scripts/repostprocess.py --raw outputs/baseline.csv.raw.csv --postprocessor enhanced --output enhanced.csv --workers 8
+        """
+    )
+
+    parser.add_argument(
+        "--list-postprocessors",
+        action="store_true",
+        help="List available postprocessors and exit"
+    )
+    parser.add_argument(
+        "--raw",
+        help="Raw output CSV written by generate.py (err_sentence, raw_sentence, status)"
+    )
+    parser.add_argument(
+        "--postprocessor",
+        nargs="+",
+        default=["minimal_rule"],
+        help="Postprocessor name(s), applied in order; 'none' keeps raw outputs (default: minimal_rule)"
+    )
+    parser.add_argument(
+        "--output",
+        help="Output submission CSV path"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of postprocessing processes (default: 1 = sequential)"
+    )
+
+    args = parser.parse_args()
+
+    if args.list_postprocessors:
+        print("Available postprocessors:")
+        for name in list_postprocessors():
+            print(f"  - {name}")
+        print("  - none")
+        return
+
+    if not args.raw or not args.output:
+        parser.error("--raw and --output are required when not using --list-postprocessors")
+    if args.workers < 1:
+        parser.error("--workers must be >= 1")
+
+    try:
+        raw_df = read_raw_outputs(args.raw)
+
+        if args.postprocessor == ["none"]:
+            postprocessor = None
+            label = "none"
+        else:
+            postprocessor = create_postprocessor(
+                args.postprocessor,
+                {"enhanced": {"enable_logging": False}}
+            )
+            label = postprocessor.name
+
+        start = time.perf_counter()
+        result_df = apply_postprocessor(raw_df, postprocessor, workers=args.workers)
+        elapsed = time.perf_counter() - start
+
+        result_df.to_csv(args.output, index=False)
+        failed = int(raw_df["raw_sentence"].isna().sum())
+        print(f"Postprocessor: {label}")
+        print(f"Wrote {len(result_df)} rows to {args.output} ({elapsed:.2f}s, {failed} rows without raw output)")
+
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""
+API 호출 보조 모듈
+"""
+
+from .batch import BatchJob, BatchJobError
+from .cache import ResponseCache, CacheMissError
+from .rate_limiter import TokenBucket, RateLimiter, AdaptiveConcurrency
+from .retry import RetryPolicy, RetryError, is_retryable
+
+__all__ = [
+    "BatchJob",
+    "BatchJobError",
+    "ResponseCache",
+    "CacheMissError",
+    "TokenBucket",
+    "RateLimiter",
+    "AdaptiveConcurrency",
+    "RetryPolicy",
+    "RetryError",
+    "is_retryable",
+]
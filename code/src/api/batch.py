@@ -0,0 +1,330 @@
+"""
+배치 작업(Batch API) 모듈
+
+고정된 입력 전체를 chat completion 요청 JSONL(작업 파일)로 기록하여 OpenAI 호환 /files, /batches 엔드포인트로 제출하고,
+완료될 때까지 폴링한 뒤 결과를 custom_id 기준으로 돌려줌.
+제출 상태(파일 ID, 배치 ID, 작업 파일 해시)는 상태 파일에 기록하여, 중단 후 같은 입력으로 다시 실행하면
+새로 제출하지 않고 기존 배치를 이어서 폴링함.
+기존 배치가 만료·취소된 경우에는 완료된 요청의 결과를 상태 파일에 옮겨 두고 나머지 요청만 다시 제출함
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from src.api.retry import RetryPolicy
+
+
+# 배치 요청 대상 엔드포인트
+BATCH_ENDPOINT = "/v1/chat/completions"
+
+# 더 이상 상태가 바뀌지 않는 배치 상태
+TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def default_batch_state_path(job_path: str) -> str:
+    """
+    작업 파일에 대응하는 기본 상태 파일 경로
+
+    Args:
+        job_path: 배치 작업 JSONL 경로
+
+    Returns:
+        str: '<job_path>.state.json'
+    """
+    return f"{job_path}.state.json"
+
+
+class BatchJobError(RuntimeError):
+    """배치가 실패(검증 오류 등)했거나 폴링 제한 시간을 넘긴 경우"""
+    pass
+
+
+class BatchJob:
+    """
+    재개 가능한 배치 작업
+
+    - write_requests: (custom_id, 요청 본문) 목록을 작업 파일 JSONL로 기록
+    - submit: 작업 파일 업로드 + 배치 생성 (상태 파일에 같은 작업의 진행 중/완료 배치가 있으면 재사용,
+      만료·취소된 배치면 완료된 요청을 빼고 다시 제출)
+    - wait: 종료 상태가 될 때까지 폴링
+    - results: 출력/오류 파일을 내려받아 custom_id → 모델 응답 (실패한 요청은 None)
+    - carried_outputs: 이전 배치에서 옮겨 온 완료 결과
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        job_path: str,
+        state_path: Optional[str] = None,
+        poll_interval: float = 30.0,
+        timeout: Optional[float] = None,
+        completion_window: str = "24h",
+        retry_policy: Optional[RetryPolicy] = None,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        배치 작업 초기화
+
+        Args:
+            client: OpenAI 호환 동기 클라이언트
+            job_path: 작업 파일(JSONL) 경로
+            state_path: 상태 파일 경로 (None이면 '<job_path>.state.json')
+            poll_interval: 상태 조회 간격(초)
+            timeout: 폴링 제한 시간(초, None이면 무제한)
+            completion_window: 배치 완료 기한
+            retry_policy: 업로드/생성/조회 호출의 재시도 정책 (None이면 재시도 없음)
+            sleep: 폴링 대기 함수 (테스트용)
+        """
+        self.client = client
+        self.job_path = Path(job_path)
+        self.state_path = Path(state_path or default_batch_state_path(job_path))
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.completion_window = completion_window
+        self.retry_policy = retry_policy
+        self.sleep = sleep
+
+    def _call(self, fn: Callable[[], Any]) -> Any:
+        """재시도 정책을 적용한 API 호출"""
+        if self.retry_policy is None:
+            return fn()
+        return self.retry_policy.call(fn)[0]
+
+    def load_state(self) -> Dict[str, Any]:
+        """
+        상태 파일 읽기
+
+        Returns:
+            Dict[str, Any]: 상태 (파일이 없으면 빈 dict)
+        """
+        if not self.state_path.exists():
+            return {}
+        with open(self.state_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_state(self, state: Dict[str, Any]) -> None:
+        """상태 파일 원자적 기록"""
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_name(self.state_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+    @staticmethod
+    def _request_line(custom_id: str, body: Dict[str, Any]) -> str:
+        """작업 파일 한 줄 (키 순서 고정)"""
+        return json.dumps(
+            {"custom_id": custom_id, "method": "POST", "url": BATCH_ENDPOINT, "body": body},
+            ensure_ascii=False, sort_keys=True
+        ) + "\n"
+
+    def write_requests(self, requests: Iterable[Tuple[str, Dict[str, Any]]]) -> Tuple[str, int]:
+        """
+        요청 목록을 작업 파일로 기록
+
+        Args:
+            requests: (custom_id, chat.completions.create 본문) 목록
+
+        Returns:
+            Tuple[str, int]: (작업 파일 내용의 sha256, 요청 수)
+        """
+        self.job_path.parent.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        count = 0
+        tmp_path = self.job_path.with_name(self.job_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for custom_id, body in requests:
+                line = self._request_line(custom_id, body)
+                f.write(line)
+                digest.update(line.encode("utf-8"))
+                count += 1
+        os.replace(tmp_path, self.job_path)
+        return digest.hexdigest(), count
+
+    def submit(self, requests: Iterable[Tuple[str, Dict[str, Any]]]) -> str:
+        """
+        작업 제출 (같은 작업의 배치가 이미 제출되어 있으면 그 배치 ID 반환)
+
+        같은 작업의 배치가 만료·취소되었으면 그 배치에서 완료된 요청의 결과를 상태 파일의
+        carried_outputs로 옮기고 나머지 요청만 새 배치로 제출함 (남은 요청이 없으면 기존 배치 ID 반환)
+
+        Args:
+            requests: (custom_id, chat.completions.create 본문) 목록
+
+        Returns:
+            str: 배치 ID
+
+        Raises:
+            ValueError: 상태 파일의 진행 중인 배치가 다른 작업 내용으로 만들어진 경우
+        """
+        requests = list(requests)
+        job_hash, count = self.write_requests(requests)
+        state = self.load_state()
+        carried: Dict[str, str] = {}
+
+        if state.get("batch_id"):
+            in_progress = state.get("status") not in TERMINAL_STATUSES
+            if state.get("job_hash") != job_hash:
+                if in_progress:
+                    raise ValueError(
+                        f"Batch state {self.state_path} belongs to a different job "
+                        f"(batch {state['batch_id']} is still {state.get('status')}). "
+                        "Cancel it or remove the state file."
+                    )
+            elif in_progress or state.get("status") == "completed":
+                print(f"Resuming batch {state['batch_id']} ({state.get('status')})")
+                return state["batch_id"]
+            elif state.get("status") in ("expired", "cancelled"):
+                carried = self._collect_finished(state)
+                if len(carried) == count:
+                    state["carried_outputs"] = carried
+                    self._save_state(state)
+                    print(f"Batch {state['batch_id']} was {state['status']} after finishing every request")
+                    return state["batch_id"]
+
+        # 이전 배치에서 완료된 요청은 다시 보내지 않음
+        remaining = [(custom_id, body) for custom_id, body in requests if custom_id not in carried]
+        content = "".join(self._request_line(custom_id, body) for custom_id, body in remaining).encode("utf-8")
+        input_file = self._call(
+            lambda: self.client.files.create(file=(self.job_path.name, content), purpose="batch")
+        )
+        batch = self._call(lambda: self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=self.completion_window
+        ))
+
+        self._save_state({
+            "job_path": str(self.job_path),
+            "job_hash": job_hash,
+            "requests": count,
+            "input_file_id": input_file.id,
+            "batch_id": batch.id,
+            "status": batch.status,
+            "carried_outputs": carried,
+        })
+        if carried:
+            print(
+                f"Resubmitted batch {batch.id} ({len(remaining)} of {count} requests; "
+                f"{len(carried)} finished in batch {state['batch_id']})"
+            )
+        else:
+            print(f"Submitted batch {batch.id} ({count} requests)")
+        return batch.id
+
+    def _collect_finished(self, state: Dict[str, Any]) -> Dict[str, str]:
+        """
+        만료·취소된 배치에서 완료된 요청의 결과 수집 (이전에 옮겨 둔 결과 포함)
+
+        Args:
+            state: 상태 파일 내용
+
+        Returns:
+            Dict[str, str]: custom_id → 모델 응답 (실패한 요청은 제외하여 다시 제출되게 함)
+        """
+        carried = dict(state.get("carried_outputs") or {})
+        batch = self._call(lambda: self.client.batches.retrieve(state["batch_id"]))
+        for custom_id, content in self.results(batch).items():
+            if content is not None:
+                carried[custom_id] = content
+        return carried
+
+    def carried_outputs(self) -> Dict[str, str]:
+        """
+        이전 배치에서 옮겨 온 완료 결과
+
+        Returns:
+            Dict[str, str]: custom_id → 모델 응답 (옮겨 온 결과가 없으면 빈 dict)
+        """
+        return dict(self.load_state().get("carried_outputs") or {})
+
+    def wait(self, batch_id: str) -> Any:
+        """
+        배치가 종료 상태가 될 때까지 폴링
+
+        Args:
+            batch_id: 배치 ID
+
+        Returns:
+            종료 상태의 배치 객체
+
+        Raises:
+            BatchJobError: 제한 시간 초과
+        """
+        start = time.monotonic()
+        last_status = None
+        while True:
+            batch = self._call(lambda: self.client.batches.retrieve(batch_id))
+            if batch.status != last_status:
+                state = self.load_state()
+                state["status"] = batch.status
+                self._save_state(state)
+                counts = getattr(batch, "request_counts", None)
+                progress = f" ({counts.completed + counts.failed}/{counts.total})" if counts else ""
+                print(f"Batch {batch_id}: {batch.status}{progress}")
+                last_status = batch.status
+
+            if batch.status in TERMINAL_STATUSES:
+                return batch
+            if self.timeout is not None and time.monotonic() - start > self.timeout:
+                raise BatchJobError(
+                    f"Batch {batch_id} still {batch.status} after {self.timeout}s; rerun to keep polling"
+                )
+            self.sleep(self.poll_interval)
+
+    def _download(self, file_id: Optional[str]) -> str:
+        """결과 파일 내용 (파일이 없으면 빈 문자열)"""
+        if not file_id:
+            return ""
+        return self._call(lambda: self.client.files.content(file_id)).text
+
+    def results(self, batch: Any) -> Dict[str, Optional[str]]:
+        """
+        배치 결과 조회
+
+        만료·취소된 배치는 완료된 요청의 결과만 반환함
+
+        Args:
+            batch: wait() 결과
+
+        Returns:
+            Dict[str, Optional[str]]: custom_id → 모델 응답 (실패한 요청은 None, 결과가 없는 요청은 키 없음)
+
+        Raises:
+            BatchJobError: 배치 자체가 실패한 경우 (입력 검증 오류 등)
+        """
+        if batch.status == "failed":
+            errors = getattr(getattr(batch, "errors", None), "data", None) or []
+            messages = "; ".join(str(getattr(error, "message", error)) for error in errors)
+            raise BatchJobError(f"Batch {batch.id} failed: {messages or 'no details'}")
+
+        outputs: Dict[str, Optional[str]] = {}
+        for file_id in (batch.output_file_id, getattr(batch, "error_file_id", None)):
+            for line in self._download(file_id).splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                response = record.get("response") or {}
+                content = None
+                if not record.get("error") and response.get("status_code") == 200:
+                    content = response["body"]["choices"][0]["message"]["content"].strip()
+                outputs[record["custom_id"]] = content
+        return outputs
+
+    def run(self, requests: Iterable[Tuple[str, Dict[str, Any]]]) -> Dict[str, Optional[str]]:
+        """
+        제출 → 폴링 → 결과 조회 (이전 배치에서 옮겨 온 결과와 합침)
+
+        Args:
+            requests: (custom_id, chat.completions.create 본문) 목록
+
+        Returns:
+            Dict[str, Optional[str]]: custom_id → 모델 응답
+        """
+        outputs = self.results(self.wait(self.submit(requests)))
+        outputs.update(self.carried_outputs())
+        return outputs
@@ -0,0 +1,219 @@
+"""
+LLM 응답 디스크 캐시 모듈
+
+(model, prompt_name, 메시지, temperature) 조합의 해시를 키로 모델 응답을 SQLite에 저장.
+temperature 0.0 재실행이나 후처리만 바꾸는 실험에서 API 호출을 생략하기 위해 사용
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+class CacheMissError(LookupError):
+    """읽기 전용(replay) 모드에서 캐시에 없는 요청을 조회한 경우"""
+    pass
+
+
+class ResponseCache:
+    """
+    콘텐츠 주소 기반 응답 캐시
+
+    - 키: 요청 페이로드(to_messages() 결과 + 모델 파라미터)의 SHA-256
+      (프롬프트 prefix_key가 있으면 시스템 메시지 대신 접두부 키 사용)
+    - 카운터: hits / misses
+    - 크기 제한: max_entries 초과 시 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+    - readonly: 기존 캐시만 재생, 기록/갱신하지 않음 (캐시 미스 시 CacheMissError)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: Optional[int] = 100_000,
+        readonly: bool = False
+    ):
+        """
+        캐시 초기화
+
+        Args:
+            path: SQLite 파일 경로
+            max_entries: 최대 보관 항목 수 (None이면 무제한)
+            readonly: 읽기 전용 재생 모드 여부
+
+        Raises:
+            FileNotFoundError: 읽기 전용 모드에서 캐시 파일이 없는 경우
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.readonly = readonly
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        if readonly:
+            if not self.path.exists():
+                raise FileNotFoundError(f"Cache file not found: {self.path}")
+            self._conn = sqlite3.connect(
+                f"file:{self.path}?mode=ro", uri=True, check_same_thread=False
+            )
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " response TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)"
+            )
+            self._conn.commit()
+
+        self._entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    @staticmethod
+    def make_key(
+        model: str,
+        prompt_name: str,
+        messages: List[Dict[str, Any]],
+        temperature: float,
+        prefix_key: Optional[str] = None
+    ) -> str:
+        """
+        요청 페이로드로부터 캐시 키 생성
+
+        Args:
+            model: 모델 이름
+            prompt_name: 프롬프트 이름
+            messages: to_messages() 결과
+            temperature: 샘플링 온도
+            prefix_key: 시스템 메시지를 포함한 고정 접두부 키 (BasePrompt.prefix_key).
+                지정하면 시스템 메시지 대신 이 키를 해시하므로 긴 시스템 프롬프트를 요청마다 직렬화하지 않음
+
+        Returns:
+            str: SHA-256 16진수 문자열
+        """
+        if prefix_key is not None:
+            messages = [message for message in messages if message["role"] != "system"]
+        payload = json.dumps(
+            {
+                "model": model,
+                "prompt_name": prompt_name,
+                "prefix_key": prefix_key,
+                "messages": messages,
+                "temperature": temperature,
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        캐시 조회
+
+        Args:
+            key: make_key()로 만든 키
+
+        Returns:
+            Optional[str]: 저장된 응답 (없으면 None)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            if not self.readonly:
+                self._conn.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                    (time.time(), key)
+                )
+                self._conn.commit()
+            return row[0]
+
+    def put(self, key: str, response: str) -> None:
+        """
+        응답 저장 (읽기 전용 모드에서는 무시)
+
+        Args:
+            key: make_key()로 만든 키
+            response: 모델 응답 텍스트
+        """
+        if self.readonly:
+            return
+
+        with self._lock:
+            now = time.time()
+            cur = self._conn.execute(
+                "INSERT OR IGNORE INTO responses (key, response, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, response, now, now)
+            )
+            if cur.rowcount == 1:
+                self._entries += 1
+            else:
+                self._conn.execute(
+                    "UPDATE responses SET response = ?, accessed_at = ? WHERE key = ?",
+                    (response, now, key)
+                )
+
+            if self.max_entries is not None and self._entries > self.max_entries:
+                self._evict(self._entries - self.max_entries)
+
+            self._conn.commit()
+
+    def _evict(self, count: int) -> None:
+        """
+        가장 오래 사용하지 않은 항목 삭제 (호출자가 잠금 보유)
+
+        Args:
+            count: 삭제할 항목 수
+        """
+        cur = self._conn.execute(
+            "DELETE FROM responses WHERE key IN ("
+            " SELECT key FROM responses ORDER BY accessed_at ASC LIMIT ?)",
+            (count,)
+        )
+        self._entries -= cur.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 사용 통계
+
+        Returns:
+            Dict: hits, misses, hit_rate(%), entries
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total * 100 if total > 0 else 0.0,
+            "entries": self._entries,
+        }
+
+    def __len__(self) -> int:
+        return self._entries
+
+    def close(self) -> None:
+        """SQLite 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "ResponseCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,298 @@
+"""
+요청/토큰 예산 기반 속도 제한 및 적응형 동시성 제어 모듈
+
+- TokenBucket: 분당 허용량을 일정 속도로 채우는 버킷
+- RateLimiter: 요청 수(RPM)와 토큰 수(TPM) 버킷을 함께 관리
+- AdaptiveConcurrency: AIMD 방식 동시성 창 (성공 시 증가, 429/타임아웃 시 감소)
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+from openai import APIStatusError, APITimeoutError, RateLimitError
+
+
+def is_throttle_error(exc: BaseException) -> bool:
+    """
+    처리량 초과 신호인지 판별 (429 응답 또는 타임아웃)
+
+    Args:
+        exc: API 호출 중 발생한 예외
+
+    Returns:
+        bool: 동시성 창을 줄여야 하는 예외인지 여부
+    """
+    if isinstance(exc, (RateLimitError, APITimeoutError)):
+        return True
+    return isinstance(exc, APIStatusError) and exc.status_code == 429
+
+
+def estimate_tokens(messages: List[Dict[str, Any]]) -> int:
+    """
+    요청 토큰 수 추정 (호출 전 예산 확보용)
+
+    한국어는 대략 글자당 1토큰이므로 메시지 글자 수를 보수적 추정치로 사용.
+    실제 사용량은 응답의 usage로 RateLimiter.record_usage()에서 보정함
+
+    Args:
+        messages: to_messages() 결과
+
+    Returns:
+        int: 추정 토큰 수
+    """
+    return sum(len(str(m.get("content", ""))) for m in messages)
+
+
+class TokenBucket:
+    """
+    토큰 버킷
+
+    분당 rate_per_minute만큼 채워지며 최대 capacity까지 보관.
+    reserve()는 즉시 차감하고 필요한 대기 시간을 반환 (잔량이 음수가 되는 '빚'을 허용하여
+    먼저 예약한 요청이 먼저 통과하도록 보장)
+    """
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        버킷 초기화
+
+        Args:
+            rate_per_minute: 분당 충전량
+            capacity: 최대 보관량 (None이면 rate_per_minute)
+            clock: 시간 함수 (테스트용 주입)
+
+        Raises:
+            ValueError: rate_per_minute가 0 이하인 경우
+        """
+        if rate_per_minute <= 0:
+            raise ValueError(f"rate_per_minute must be > 0 (got {rate_per_minute})")
+
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else float(rate_per_minute)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """경과 시간만큼 충전 (호출자가 잠금 보유)"""
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, amount: float) -> float:
+        """
+        예산 차감 후 대기 시간 반환
+
+        Args:
+            amount: 사용할 양
+
+        Returns:
+            float: 호출 전 대기해야 하는 시간(초)
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= amount
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def refund(self, amount: float) -> None:
+        """
+        예약량 보정 (추정치와 실제 사용량의 차이 반영, 음수면 추가 차감)
+
+        Args:
+            amount: 되돌려 줄 양
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens + amount)
+
+    @property
+    def available(self) -> float:
+        """현재 잔량"""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
+class RateLimiter:
+    """
+    요청 수·토큰 수 이중 예산 속도 제한기
+
+    여러 SentenceGenerator(예: train/test 동시 실행)가 하나의 인스턴스를 공유하여
+    계정 단위 할당량을 함께 지키도록 사용
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        속도 제한기 초기화
+
+        Args:
+            requests_per_minute: 분당 요청 수 한도 (None이면 제한 없음)
+            tokens_per_minute: 분당 토큰 수 한도 (None이면 제한 없음)
+            clock: 시간 함수 (테스트용 주입)
+        """
+        self.request_bucket = (
+            TokenBucket(requests_per_minute, clock=clock) if requests_per_minute else None
+        )
+        self.token_bucket = (
+            TokenBucket(tokens_per_minute, clock=clock) if tokens_per_minute else None
+        )
+
+    def reserve(self, tokens: int) -> float:
+        """
+        요청 1건과 토큰 예산 예약
+
+        Args:
+            tokens: 추정 토큰 수
+
+        Returns:
+            float: 호출 전 대기해야 하는 시간(초)
+        """
+        wait = 0.0
+        if self.request_bucket is not None:
+            wait = max(wait, self.request_bucket.reserve(1))
+        if self.token_bucket is not None:
+            wait = max(wait, self.token_bucket.reserve(tokens))
+        return wait
+
+    def acquire(self, tokens: int) -> None:
+        """
+        예산 확보 (필요 시 블로킹 대기)
+
+        Args:
+            tokens: 추정 토큰 수
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, tokens: int) -> None:
+        """
+        예산 확보 (비동기 대기)
+
+        Args:
+            tokens: 추정 토큰 수
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def record_usage(self, estimated: int, actual: Optional[int]) -> None:
+        """
+        실제 토큰 사용량으로 예약량 보정
+
+        Args:
+            estimated: 예약 시 사용한 추정 토큰 수
+            actual: 응답 usage.total_tokens (없으면 None → 보정하지 않음)
+        """
+        if self.token_bucket is None or actual is None:
+            return
+        self.token_bucket.refund(estimated - actual)
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD 동시성 창
+
+    - 성공: limit += increase / limit (창 하나가 모두 성공하면 약 +increase)
+    - 429/타임아웃: limit *= decrease (cooldown 내 연속 신호는 한 번만 반영)
+    """
+
+    def __init__(
+        self,
+        maximum: int,
+        initial: Optional[int] = None,
+        minimum: int = 1,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        cooldown: float = 1.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        동시성 창 초기화
+
+        Args:
+            maximum: 최대 동시 요청 수
+            initial: 초기 창 크기 (None이면 maximum의 절반)
+            minimum: 최소 동시 요청 수
+            increase: 창당 가산 증가량
+            decrease: 감소 배율 (0~1)
+            cooldown: 감소 후 추가 감소를 무시하는 시간(초)
+            clock: 시간 함수 (테스트용 주입)
+
+        Raises:
+            ValueError: 범위가 올바르지 않은 경우
+        """
+        if not 1 <= minimum <= maximum:
+            raise ValueError(f"Require 1 <= minimum <= maximum (got {minimum}, {maximum})")
+        if not 0 < decrease < 1:
+            raise ValueError(f"decrease must be in (0, 1) (got {decrease})")
+
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self._clock = clock
+        self.limit = float(initial if initial is not None else max(minimum, maximum // 2))
+        self.in_flight = 0
+        self.throttle_events = 0
+        self._last_decrease = float("-inf")
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def window(self) -> int:
+        """현재 허용 동시 요청 수"""
+        return max(self.minimum, min(self.maximum, int(self.limit)))
+
+    def on_success(self) -> None:
+        """성공 응답 반영 (가산 증가)"""
+        # 대기 중인 작업은 slot() 반환 시 notify_all로 깨어나 커진 창을 확인함
+        self.limit = min(float(self.maximum), self.limit + self.increase / max(self.limit, 1.0))
+
+    def on_throttle(self) -> None:
+        """429/타임아웃 반영 (승산 감소)"""
+        self.throttle_events += 1
+        now = self._clock()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self.limit = max(float(self.minimum), self.limit * self.decrease)
+
+    def _get_condition(self) -> asyncio.Condition:
+        """현재 이벤트 루프용 Condition (asyncio.run마다 루프가 바뀌므로 재생성)"""
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+        return self._condition
+
+    @asynccontextmanager
+    async def slot(self):
+        """동시성 창 안에서 실행 (창이 가득 차면 대기)"""
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self.in_flight < self.window)
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            async with condition:
+                self.in_flight -= 1
+                condition.notify_all()
@@ -0,0 +1,249 @@
+"""
+API 호출 재시도 정책 모듈
+
+prompt_templates.json의 api_call_strategy.calls_per_case(케이스당 최대 호출 수)를
+호출 예산으로 사용하며, 오류를 재시도 가능/치명적으로 분류하여
+지수 백오프 + 지터로 재시도함
+"""
+
+import asyncio
+import json
+import random
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+from openai import (
+    APIConnectionError,
+    APIStatusError,
+    APITimeoutError,
+    InternalServerError,
+    RateLimitError,
+)
+
+
+# 저장소 루트의 프롬프트 설정 파일 (src/api/retry.py 기준 세 단계 위)
+DEFAULT_CONFIG_PATH = Path(__file__).resolve().parents[3] / "prompt_templates.json"
+
+# 재시도 가능한 HTTP 상태 코드 (타임아웃, 충돌, 처리량 초과, 서버 오류)
+RETRYABLE_STATUS_CODES = {408, 409, 429}
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """
+    재시도 가능한 오류인지 분류
+
+    재시도: 연결 실패, 타임아웃, 429, 408/409, 5xx
+    치명적: 인증/권한/잘못된 요청 등 나머지 4xx, 응답 파싱 오류, 캐시 미스 등
+
+    Args:
+        exc: API 호출 중 발생한 예외
+
+    Returns:
+        bool: 재시도 가능 여부
+    """
+    if isinstance(exc, (APIConnectionError, APITimeoutError, RateLimitError, InternalServerError)):
+        return True
+    if isinstance(exc, APIStatusError):
+        return exc.status_code in RETRYABLE_STATUS_CODES or exc.status_code >= 500
+    return False
+
+
+def _retry_after(exc: BaseException) -> Optional[float]:
+    """
+    서버가 지정한 재시도 대기 시간(초) 추출 (retry-after-ms / retry-after 헤더)
+
+    Args:
+        exc: API 호출 중 발생한 예외
+
+    Returns:
+        Optional[float]: 대기 시간 (헤더가 없거나 해석 불가하면 None)
+    """
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    try:
+        if headers.get("retry-after-ms") is not None:
+            return float(headers["retry-after-ms"]) / 1000.0
+        if headers.get("retry-after") is not None:
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        return None
+    return None
+
+
+class RetryError(Exception):
+    """
+    재시도 후 최종 실패
+
+    Attributes:
+        attempts: 실제 수행한 호출 횟수
+        last_exception: 마지막 시도의 예외
+    """
+
+    def __init__(self, last_exception: BaseException, attempts: int):
+        super().__init__(f"{last_exception} (after {attempts} attempt(s))")
+        self.last_exception = last_exception
+        self.attempts = attempts
+
+
+class RetryPolicy:
+    """
+    지수 백오프 + 전체 지터(full jitter) 재시도 정책
+
+    - max_attempts: 케이스당 최대 호출 수 (첫 시도 포함)
+    - request_timeout: 시도별 요청 타임아웃(초)
+    - deadline: 행 하나에 쓸 수 있는 전체 시간(초), 다음 대기가 이를 넘기면 중단
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        request_timeout: Optional[float] = 60.0,
+        deadline: Optional[float] = 180.0,
+        rng: Optional[random.Random] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        재시도 정책 초기화
+
+        Args:
+            max_attempts: 최대 호출 횟수 (1이면 재시도 없음)
+            base_delay: 첫 재시도 전 최대 대기 시간(초)
+            max_delay: 대기 시간 상한(초)
+            request_timeout: 시도별 요청 타임아웃(초, None이면 SDK 기본값)
+            deadline: 행당 전체 시간 예산(초, None이면 무제한)
+            rng: 지터용 난수 생성기 (테스트용 주입)
+            clock: 시간 함수 (테스트용 주입)
+
+        Raises:
+            ValueError: max_attempts가 1 미만인 경우
+        """
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts must be >= 1 (got {max_attempts})")
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.request_timeout = request_timeout
+        self.deadline = deadline
+        self._rng = rng or random.Random()
+        self._clock = clock
+
+    @classmethod
+    def from_config(cls, config_path: Optional[str] = None, **kwargs: Any) -> "RetryPolicy":
+        """
+        prompt_templates.json의 calls_per_case로 정책 생성
+
+        Args:
+            config_path: 설정 파일 경로 (None이면 저장소 루트의 prompt_templates.json)
+            **kwargs: 나머지 RetryPolicy 인자
+
+        Returns:
+            RetryPolicy: 설정 파일이 없으면 기본값(3회) 정책
+        """
+        path = Path(config_path) if config_path else DEFAULT_CONFIG_PATH
+        max_attempts = 3
+
+        if path.exists():
+            with open(path, "r", encoding="utf-8") as f:
+                config = json.load(f)
+            max_attempts = int(
+                config.get("api_call_strategy", {}).get("calls_per_case", max_attempts)
+            )
+
+        return cls(max_attempts=max_attempts, **kwargs)
+
+    def backoff(self, attempt: int, exc: Optional[BaseException] = None) -> float:
+        """
+        attempt번째 시도 실패 후 대기 시간
+
+        서버가 retry-after를 지정하면 이를 따르고, 아니면 [0, base * 2^(attempt-1)] 균등 분포
+
+        Args:
+            attempt: 실패한 시도 번호 (1부터)
+            exc: 실패 예외
+
+        Returns:
+            float: 대기 시간(초)
+        """
+        retry_after = _retry_after(exc) if exc is not None else None
+        if retry_after is not None:
+            return min(self.max_delay, max(0.0, retry_after))
+
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return self._rng.uniform(0, ceiling)
+
+    def _next_delay(self, attempt: int, exc: BaseException, started: float) -> Optional[float]:
+        """
+        재시도 여부 판단 후 대기 시간 반환 (재시도하지 않으면 None)
+
+        Args:
+            attempt: 실패한 시도 번호
+            exc: 실패 예외
+            started: 첫 시도 시작 시각
+
+        Returns:
+            Optional[float]: 대기 시간 또는 None
+        """
+        if attempt >= self.max_attempts or not is_retryable(exc):
+            return None
+
+        delay = self.backoff(attempt, exc)
+        if self.deadline is not None and self._clock() - started + delay > self.deadline:
+            return None
+        return delay
+
+    def call(self, fn: Callable[[], Any]) -> Tuple[Any, int]:
+        """
+        동기 함수 재시도 실행
+
+        Args:
+            fn: 인자 없는 호출 함수
+
+        Returns:
+            Tuple[Any, int]: (결과, 호출 횟수)
+
+        Raises:
+            RetryError: 치명적 오류 또는 재시도 예산 소진
+        """
+        started = self._clock()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return fn(), attempt
+            except Exception as e:
+                delay = self._next_delay(attempt, e, started)
+                if delay is None:
+                    raise RetryError(e, attempt) from e
+                time.sleep(delay)
+
+    async def acall(self, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, int]:
+        """
+        비동기 함수 재시도 실행
+
+        Args:
+            fn: 인자 없는 코루틴 함수
+
+        Returns:
+            Tuple[Any, int]: (결과, 호출 횟수)
+
+        Raises:
+            RetryError: 치명적 오류 또는 재시도 예산 소진
+        """
+        started = self._clock()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await fn(), attempt
+            except Exception as e:
+                delay = self._next_delay(attempt, e, started)
+                if delay is None:
+                    raise RetryError(e, attempt) from e
+                await asyncio.sleep(delay)
@@ -0,0 +1,144 @@
+"""
+생성 체크포인트(저널) 모듈
+완료된 행을 입력 행 인덱스와 함께 JSONL로 즉시 기록하여 중단된 실행을 이어서 수행
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+def default_journal_path(output_path: str) -> str:
+    """
+    출력 CSV에 대응하는 기본 저널 경로
+
+    Args:
+        output_path: 출력 CSV 경로
+
+    Returns:
+        str: '<output_path>.journal.jsonl'
+    """
+    return f"{output_path}.journal.jsonl"
+
+
+class GenerationJournal:
+    """
+    행 단위 생성 저널 (append-only JSONL)
+
+    각 줄: {"index": 입력 행 인덱스, "err_sentence": 원문, "cor_sentence": 교정문, "attempts": 호출 횟수,
+            "raw_sentence": 후처리 전 모델 출력 (기록한 경우)}
+    프로세스가 강제 종료되어도 마지막 불완전한 줄만 버리고 나머지는 복구됨
+    """
+
+    def __init__(self, path: str, fsync: bool = False):
+        """
+        저널 초기화
+
+        Args:
+            path: 저널 파일 경로
+            fsync: 행마다 디스크 동기화 여부 (전원 장애 대비, 기본값: False = flush만)
+        """
+        self.path = Path(path)
+        self.fsync = fsync
+        self._file = None
+        self._lock = threading.Lock()
+
+    def load(
+        self,
+        err_sentences: Optional[List[str]] = None,
+        min_index: int = 0
+    ) -> Dict[int, dict]:
+        """
+        완료된 행 읽기
+
+        Args:
+            err_sentences: 현재 입력 문장 (주어지면 저널과 내용이 같은지 검증)
+            min_index: 이 인덱스 미만의 행은 건너뜀 (스트리밍 재개 시 메모리 절약)
+
+        Returns:
+            Dict[int, dict]: 입력 행 인덱스 → 저널 레코드
+
+        Raises:
+            ValueError: 저널이 다른 입력 파일에서 만들어진 경우
+        """
+        done: Dict[int, dict] = {}
+        if not self.path.exists():
+            return done
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # 기록 도중 중단된 마지막 줄
+                    continue
+
+                index = record["index"]
+                if index < min_index:
+                    continue
+                if err_sentences is not None:
+                    if index >= len(err_sentences) or err_sentences[index] != record["err_sentence"]:
+                        raise ValueError(
+                            f"Journal {self.path} does not match input at row {index}. "
+                            "Remove it or run without --resume."
+                        )
+                done[index] = record
+
+        return done
+
+    def reset(self) -> None:
+        """저널 비우기 (새 실행 시작)"""
+        self.close()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text("", encoding="utf-8")
+
+    def append(
+        self,
+        index: int,
+        err_sentence: str,
+        cor_sentence: str,
+        attempts: int = 0,
+        raw_sentence: Optional[str] = None
+    ) -> None:
+        """
+        완료된 행 기록
+
+        Args:
+            index: 입력 행 인덱스
+            err_sentence: 원문
+            cor_sentence: 교정문
+            attempts: API 호출 횟수
+            raw_sentence: 후처리 전 모델 출력 (None이면 기록하지 않음)
+        """
+        record = {
+            "index": index,
+            "err_sentence": err_sentence,
+            "cor_sentence": cor_sentence,
+            "attempts": attempts,
+        }
+        if raw_sentence is not None:
+            record["raw_sentence"] = raw_sentence
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(line + "\n")
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """파일 닫기"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> "GenerationJournal":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
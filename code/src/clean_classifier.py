@@ -0,0 +1,260 @@
+"""
+교정 불필요 문장 사전 분류기 모듈
+
+API 호출 전에 이미 올바른 문장을 값싸게 판별하여 모델을 거치지 않고 원문 그대로 출력하기 위한 분류기.
+
+- 규칙 신호: MinimalRulePostprocessor 규칙 팩과 EnhancedPostprocessor 문법 규칙 팩 패턴 중 하나라도 걸리면 교정 필요
+- n-gram 신호: Train CSV에서 교정으로 사라진 문자 n-gram(오류 n-gram)과 정답 문장의 n-gram 빈도를 세어,
+  문장의 n-gram 중 오류 위험도가 가장 높은 값으로 신뢰도를 계산 (신뢰도 = 1 - 최대 위험도).
+  Train에 없거나 정답 문장에 min_clean_count번 미만 나온 n-gram은 근거가 없으므로 unseen_risk(기본 1.0)를 적용해
+  처음 보는 오타가 섞인 문장은 건너뛰지 않음
+
+신뢰도가 threshold 이상인 문장만 교정 불필요로 분류함. Recall 영향은 skip_impact_report()로 확인
+"""
+
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import pandas as pd
+
+from src.evaluator import Evaluator
+from src.postprocessors.enhanced_postprocessor import DEFAULT_GRAMMAR_RULE_PACK
+from src.postprocessors.minimal_rule import DEFAULT_RULE_PACK
+from src.postprocessors.rule_pack import RulePack
+
+
+def default_rule_patterns() -> List[re.Pattern]:
+    """
+    후처리기 규칙에서 만든 오류 패턴 목록
+
+    Returns:
+        List[re.Pattern]: MinimalRulePostprocessor 기본 규칙 팩 + EnhancedPostprocessor 기본 문법 규칙 팩 패턴
+    """
+    rules = RulePack.load(str(DEFAULT_RULE_PACK)).rules + RulePack.load(str(DEFAULT_GRAMMAR_RULE_PACK)).rules
+    return [re.compile(rule["pattern"], rule.get("flags", 0)) for rule in rules]
+
+
+class CleanSentenceClassifier:
+    """
+    교정 불필요 문장 분류기
+
+    fit()으로 Train 데이터의 문자 n-gram 통계를 학습한 뒤 confidence()/is_clean()으로 판별.
+    학습 전에는 모든 n-gram이 근거 없음으로 취급되어 신뢰도가 1 - unseen_risk 이하로 제한됨
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.9,
+        ngram_sizes: Sequence[int] = (2, 3),
+        unseen_risk: float = 1.0,
+        min_clean_count: int = 2,
+        smoothing: float = 1.0,
+        rule_patterns: Optional[Iterable[re.Pattern]] = None
+    ):
+        """
+        분류기 초기화
+
+        Args:
+            threshold: 교정 불필요로 분류할 최소 신뢰도 (0~1, 높을수록 보수적)
+            ngram_sizes: 사용할 문자 n-gram 길이 (공백 포함)
+            unseen_risk: 근거가 없는 n-gram의 위험도 (1 - threshold보다 크면 그런 n-gram이 있는 문장은 건너뛰지 않음)
+            min_clean_count: 오류로 사라진 적 없는 n-gram을 근거 있음으로 볼 최소 정답 문장 등장 횟수
+            smoothing: 위험도 계산 시 분모에 더하는 값 (드물게 본 n-gram의 위험도 완화)
+            rule_patterns: 걸리면 교정 필요로 보는 패턴 (None이면 default_rule_patterns())
+
+        Raises:
+            ValueError: threshold나 unseen_risk가 0~1 범위가 아니거나, min_clean_count가 1 미만이거나,
+                ngram_sizes가 비어 있는 경우
+        """
+        if not 0.0 <= threshold <= 1.0:
+            raise ValueError(f"threshold must be in [0, 1] (got {threshold})")
+        if not 0.0 <= unseen_risk <= 1.0:
+            raise ValueError(f"unseen_risk must be in [0, 1] (got {unseen_risk})")
+        if min_clean_count < 1:
+            raise ValueError(f"min_clean_count must be >= 1 (got {min_clean_count})")
+        if not ngram_sizes or min(ngram_sizes) < 1:
+            raise ValueError(f"ngram_sizes must be positive (got {list(ngram_sizes)})")
+
+        self.threshold = threshold
+        self.ngram_sizes = tuple(ngram_sizes)
+        self.unseen_risk = unseen_risk
+        self.min_clean_count = min_clean_count
+        self.smoothing = smoothing
+        self.rule_patterns = list(default_rule_patterns() if rule_patterns is None else rule_patterns)
+
+        # n-gram → 교정으로 사라진 횟수 / 정답 문장에 나온 횟수 (문장 단위)
+        self.error_counts: Counter = Counter()
+        self.clean_counts: Counter = Counter()
+
+    @property
+    def is_fitted(self) -> bool:
+        """Train 데이터로 학습했는지 (n-gram 통계가 있는지)"""
+        return bool(self.clean_counts or self.error_counts)
+
+    def _ngrams(self, text: str) -> set:
+        """문장의 서로 다른 문자 n-gram 집합"""
+        grams = set()
+        for n in self.ngram_sizes:
+            grams.update(text[i:i + n] for i in range(len(text) - n + 1))
+        return grams
+
+    def fit(self, err_sentences: Iterable[str], cor_sentences: Iterable[str]) -> "CleanSentenceClassifier":
+        """
+        원문/정답 쌍으로 n-gram 통계 학습 (기존 통계에 누적)
+
+        Args:
+            err_sentences: 원문 리스트
+            cor_sentences: 정답 리스트
+
+        Returns:
+            CleanSentenceClassifier: self
+        """
+        for err, cor in zip(err_sentences, cor_sentences):
+            cor_grams = self._ngrams(str(cor))
+            self.clean_counts.update(cor_grams)
+            if err != cor:
+                self.error_counts.update(self._ngrams(str(err)) - cor_grams)
+        return self
+
+    @classmethod
+    def from_csv(cls, path: str, **kwargs) -> "CleanSentenceClassifier":
+        """
+        Train CSV로 학습한 분류기 생성
+
+        Args:
+            path: err_sentence, cor_sentence 컬럼을 가진 CSV 경로
+            **kwargs: 생성자 인자
+
+        Returns:
+            CleanSentenceClassifier: 학습된 분류기
+
+        Raises:
+            ValueError: 필요한 컬럼이 없거나 학습할 행이 없는 경우
+        """
+        df = pd.read_csv(path)
+        if not {"err_sentence", "cor_sentence"}.issubset(df.columns):
+            raise ValueError(f"{path} must contain 'err_sentence' and 'cor_sentence' columns")
+        classifier = cls(**kwargs).fit(df["err_sentence"].astype(str), df["cor_sentence"].astype(str))
+        if not classifier.is_fitted:
+            raise ValueError(f"{path} has no rows to fit the clean-sentence classifier")
+        return classifier
+
+    def risk(self, gram: str) -> float:
+        """
+        n-gram 하나의 오류 위험도
+
+        Args:
+            gram: 문자 n-gram
+
+        Returns:
+            float: 교정으로 사라진 비율
+                (오류로 사라진 적 없고 정답 문장 등장이 min_clean_count번 미만이면 unseen_risk)
+        """
+        errors = self.error_counts.get(gram, 0)
+        cleans = self.clean_counts.get(gram, 0)
+        if errors == 0 and cleans < self.min_clean_count:
+            return self.unseen_risk
+        return errors / (errors + cleans + self.smoothing)
+
+    def confidence(self, text: str) -> float:
+        """
+        교정이 필요 없을 신뢰도
+
+        Args:
+            text: 원문 텍스트
+
+        Returns:
+            float: 0~1 (규칙 패턴에 걸리거나 빈 문장이면 0)
+        """
+        if not text.strip():
+            return 0.0
+        if any(pattern.search(text) for pattern in self.rule_patterns):
+            return 0.0
+        grams = self._ngrams(text)
+        if not grams:
+            return 1.0 - self.unseen_risk
+        return 1.0 - max(self.risk(gram) for gram in grams)
+
+    def is_clean(self, text: str) -> bool:
+        """
+        교정 불필요 문장인지 (신뢰도 >= threshold)
+
+        Args:
+            text: 원문 텍스트
+
+        Returns:
+            bool: 모델을 거치지 않아도 되면 True
+        """
+        return self.confidence(text) >= self.threshold
+
+
+def skip_impact_report(
+    classifier: CleanSentenceClassifier,
+    true_df: pd.DataFrame,
+    pred_df: Optional[pd.DataFrame] = None,
+    thresholds: Optional[Sequence[float]] = None,
+    evaluator: Optional[Evaluator] = None
+) -> pd.DataFrame:
+    """
+    사전 분류기로 건너뛴 행을 원문으로 둘 때의 Recall/Precision 영향 보고서
+
+    pred_df(분류기 없이 모든 행을 모델로 교정한 결과)에서 분류기가 교정 불필요로 본 행만 원문으로 바꿔
+    Evaluator로 다시 평가함. pred_df가 없으면 정답을 예측으로 사용하여 건너뛰기로 잃을 수 있는 최대 Recall을 보여줌
+
+    Args:
+        classifier: 학습된 분류기 (평가 데이터와 다른 데이터로 학습해야 영향이 과소평가되지 않음)
+        true_df: 정답 데이터 (err_sentence, cor_sentence)
+        pred_df: 전체 교정 결과 (cor_sentence, None이면 정답 사용)
+        thresholds: 비교할 threshold 목록 (None이면 분류기의 threshold 하나)
+        evaluator: 평가기 (None이면 기본 Evaluator)
+
+    Returns:
+        pd.DataFrame: threshold별 skipped, skip_rate, skipped_needing_correction,
+            recall, precision, recall_delta, precision_delta (기준선은 threshold=None 행)
+
+    Raises:
+        ValueError: 데이터 길이가 맞지 않거나 필요한 컬럼이 없는 경우
+    """
+    evaluator = evaluator or Evaluator()
+    if pred_df is None:
+        pred_df = true_df
+    if len(pred_df) != len(true_df):
+        raise ValueError(f"Length mismatch: truth={len(true_df)} vs pred={len(pred_df)}")
+
+    err_sentences = true_df["err_sentence"].astype(str).tolist()
+    cor_sentences = true_df["cor_sentence"].astype(str).tolist()
+    predictions = pred_df["cor_sentence"].astype(str).tolist()
+    confidences = [classifier.confidence(text) for text in err_sentences]
+
+    baseline = evaluator.evaluate(true_df, pd.DataFrame({"cor_sentence": predictions}))
+    rows: List[Dict] = [{
+        "threshold": None,
+        "skipped": 0,
+        "skip_rate": 0.0,
+        "skipped_needing_correction": 0,
+        "recall": baseline["recall"],
+        "precision": baseline["precision"],
+        "recall_delta": 0.0,
+        "precision_delta": 0.0,
+    }]
+
+    for threshold in (thresholds if thresholds is not None else [classifier.threshold]):
+        skipped = [confidence >= threshold for confidence in confidences]
+        routed = [err if skip else pred for err, pred, skip in zip(err_sentences, predictions, skipped)]
+        result = evaluator.evaluate(true_df, pd.DataFrame({"cor_sentence": routed}))
+        count = sum(skipped)
+        rows.append({
+            "threshold": threshold,
+            "skipped": count,
+            "skip_rate": count / len(err_sentences) * 100 if err_sentences else 0.0,
+            "skipped_needing_correction": sum(
+                1 for err, cor, skip in zip(err_sentences, cor_sentences, skipped) if skip and err != cor
+            ),
+            "recall": result["recall"],
+            "precision": result["precision"],
+            "recall_delta": result["recall"] - baseline["recall"],
+            "precision_delta": result["precision"] - baseline["precision"],
+        })
+
+    return pd.DataFrame(rows)
@@ -4,9 +4,11 @@
 """
 
 import pandas as pd
-from typing import Dict
+from typing import Dict, Optional
 
 from src.metrics.evaluator import evaluate_correction
+from src.metrics.golden_index import GoldenDiffIndex
+from src.metrics.incremental import IncrementalEvaluator
 
 
 class Evaluator:
@@ -15,12 +17,70 @@ class Evaluator:
     정답과 예측을 비교하여 Recall, Precision 계산
     """
 
-    def __init__(self):
-        """평가기 초기화"""
-        pass
+    def __init__(self, golden_cache_dir: Optional[str] = None, incremental: bool = False):
+        """
+        평가기 초기화
 
-    def evaluate(self, true_df: pd.DataFrame, pred_df: pd.DataFrame) -> Dict:
-        """교정 결과 평가 수행"""
+        Args:
+            golden_cache_dir: 원문→정답 차이점 인덱스 저장 디렉토리
+                (지정하면 같은 정답 데이터로 반복 평가할 때 정답 쪽 차이점을 다시 계산하지 않음)
+            incremental: 같은 정답 데이터로 반복 평가할 때 직전 예측과 달라진 행만 다시 채점
+                (IncrementalEvaluator 사용, 달라진 행은 workers개 프로세스로 나눠 채점)
+        """
+        self.golden_cache_dir = golden_cache_dir
+        self.incremental = incremental
+        self._incremental_evaluator: Optional[IncrementalEvaluator] = None
+
+    def _golden_index(self, true_df: pd.DataFrame) -> Optional[GoldenDiffIndex]:
+        """원문→정답 차이점 인덱스 (golden_cache_dir이 없으면 None)"""
+        if self.golden_cache_dir is None:
+            return None
+        return GoldenDiffIndex.from_dataframe(true_df, self.golden_cache_dir)
+
+    def _evaluate_incremental(self, true_df: pd.DataFrame, pred_df: pd.DataFrame, workers: int) -> Dict:
+        """
+        증분 평가 (정답 데이터가 바뀌면 증분 평가기를 새로 만듦)
+
+        Args:
+            true_df: 정답 데이터 (err_sentence, cor_sentence)
+            pred_df: 예측 데이터 (cor_sentence)
+            workers: 달라진 행을 채점할 프로세스 수
+
+        Returns:
+            Dict: recall, precision, TP/FP/FM/FR, changed_rows, analysis_df
+        """
+        evaluator = self._incremental_evaluator
+        if (
+            evaluator is None
+            or evaluator.originals != true_df["err_sentence"].tolist()
+            or evaluator.goldens != true_df["cor_sentence"].tolist()
+        ):
+            evaluator = IncrementalEvaluator(true_df, golden_index=self._golden_index(true_df))
+            self._incremental_evaluator = evaluator
+
+        results = evaluator.update(pred_df, workers=workers)
+        print("=== 평가 결과 ===")
+        print(f"Recall: {results['recall']:.2f}%")
+        print(f"Precision: {results['precision']:.2f}%")
+        print(f"Rescored rows: {results['changed_rows']}/{len(evaluator)}\n")
+        results["analysis_df"] = evaluator.analysis_df()
+        return results
+
+    def evaluate(self, true_df: pd.DataFrame, pred_df: pd.DataFrame, workers: int = 1) -> Dict:
+        """
+        교정 결과 평가 수행
+
+        Args:
+            true_df: 정답 데이터 (err_sentence, cor_sentence)
+            pred_df: 예측 데이터 (cor_sentence, err_sentence는 선택)
+            workers: 점수 계산 프로세스 수 (기본값: 1 = 순차)
+
+        Returns:
+            Dict: recall, precision, TP/FP/FM/FR, analysis_df (incremental이면 changed_rows 포함)
+
+        Raises:
+            ValueError: 컬럼/길이/순서가 맞지 않는 경우
+        """
         
         # 필수 컬럼 검증
         if not {"err_sentence", "cor_sentence"}.issubset(true_df.columns):
@@ -50,7 +110,12 @@ class Evaluator:
         pred_df_normalized = pd.DataFrame({"cor_sentence": pred_df["cor_sentence"].astype(str)})
 
         # 평가 수행
-        results = evaluate_correction(true_df, pred_df_normalized)
+        if self.incremental:
+            results = self._evaluate_incremental(true_df, pred_df_normalized, workers)
+        else:
+            results = evaluate_correction(
+                true_df, pred_df_normalized, workers=workers, golden_index=self._golden_index(true_df)
+            )
 
         # 추가 컬럼이 있으면 분석 결과에 포함
         if "original_target_part" in true_df.columns and "golden_target_part" in true_df.columns:
@@ -0,0 +1,150 @@
+"""
+실험 실행기 모듈
+
+Train 교정 → Train 평가 → Test 제출 파일 생성을 한 프로세스에서 수행.
+SentenceGenerator, Evaluator와 읽어 들인 데이터프레임을 단계 사이에 공유하여
+단계마다 인터프리터 기동·import·CSV 재로딩 비용을 내지 않고, 단계별 소요 시간을 기록함
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+import pandas as pd
+
+from src.evaluator import Evaluator
+from src.generator import OUTPUT_COLUMNS, SentenceGenerator
+from src.raw_store import default_raw_path, raw_frame
+
+
+class ExperimentRunner:
+    """
+    프로세스 내 실험 실행기
+
+    단계: load → generate_train → evaluate → generate_test
+    각 단계의 경과 시간(초)은 timings에 기록됨
+    """
+
+    def __init__(
+        self,
+        generator: SentenceGenerator,
+        evaluator: Evaluator,
+        train_path: str,
+        test_path: str,
+        output_dir: str = "outputs",
+        eval_workers: int = 1,
+        store_raw: bool = True
+    ):
+        """
+        실행기 초기화
+
+        Args:
+            generator: 모든 생성 단계에서 공유할 생성기
+            evaluator: 평가기 (incremental=True면 run()을 반복할 때 직전 실행과 달라진 행만 다시 채점)
+            train_path: Train CSV 경로 (err_sentence, cor_sentence)
+            test_path: Test CSV 경로 (err_sentence, 선택적으로 id)
+            output_dir: 결과 저장 디렉토리
+            eval_workers: 평가 프로세스 수
+            store_raw: 후처리 전 모델 출력 저장 여부 (<output>.raw.csv)
+        """
+        self.generator = generator
+        self.evaluator = evaluator
+        self.train_path = train_path
+        self.test_path = test_path
+        self.output_dir = output_dir
+        self.eval_workers = eval_workers
+        self.store_raw = store_raw
+        self.timings: Dict[str, float] = {}
+
+    @contextmanager
+    def _stage(self, name: str) -> Iterator[None]:
+        """단계 경과 시간 측정"""
+        print(f"\n{'='*60}")
+        print(f"[{name}]")
+        print(f"{'='*60}")
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = time.perf_counter() - start
+            print(f"{name} completed in {self.timings[name]:.2f}s")
+
+    def _generate(self, df: pd.DataFrame, output_path: str) -> pd.DataFrame:
+        """
+        데이터프레임 교정 후 저장 (원본 출력 포함)
+
+        Args:
+            df: err_sentence 컬럼을 가진 입력
+            output_path: 출력 CSV 경로
+
+        Returns:
+            pd.DataFrame: err_sentence, cor_sentence
+        """
+        err_sentences = df["err_sentence"].astype(str).tolist()
+        result_df = self.generator.generate_batch(err_sentences)
+        if self.store_raw:
+            raw_frame(err_sentences, self.generator.last_raw).to_csv(default_raw_path(output_path), index=False)
+        print(f"API calls: {sum(self.generator.last_attempts)} for {len(err_sentences)} rows")
+        return result_df
+
+    def run(self, prompt_name: Optional[str] = None) -> Dict:
+        """
+        전체 실험 실행
+
+        Args:
+            prompt_name: 출력 파일 이름에 쓸 프롬프트 이름 (None이면 생성기의 prompt_name)
+
+        Returns:
+            Dict: evaluation (evaluate 결과), train_output, analysis_output, test_output, timings
+
+        Raises:
+            ValueError: 입력 CSV에 필요한 컬럼이 없는 경우
+        """
+        prompt_name = prompt_name or self.generator.prompt_name
+        os.makedirs(self.output_dir, exist_ok=True)
+        train_output = os.path.join(self.output_dir, f"{prompt_name}_train.csv")
+        test_output = os.path.join(self.output_dir, f"{prompt_name}_test.csv")
+        analysis_output = os.path.join(self.output_dir, f"{prompt_name}_analysis.csv")
+        self.timings = {}
+
+        with self._stage("load"):
+            train_df = pd.read_csv(self.train_path)
+            test_df = pd.read_csv(self.test_path)
+            for path, df in ((self.train_path, train_df), (self.test_path, test_df)):
+                if "err_sentence" not in df.columns:
+                    raise ValueError(f"{path} must contain 'err_sentence' column")
+            print(f"Train: {len(train_df)} rows, Test: {len(test_df)} rows")
+
+        with self._stage("generate_train"):
+            train_pred_df = self._generate(train_df, train_output)
+            train_pred_df.to_csv(train_output, index=False)
+
+        with self._stage("evaluate"):
+            evaluation = self.evaluator.evaluate(train_df, train_pred_df, workers=self.eval_workers)
+            evaluation["analysis_df"].to_csv(analysis_output, index=False)
+
+        with self._stage("generate_test"):
+            test_pred_df = self._generate(test_df, test_output)
+            # 제출 형식: test.csv의 id 컬럼 유지
+            if "id" in test_df.columns:
+                test_pred_df.insert(0, "id", test_df["id"].values)
+                test_pred_df = test_pred_df[["id"] + OUTPUT_COLUMNS]
+            test_pred_df.to_csv(test_output, index=False)
+
+        return {
+            "evaluation": evaluation,
+            "train_output": train_output,
+            "analysis_output": analysis_output,
+            "test_output": test_output,
+            "timings": dict(self.timings),
+        }
+
+    def print_timings(self) -> None:
+        """단계별 소요 시간 출력"""
+        total = sum(self.timings.values())
+        print("Stage timings:")
+        for name, seconds in self.timings.items():
+            share = seconds / total * 100 if total else 0.0
+            print(f"  {name:<16} {seconds:8.2f}s ({share:5.1f}%)")
+        print(f"  {'total':<16} {total:8.2f}s")
@@ -4,18 +4,56 @@
 """
 
 import os
-from typing import Optional, List
+import asyncio
+import unicodedata
+from contextlib import nullcontext
+from typing import Optional, List, Dict, Any, Tuple, Callable, Iterator
 
 import pandas as pd
 from tqdm import tqdm
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
 
+from src.api.batch import BatchJob
+from src.api.cache import ResponseCache, CacheMissError
+from src.checkpoint import GenerationJournal, default_journal_path
+from src.clean_classifier import CleanSentenceClassifier
+from src.raw_store import raw_frame
+from src.api.retry import RetryPolicy, RetryError
+from src.api.rate_limiter import (
+    RateLimiter,
+    AdaptiveConcurrency,
+    estimate_tokens,
+    is_throttle_error,
+)
+from src.prompts.packed import get_packed_prompt
 from src.prompts.registry import get_registry, register_default_prompts, list_prompts
 from src.postprocessors.enhanced_postprocessor import EnhancedPostprocessor
 from src.postprocessors.minimal_rule import MinimalRulePostprocessor
 
 
+# 행 완료 콜백: (배치 내 행 인덱스, 교정문, API 호출 횟수, 후처리 전 모델 출력)
+RowCallback = Callable[[int, str, int, Optional[str]], None]
+
+# 제출 파일 컬럼
+OUTPUT_COLUMNS = ["err_sentence", "cor_sentence"]
+
+
+def normalize_input(text: str) -> str:
+    """
+    중복 요청 판별용 입력 정규화 (유니코드 NFC + 앞뒤 공백 제거)
+
+    정규화 결과가 같은 입력은 모델 요청 하나를 공유함
+
+    Args:
+        text: 원문 텍스트
+
+    Returns:
+        str: 정규화된 텍스트
+    """
+    return unicodedata.normalize("NFC", text).strip()
+
+
 class SentenceGenerator:
     """
     문장 교정 생성기 클래스
@@ -28,7 +66,18 @@ class SentenceGenerator:
         model: str = "solar-pro2",
         api_key: Optional[str] = None,
         enable_postprocessing: bool = True,
-        use_enhanced_postprocessor: bool = False
+        use_enhanced_postprocessor: bool = False,
+        base_url: str = "https://api.upstage.ai/v1",
+        max_concurrency: int = 1,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        adaptive_concurrency: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        pack_size: int = 1,
+        deduplicate: bool = True,
+        clean_classifier: Optional[CleanSentenceClassifier] = None,
+        log_max_entries: Optional[int] = 1000,
+        log_path: Optional[str] = None
     ):
         """
         생성기 초기화
@@ -39,9 +88,23 @@ class SentenceGenerator:
             api_key: Upstage API 키 (None인 경우 환경변수에서 로드)
             enable_postprocessing: 후처리 활성화 여부 (기본값: True)
             use_enhanced_postprocessor: Enhanced 후처리 사용 여부 (기본값: False)
+            base_url: OpenAI 호환 API 주소 (기본값: Upstage API)
+            max_concurrency: 배치 교정 시 동시에 보낼 최대 요청 수 (기본값: 1 = 순차 실행)
+            cache: 모델 응답 디스크 캐시 (None이면 항상 API 호출)
+            rate_limiter: 요청/토큰 예산 속도 제한기 (여러 생성기가 공유 가능, None이면 제한 없음)
+            adaptive_concurrency: True면 max_concurrency를 상한으로 하는 AIMD 동시성 창 사용
+            retry_policy: 재시도 정책 (None이면 prompt_templates.json의 calls_per_case 사용)
+            pack_size: 한 요청에 묶어 보낼 문장 수 (기본값: 1 = 문장마다 요청, 2 이상이면 묶음 프롬프트 사용)
+            deduplicate: 정규화 결과가 같은 입력을 요청 하나로 합쳐 결과를 모든 행에 나눠줌 (기본값: True)
+            clean_classifier: 교정 불필요 문장 사전 분류기 (학습된 분류기만 허용,
+                교정 불필요로 분류된 문장은 API 호출 없이 원문 출력)
+            log_max_entries: Enhanced 후처리 로그를 메모리에 보관할 최근 항목 수
+                (기본값: 1000, None이면 전체 보관, 요약 통계는 항상 전체 기준)
+            log_path: Enhanced 후처리 로그 전체를 이어 쓸 JSONL 경로 (None이면 쓰지 않음)
 
         Raises:
-            ValueError: API 키가 없거나 프롬프트를 찾을 수 없는 경우
+            ValueError: API 키가 없거나, 프롬프트를 찾을 수 없거나, max_concurrency/pack_size가 1 미만이거나,
+                묶음 버전이 없는 프롬프트에 pack_size > 1을 지정했거나, clean_classifier가 학습 전인 경우
         """
         # 환경변수 로드
         load_dotenv()
@@ -60,20 +123,63 @@ class SentenceGenerator:
         register_default_prompts()
         registry = get_registry()
 
-        self.prompt = registry.get(prompt_name)
-        if self.prompt is None:
+        prompt_cls = registry.get(prompt_name)
+        if prompt_cls is None:
             available = list_prompts()
             raise ValueError(
                 f"Prompt '{prompt_name}' not found in registry. "
                 f"Available prompts: {available}"
             )
+        self.prompt = prompt_cls()
+
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1 (got {max_concurrency})")
+        if pack_size < 1:
+            raise ValueError(f"pack_size must be >= 1 (got {pack_size})")
+        self.pack_size = pack_size
+        self.packed_prompt = get_packed_prompt(prompt_name) if pack_size > 1 else None
+        # 묶음 요청 수 / 단일 문장 호출로 대체된 묶음 수 (누적)
+        self.packed_requests = 0
+        self.packed_fallbacks = 0
+
+        # 중복 요청 제거: 배치 내 입력 행 수 / 실제 요청한 고유 입력 수 / 진행 중인 요청을 공유한 횟수 (누적)
+        self.deduplicate = deduplicate
+        self.dedup_rows = 0
+        self.dedup_unique = 0
+        self.dedup_shared = 0
+        # 정규화 입력 → 진행 중인 비동기 요청 future (동시 호출자가 공유)
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        # 사전 분류기로 모델을 거치지 않은 입력 수 (중복 제거 후 기준, 누적)
+        if clean_classifier is not None and not clean_classifier.is_fitted:
+            raise ValueError("clean_classifier must be fitted on train data before use (call fit() or from_csv())")
+        self.clean_classifier = clean_classifier
+        self.skipped_clean = 0
 
         # OpenAI 클라이언트 초기화 (Upstage API 사용)
+        # 재시도는 RetryPolicy가 케이스당 호출 예산 안에서 전담하므로 SDK 자체 재시도는 끔
         self.client = OpenAI(
             api_key=api_key,
-            base_url="https://api.upstage.ai/v1"
+            base_url=base_url,
+            max_retries=0
         )
 
+        # 비동기 클라이언트는 이벤트 루프마다 새로 생성 (배치 실행 시)
+        self.api_key = api_key
+        self.base_url = base_url
+        self.max_concurrency = max_concurrency
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.concurrency_window = (
+            AdaptiveConcurrency(maximum=max_concurrency) if adaptive_concurrency else None
+        )
+        self.retry_policy = retry_policy or RetryPolicy.from_config()
+
+        # 직전 배치의 행별 API 호출 횟수 (캐시 적중 시 0)
+        self.last_attempts: List[int] = []
+        # 직전 배치의 행별 후처리 전 모델 출력 (실패한 행은 None)
+        self.last_raw: List[Optional[str]] = []
+
         self.model = model
         self.prompt_name = prompt_name
         self.enable_postprocessing = enable_postprocessing
@@ -82,7 +188,11 @@ class SentenceGenerator:
         # 후처리 모듈 초기화
         if enable_postprocessing:
             if use_enhanced_postprocessor:
-                self.postprocessor = EnhancedPostprocessor(enable_logging=True)
+                self.postprocessor = EnhancedPostprocessor(
+                    enable_logging=True,
+                    log_max_entries=log_max_entries,
+                    log_path=log_path
+                )
             else:
                 self.postprocessor = MinimalRulePostprocessor()
         else:
@@ -108,55 +218,791 @@ class SentenceGenerator:
             print(f"Warning: Postprocessing failed - {e}")
             return corrected
 
-    def generate_single(self, text: str) -> str:
+    def _completion_params(self, text: str) -> Dict[str, Any]:
         """
-        단일 문장 교정 생성
+        chat.completions.create 호출 파라미터 생성
 
         Args:
             text: 교정할 원문 텍스트
 
         Returns:
-            str: 교정된 문장 (실패 시 원문 반환)
+            Dict[str, Any]: model, messages, temperature
+        """
+        return {
+            "model": self.model,
+            "messages": self.prompt.to_messages(text),
+            "temperature": 0.0,
+        }
+
+    def _packed_params(self, texts: List[str]) -> Dict[str, Any]:
+        """
+        묶음 요청의 chat.completions.create 호출 파라미터 생성
+
+        Args:
+            texts: 교정할 원문 리스트
+
+        Returns:
+            Dict[str, Any]: model, messages, temperature
+        """
+        return {
+            "model": self.model,
+            "messages": self.packed_prompt.to_messages(texts),
+            "temperature": 0.0,
+        }
+
+    def _cache_key(self, params: Dict[str, Any], prompt_name: Optional[str] = None) -> Optional[str]:
+        """
+        요청 파라미터의 캐시 키 (캐시 미사용 시 None)
+
+        Args:
+            params: _completion_params() 또는 _packed_params() 결과
+            prompt_name: 키에 쓸 프롬프트 이름 (None이면 생성기의 prompt_name, 시스템 메시지는 prefix_key로 대체)
+
+        Returns:
+            Optional[str]: 캐시 키
+        """
+        if self.cache is None:
+            return None
+        return ResponseCache.make_key(
+            params["model"], prompt_name or self.prompt_name, params["messages"], params["temperature"],
+            prefix_key=self.prompt.prefix_key if prompt_name is None else None
+        )
+
+    def _lookup_cache(self, key: Optional[str]) -> Optional[str]:
+        """
+        캐시 조회 (읽기 전용 모드에서 미스 시 API를 호출하지 않고 예외 발생)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            Optional[str]: 캐시된 모델 응답 (없으면 None)
+
+        Raises:
+            CacheMissError: 읽기 전용 캐시에 응답이 없는 경우
+        """
+        if key is None:
+            return None
+
+        cached = self.cache.get(key)
+        if cached is None and self.cache.readonly:
+            raise CacheMissError(f"Response not in read-only cache (key={key[:12]})")
+        return cached
+
+    def _record_usage(self, estimated: int, resp: Any) -> None:
+        """
+        응답의 실제 토큰 사용량으로 속도 제한기 예산 보정
+
+        Args:
+            estimated: 호출 전 추정 토큰 수
+            resp: chat completion 응답
+        """
+        if self.rate_limiter is None:
+            return
+        usage = getattr(resp, "usage", None)
+        actual = getattr(usage, "total_tokens", None)
+        self.rate_limiter.record_usage(estimated, actual if isinstance(actual, int) else None)
+
+    def _request_options(self) -> Dict[str, Any]:
+        """
+        시도별 요청 옵션 (재시도 정책의 요청 타임아웃)
+
+        Returns:
+            Dict[str, Any]: create()에 추가로 전달할 인자
+        """
+        if self.retry_policy.request_timeout is None:
+            return {}
+        return {"timeout": self.retry_policy.request_timeout}
+
+    def _create_completion(self, params: Dict[str, Any]) -> Any:
+        """
+        속도 제한을 적용한 API 호출
+
+        Args:
+            params: _completion_params() 결과
+
+        Returns:
+            chat completion 응답
+        """
+        estimated = estimate_tokens(params["messages"])
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(estimated)
+
+        resp = self.client.chat.completions.create(**params, **self._request_options())
+        self._record_usage(estimated, resp)
+        return resp
+
+    async def _acreate_completion(self, client: AsyncOpenAI, params: Dict[str, Any]) -> Any:
+        """
+        속도 제한 및 동시성 창 피드백을 적용한 비동기 API 호출
+
+        Args:
+            client: 비동기 OpenAI 클라이언트
+            params: _completion_params() 결과
+
+        Returns:
+            chat completion 응답
         """
+        estimated = estimate_tokens(params["messages"])
+        if self.rate_limiter is not None:
+            await self.rate_limiter.aacquire(estimated)
+
         try:
-            # 프롬프트를 OpenAI 메시지 포맷으로 변환
-            messages = self.prompt.to_messages(text)
-
-            # API 호출
-            resp = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=0.0,
-            )
+            resp = await client.chat.completions.create(**params, **self._request_options())
+        except Exception as e:
+            # 429/타임아웃 → 동시성 창 축소
+            if self.concurrency_window is not None and is_throttle_error(e):
+                self.concurrency_window.on_throttle()
+            raise
 
-            corrected = resp.choices[0].message.content.strip()
+        if self.concurrency_window is not None:
+            self.concurrency_window.on_success()
+        self._record_usage(estimated, resp)
+        return resp
+
+    def _request_completion(self, text: str) -> Tuple[str, int]:
+        """
+        모델 응답 조회 (캐시 → API 순, API 실패 시 재시도 정책 적용)
+
+        Args:
+            text: 교정할 원문 텍스트
+
+        Returns:
+            Tuple[str, int]: (후처리 전 모델 응답, API 호출 횟수)
+
+        Raises:
+            RetryError: 치명적 오류 또는 호출 예산 소진
+        """
+        return self._fetch_completion(self._completion_params(text))
+
+    def _fetch_completion(self, params: Dict[str, Any], prompt_name: Optional[str] = None) -> Tuple[str, int]:
+        """
+        요청 파라미터로 모델 응답 조회 (캐시 → API 순, API 실패 시 재시도 정책 적용)
+
+        Args:
+            params: _completion_params() 또는 _packed_params() 결과
+            prompt_name: 캐시 키에 쓸 프롬프트 이름 (None이면 생성기의 prompt_name)
+
+        Returns:
+            Tuple[str, int]: (모델 응답, API 호출 횟수)
+
+        Raises:
+            RetryError: 치명적 오류 또는 호출 예산 소진
+        """
+        key = self._cache_key(params, prompt_name)
+
+        cached = self._lookup_cache(key)
+        if cached is not None:
+            return cached, 0
+
+        resp, attempts = self.retry_policy.call(lambda: self._create_completion(params))
+        corrected = resp.choices[0].message.content.strip()
+
+        if key is not None:
+            self.cache.put(key, corrected)
+        return corrected, attempts
+
+    async def _arequest_completion(self, client: AsyncOpenAI, text: str) -> Tuple[str, int]:
+        """
+        모델 응답 비동기 조회 (_request_completion의 비동기 버전)
+
+        Args:
+            client: 비동기 OpenAI 클라이언트
+            text: 교정할 원문 텍스트
+
+        Returns:
+            Tuple[str, int]: (후처리 전 모델 응답, API 호출 횟수)
+
+        Raises:
+            RetryError: 치명적 오류 또는 호출 예산 소진
+        """
+        if not self.deduplicate:
+            return await self._afetch_completion(client, self._completion_params(text))
+
+        # 같은 입력의 요청이 진행 중이면 새로 보내지 않고 그 결과를 기다림 (API 호출 0회)
+        key = normalize_input(text)
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.dedup_shared += 1
+            try:
+                corrected, _ = await asyncio.shield(pending)
+            except RetryError as e:
+                # 호출 횟수는 요청한 쪽에 이미 기록되므로 기다린 쪽은 0회로 보고
+                raise RetryError(e.last_exception, 0) from e
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if task is not None and task.cancelling():
+                    raise
+                # 기다린 쪽이 아니라 요청한 쪽이 취소됨: 공유를 취소하고 직접 요청 (다른 대기자와는 다시 공유)
+                self.dedup_shared -= 1
+                return await self._arequest_completion(client, text)
+            return corrected, 0
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._afetch_completion(client, self._completion_params(text))
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # 기다리는 호출자가 없어도 'exception was never retrieved' 경고가 나지 않도록 표시
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _afetch_completion(
+        self,
+        client: AsyncOpenAI,
+        params: Dict[str, Any],
+        prompt_name: Optional[str] = None
+    ) -> Tuple[str, int]:
+        """
+        요청 파라미터로 모델 응답 비동기 조회 (_fetch_completion의 비동기 버전)
+
+        Args:
+            client: 비동기 OpenAI 클라이언트
+            params: _completion_params() 또는 _packed_params() 결과
+            prompt_name: 캐시 키에 쓸 프롬프트 이름 (None이면 생성기의 prompt_name)
+
+        Returns:
+            Tuple[str, int]: (모델 응답, API 호출 횟수)
+
+        Raises:
+            RetryError: 치명적 오류 또는 호출 예산 소진
+        """
+        key = self._cache_key(params, prompt_name)
+
+        cached = self._lookup_cache(key)
+        if cached is not None:
+            return cached, 0
+
+        resp, attempts = await self.retry_policy.acall(
+            lambda: self._acreate_completion(client, params)
+        )
+        corrected = resp.choices[0].message.content.strip()
+
+        if key is not None:
+            self.cache.put(key, corrected)
+        return corrected, attempts
+
+    def _is_clean(self, text: str) -> bool:
+        """
+        사전 분류기가 교정 불필요로 분류한 문장인지 (분류기 미사용 시 False)
+
+        Args:
+            text: 원문 텍스트
+
+        Returns:
+            bool: 모델을 거치지 않아도 되면 True
+        """
+        return self.clean_classifier is not None and self.clean_classifier.is_clean(text)
+
+    def _clean_plan(self, unique: List[str]) -> List[bool]:
+        """
+        고유 입력마다 한 번씩 교정 불필요 여부 판별 (판별 결과는 요청 묶기·행 처리에 그대로 전달)
+
+        Args:
+            unique: _dedup_plan()의 고유 문장 리스트
+
+        Returns:
+            List[bool]: 고유 문장별 교정 불필요 여부
+        """
+        clean = [self._is_clean(text) for text in unique]
+        self.skipped_clean += sum(clean)
+        return clean
+
+    @staticmethod
+    def _skip_row(text: str) -> Tuple[str, int, Optional[str]]:
+        """
+        교정 불필요로 분류한 문장의 결과 (API 호출·후처리 없이 원문 유지)
+
+        모델 출력이 없으므로 원본 출력은 None으로 기록함 (후처리 재적용 시에도 원문 유지)
+
+        Args:
+            text: 원문 텍스트
+
+        Returns:
+            Tuple[str, int, Optional[str]]: (원문, 0, None)
+        """
+        return text, 0, None
+
+    def _generate_row(self, text: str) -> Tuple[str, int, Optional[str]]:
+        """
+        단일 문장 교정 + 호출 횟수 + 후처리 전 모델 출력
+
+        Args:
+            text: 교정할 원문 텍스트
+
+        Returns:
+            Tuple[str, int, Optional[str]]: (교정된 문장, API 호출 횟수, 모델 원본 출력),
+                실패 시 (원문, 호출 횟수, None)
+        """
+        try:
+            # 모델 응답 조회 (캐시 또는 API 호출)
+            corrected, attempts = self._request_completion(text)
 
             # 후처리 적용
             final = self._apply_postprocessing(text, corrected)
 
-            return final
+            return final, attempts, corrected
 
+        except RetryError as e:
+            print(f"Error processing: {text[:50]}... - {e}")
+            return text, e.attempts, None  # fallback to original
         except Exception as e:
             print(f"Error processing: {text[:50]}... - {e}")
-            return text  # fallback to original
+            return text, 0, None  # fallback to original
 
-    def generate_batch(self, err_sentences: List[str]) -> pd.DataFrame:
+    def generate_single(self, text: str) -> str:
+        """
+        단일 문장 교정 생성
+
+        Args:
+            text: 교정할 원문 텍스트
+
+        Returns:
+            str: 교정된 문장 (실패 시 원문 반환, 교정 불필요로 분류되면 원문 그대로)
+        """
+        if self._clean_plan([text])[0]:
+            return self._skip_row(text)[0]
+        return self._generate_row(text)[0]
+
+    async def _agenerate_row(self, client: AsyncOpenAI, text: str) -> Tuple[str, int, Optional[str]]:
+        """
+        단일 문장 비동기 교정 + 호출 횟수 + 모델 원본 출력 (_generate_row의 비동기 버전)
+
+        Args:
+            client: 비동기 OpenAI 클라이언트
+            text: 교정할 원문 텍스트
+
+        Returns:
+            Tuple[str, int, Optional[str]]: (교정된 문장, API 호출 횟수, 모델 원본 출력),
+                실패 시 (원문, 호출 횟수, None)
+        """
+        try:
+            corrected, attempts = await self._arequest_completion(client, text)
+
+            return self._apply_postprocessing(text, corrected), attempts, corrected
+
+        except RetryError as e:
+            print(f"Error processing: {text[:50]}... - {e}")
+            return text, e.attempts, None  # fallback to original
+        except Exception as e:
+            print(f"Error processing: {text[:50]}... - {e}")
+            return text, 0, None  # fallback to original
+
+    def _dedup_plan(self, err_sentences: List[str]) -> Tuple[List[str], List[List[int]]]:
+        """
+        배치 내 중복 입력 묶기 (정규화 결과가 같은 행은 첫 행의 요청 하나로 처리)
+
+        Args:
+            err_sentences: 교정할 문장 리스트
+
+        Returns:
+            Tuple[List[str], List[List[int]]]: (요청할 고유 문장 리스트, 고유 문장별 행 인덱스 리스트)
+        """
+        if not self.deduplicate:
+            return list(err_sentences), [[index] for index in range(len(err_sentences))]
+
+        first: Dict[str, int] = {}
+        unique: List[str] = []
+        owners: List[List[int]] = []
+        for index, text in enumerate(err_sentences):
+            key = normalize_input(text)
+            position = first.get(key)
+            if position is None:
+                first[key] = len(unique)
+                unique.append(text)
+                owners.append([index])
+            else:
+                owners[position].append(index)
+
+        self.dedup_rows += len(err_sentences)
+        self.dedup_unique += len(unique)
+        return unique, owners
+
+    def _fan_out(
+        self,
+        err_sentences: List[str],
+        unique_text: str,
+        owner: List[int],
+        row: Tuple[str, int, Optional[str]]
+    ) -> List[Tuple[int, Tuple[str, int, Optional[str]]]]:
+        """
+        고유 입력의 결과를 같은 입력의 모든 행에 나눠줌
+
+        API 호출 횟수는 첫 행에만 기록하고, 원문이 고유 입력과 다른 행(공백·정규화 차이)은
+        모델 출력에 그 행의 원문으로 다시 후처리함
+
+        Args:
+            err_sentences: 전체 입력 문장 리스트
+            unique_text: 요청에 사용한 문장
+            owner: 이 입력을 가진 행 인덱스 (첫 항목이 요청한 행)
+            row: 고유 입력의 (교정문, 호출 횟수, 모델 원본 출력)
+
+        Returns:
+            List[Tuple[int, Tuple[str, int, Optional[str]]]]: (행 인덱스, 행 결과) 리스트
+        """
+        final, attempts, raw = row
+        rows = [(owner[0], row)]
+        for index in owner[1:]:
+            text = err_sentences[index]
+            if raw is None:
+                rows.append((index, (text, 0, None)))
+            elif text == unique_text:
+                rows.append((index, (final, 0, raw)))
+            else:
+                rows.append((index, (self._apply_postprocessing(text, raw), 0, raw)))
+        return rows
+
+    def _pack_groups(self, err_sentences: List[str], clean: List[bool]) -> List[List[int]]:
+        """
+        요청 단위로 행 인덱스 묶기
+
+        연속한 묶을 수 있는 문장을 pack_size개까지 한 묶음으로 만들고,
+        여러 줄이거나 빈 문장, 사전 분류기가 교정 불필요로 본 문장은 단독으로 처리함 (pack_size=1이면 모두 단독)
+
+        Args:
+            err_sentences: 교정할 문장 리스트
+            clean: 문장별 교정 불필요 여부 (_clean_plan() 결과)
+
+        Returns:
+            List[List[int]]: 요청별 행 인덱스 리스트 (입력 순서)
+        """
+        if self.packed_prompt is None:
+            return [[index] for index in range(len(err_sentences))]
+
+        groups: List[List[int]] = []
+        current: List[int] = []
+        for index, text in enumerate(err_sentences):
+            if clean[index] or not self.packed_prompt.can_pack(text):
+                if current:
+                    groups.append(current)
+                    current = []
+                groups.append([index])
+                continue
+            current.append(index)
+            if len(current) == self.pack_size:
+                groups.append(current)
+                current = []
+        if current:
+            groups.append(current)
+        return groups
+
+    def _unpack_rows(
+        self,
+        texts: List[str],
+        response: Optional[str],
+        attempts: int
+    ) -> Optional[List[Tuple[str, int, Optional[str]]]]:
+        """
+        묶음 응답을 행별 결과로 분리 (묶음 요청의 API 호출 횟수는 첫 행에 기록)
+
+        Args:
+            texts: 묶음의 원문 리스트
+            response: 묶음 요청의 모델 응답 (요청 실패 시 None)
+            attempts: 묶음 요청의 API 호출 횟수
+
+        Returns:
+            Optional[List[Tuple[str, int, Optional[str]]]]: 행별 (교정문, 호출 횟수, 모델 원본 출력),
+                분리에 실패하면 None
+        """
+        self.packed_requests += 1
+        corrections = None if response is None else self.packed_prompt.parse(response, len(texts))
+        if corrections is None:
+            self.packed_fallbacks += 1
+            return None
+        return [
+            (self._apply_postprocessing(text, corrected), attempts if i == 0 else 0, corrected)
+            for i, (text, corrected) in enumerate(zip(texts, corrections))
+        ]
+
+    @staticmethod
+    def _with_packed_attempts(
+        rows: List[Tuple[str, int, Optional[str]]],
+        attempts: int
+    ) -> List[Tuple[str, int, Optional[str]]]:
+        """
+        단일 문장 호출로 대체한 결과의 첫 행에 실패한 묶음 요청의 호출 횟수를 더함
+
+        Args:
+            rows: 단일 문장 호출 결과
+            attempts: 묶음 요청의 API 호출 횟수
+
+        Returns:
+            List[Tuple[str, int, Optional[str]]]: 호출 횟수를 반영한 결과
+        """
+        final, row_attempts, raw = rows[0]
+        return [(final, row_attempts + attempts, raw)] + rows[1:]
+
+    def _generate_group(self, texts: List[str]) -> List[Tuple[str, int, Optional[str]]]:
+        """
+        한 요청 단위 교정 (묶음 응답을 분리할 수 없거나 묶음 요청이 실패하면 문장마다 단일 호출로 대체)
+
+        Args:
+            texts: 원문 리스트 (_pack_groups()의 한 묶음)
+
+        Returns:
+            List[Tuple[str, int, Optional[str]]]: 행별 (교정문, 호출 횟수, 모델 원본 출력)
+        """
+        if len(texts) == 1:
+            return [self._generate_row(texts[0])]
+
+        response, attempts = None, 0
+        try:
+            response, attempts = self._fetch_completion(self._packed_params(texts), self.packed_prompt.name)
+        except RetryError as e:
+            attempts = e.attempts
+            print(f"Packed request failed ({len(texts)} rows), falling back to single calls - {e}")
+        except Exception as e:
+            print(f"Packed request failed ({len(texts)} rows), falling back to single calls - {e}")
+
+        rows = self._unpack_rows(texts, response, attempts)
+        if rows is not None:
+            return rows
+        return self._with_packed_attempts([self._generate_row(text) for text in texts], attempts)
+
+    async def _agenerate_group(
+        self,
+        client: AsyncOpenAI,
+        texts: List[str]
+    ) -> List[Tuple[str, int, Optional[str]]]:
+        """
+        한 요청 단위 비동기 교정 (_generate_group의 비동기 버전, 대체 호출은 같은 동시성 슬롯에서 순차 실행)
+
+        Args:
+            client: 비동기 OpenAI 클라이언트
+            texts: 원문 리스트 (_pack_groups()의 한 묶음)
+
+        Returns:
+            List[Tuple[str, int, Optional[str]]]: 행별 (교정문, 호출 횟수, 모델 원본 출력)
+        """
+        if len(texts) == 1:
+            return [await self._agenerate_row(client, texts[0])]
+
+        response, attempts = None, 0
+        try:
+            response, attempts = await self._afetch_completion(
+                client, self._packed_params(texts), self.packed_prompt.name
+            )
+        except RetryError as e:
+            attempts = e.attempts
+            print(f"Packed request failed ({len(texts)} rows), falling back to single calls - {e}")
+        except Exception as e:
+            print(f"Packed request failed ({len(texts)} rows), falling back to single calls - {e}")
+
+        rows = self._unpack_rows(texts, response, attempts)
+        if rows is not None:
+            return rows
+        return self._with_packed_attempts(
+            [await self._agenerate_row(client, text) for text in texts], attempts
+        )
+
+    async def agenerate_batch(
+        self,
+        err_sentences: List[str],
+        concurrency: Optional[int] = None,
+        on_row: Optional[RowCallback] = None
+    ) -> List[str]:
+        """
+        여러 문장을 비동기로 동시에 교정
+
+        최대 concurrency개의 요청을 동시에 보내며, 결과는 입력 순서를 유지함.
+        adaptive_concurrency 사용 시 concurrency는 AIMD 창의 상한으로 쓰임.
+        pack_size > 1이면 요청 하나가 여러 행을 처리함.
+        deduplicate가 켜져 있으면 같은 입력의 행은 요청 하나의 결과를 공유함 (중복 행의 호출 횟수는 0).
+        행별 API 호출 횟수는 last_attempts, 후처리 전 모델 출력은 last_raw에 기록됨
+
+        Args:
+            err_sentences: 교정할 문장 리스트
+            concurrency: 동시 요청 수 (None이면 max_concurrency 사용)
+            on_row: 행이 완료될 때마다 (완료 순서대로) 호출되는 콜백
+
+        Returns:
+            List[str]: 입력 순서와 동일한 교정 문장 리스트 (실패한 행은 원문)
+        """
+        concurrency = concurrency or self.max_concurrency
+
+        # 적응형 창 사용 시 창 크기가 429/타임아웃에 따라 변하고, 아니면 고정 세마포어
+        if self.concurrency_window is not None:
+            self.concurrency_window.maximum = concurrency
+            slot = self.concurrency_window.slot
+        else:
+            semaphore = asyncio.Semaphore(concurrency)
+            slot = lambda: semaphore
+
+        unique, owners = self._dedup_plan(err_sentences)
+        clean = self._clean_plan(unique)
+        rows: List[Optional[Tuple[str, int, Optional[str]]]] = [None] * len(err_sentences)
+
+        async with AsyncOpenAI(
+            api_key=self.api_key, base_url=self.base_url, max_retries=0
+        ) as client:
+            with tqdm(total=len(err_sentences), desc=f"Generating ({self.prompt_name})") as pbar:
+
+                async def run(group: List[int]) -> None:
+                    if clean[group[0]]:
+                        group_rows = [self._skip_row(unique[group[0]])]
+                    else:
+                        async with slot():
+                            group_rows = await self._agenerate_group(client, [unique[u] for u in group])
+                    for u, row in zip(group, group_rows):
+                        for index, fanned in self._fan_out(err_sentences, unique[u], owners[u], row):
+                            rows[index] = fanned
+                            if on_row is not None:
+                                on_row(index, *fanned)
+                        pbar.update(len(owners[u]))
+
+                # 결과는 행 인덱스 위치에 기록하므로 완료 순서와 무관하게 입력 순서 유지
+                await asyncio.gather(*(run(group) for group in self._pack_groups(unique, clean)))
+
+        self.last_attempts = [row[1] for row in rows]
+        self.last_raw = [row[2] for row in rows]
+        return [row[0] for row in rows]
+
+    def generate_batch(
+        self,
+        err_sentences: List[str],
+        concurrency: Optional[int] = None,
+        on_row: Optional[RowCallback] = None
+    ) -> pd.DataFrame:
         """
         여러 문장을 배치로 교정
 
         Args:
             err_sentences: 교정할 문장 리스트
+            concurrency: 동시 요청 수 (None이면 max_concurrency 사용, 1이면 순차 실행)
+            on_row: 행이 완료될 때마다 호출되는 콜백 (체크포인트 기록용)
+
+        Returns:
+            pd.DataFrame: err_sentence, cor_sentence 컬럼을 가진 데이터프레임
+        """
+        concurrency = concurrency or self.max_concurrency
+
+        err_results = list(err_sentences)
+
+        if concurrency > 1 and err_results:
+            cor_results = asyncio.run(self.agenerate_batch(err_results, concurrency, on_row))
+        else:
+            unique, owners = self._dedup_plan(err_results)
+            clean = self._clean_plan(unique)
+            rows = [None] * len(err_results)
+            with tqdm(total=len(err_results), desc=f"Generating ({self.prompt_name})") as pbar:
+                for group in self._pack_groups(unique, clean):
+                    if clean[group[0]]:
+                        group_rows = [self._skip_row(unique[group[0]])]
+                    else:
+                        group_rows = self._generate_group([unique[u] for u in group])
+                    for u, row in zip(group, group_rows):
+                        for index, fanned in self._fan_out(err_results, unique[u], owners[u], row):
+                            rows[index] = fanned
+                            if on_row is not None:
+                                on_row(index, *fanned)
+                        pbar.update(len(owners[u]))
+            cor_results = [row[0] for row in rows]
+            self.last_attempts = [row[1] for row in rows]
+            self.last_raw = [row[2] for row in rows]
+
+        return pd.DataFrame({
+            "err_sentence": err_results,
+            "cor_sentence": cor_results
+        })
+
+    def generate_batch_job(
+        self,
+        err_sentences: List[str],
+        job_path: str,
+        poll_interval: float = 30.0,
+        timeout: Optional[float] = None
+    ) -> pd.DataFrame:
+        """
+        배치 작업(Batch API)으로 여러 문장 교정
+
+        캐시에 없는 행의 to_messages() 요청을 작업 파일(JSONL)로 기록해 한 번에 제출하고,
+        완료될 때까지 폴링한 뒤 결과를 행 순서대로 되돌려 후처리함.
+        제출 상태는 '<job_path>.state.json'에 기록되므로 중단 후 같은 입력으로 다시 실행하면
+        기존 배치를 이어서 폴링함 (배치가 만료·취소되었으면 완료되지 않은 요청만 다시 제출). 배치에서 실패한 행과 교정 불필요로 분류된 행은 원문을 유지함
+
+        Args:
+            err_sentences: 교정할 문장 리스트
+            job_path: 배치 작업 파일 경로
+            poll_interval: 배치 상태 조회 간격(초)
+            timeout: 폴링 제한 시간(초, None이면 무제한)
 
         Returns:
             pd.DataFrame: err_sentence, cor_sentence 컬럼을 가진 데이터프레임
+
+        Raises:
+            ValueError: pack_size > 1이거나, 읽기 전용 캐시에 없는 행이 있거나,
+                상태 파일이 다른 작업의 진행 중인 배치를 가리키는 경우
+            BatchJobError: 배치가 실패했거나 제한 시간을 넘긴 경우
         """
-        err_results = []
-        cor_results = []
+        if self.packed_prompt is not None:
+            raise ValueError("Batch job mode does not support pack_size > 1")
+
+        err_results = list(err_sentences)
+        unique, owners = self._dedup_plan(err_results)
+        clean = self._clean_plan(unique)
+        responses: List[Optional[str]] = [None] * len(err_results)
+        attempts = [0] * len(err_results)
+        # custom_id → (고유 입력 위치, 요청 파라미터, 캐시 키)
+        pending: Dict[str, Tuple[int, Dict[str, Any], Optional[str]]] = {}
+        misses = 0
+        for u, text in enumerate(unique):
+            if clean[u]:
+                continue
+            params = self._completion_params(text)
+            key = self._cache_key(params)
+            try:
+                cached = self._lookup_cache(key)
+            except CacheMissError:
+                misses += 1
+                continue
+            if cached is not None:
+                for index in owners[u]:
+                    responses[index] = cached
+            else:
+                pending[f"row-{owners[u][0]}"] = (u, params, key)
 
-        for text in tqdm(err_sentences, desc=f"Generating ({self.prompt_name})"):
-            err_results.append(text)
-            corrected = self.generate_single(text)
-            cor_results.append(corrected)
+        if misses:
+            raise ValueError(
+                f"{misses} inputs are not in the read-only cache and batch job mode cannot submit them. "
+                "Run without --cache-readonly to submit the missing rows."
+            )
+
+        print(f"Batch job: {len(pending)} requests for {len(err_results)} rows")
+        if pending:
+            job = BatchJob(
+                self.client, job_path,
+                poll_interval=poll_interval, timeout=timeout, retry_policy=self.retry_policy
+            )
+            outputs = job.run((custom_id, params) for custom_id, (_, params, _) in pending.items())
+            for custom_id, (u, _, key) in pending.items():
+                corrected = outputs.get(custom_id)
+                attempts[owners[u][0]] = 1
+                if corrected is None:
+                    continue
+                for index in owners[u]:
+                    responses[index] = corrected
+                if key is not None:
+                    self.cache.put(key, corrected)
+
+            failed = sum(1 for custom_id in pending if outputs.get(custom_id) is None)
+            if failed:
+                print(f"Batch job: {failed} requests failed, keeping the original sentence")
+
+        cor_results = [
+            text if corrected is None else self._apply_postprocessing(text, corrected)
+            for text, corrected in zip(err_results, responses)
+        ]
+        self.last_attempts = attempts
+        self.last_raw = responses
 
         return pd.DataFrame({
             "err_sentence": err_results,
@@ -166,33 +1012,393 @@ class SentenceGenerator:
     def generate_from_csv(
         self,
         input_path: str,
-        output_path: str
+        output_path: str,
+        resume: bool = False,
+        journal_path: Optional[str] = None,
+        chunksize: Optional[int] = None,
+        raw_output_path: Optional[str] = None,
+        batch_job_path: Optional[str] = None,
+        batch_poll_interval: float = 30.0
     ) -> None:
         """
         CSV 파일에서 문장을 읽어 교정하고 결과를 저장
 
+        journal_path가 주어지거나 resume=True이면 완료된 행을 저널에 즉시 기록하여,
+        중단 후 resume=True로 다시 실행할 때 이미 끝난 행은 건너뜀.
+        chunksize가 주어지면 입력을 청크 단위로 읽고 청크마다 출력에 이어 써서
+        입력 크기와 무관하게 메모리 사용량을 일정하게 유지함.
+        raw_output_path가 주어지면 후처리 전 모델 출력을 함께 저장하여
+        scripts/repostprocess.py로 API 호출 없이 후처리만 다시 적용할 수 있음.
+        batch_job_path가 주어지면 행별 호출 대신 배치 작업으로 제출함 (재개는 배치 상태 파일로 처리하므로 저널 미사용)
+
         Args:
             input_path: 입력 CSV 파일 경로 (err_sentence 컬럼 필수)
             output_path: 출력 CSV 파일 경로
+            resume: 저널에 기록된 행을 건너뛰고 이어서 실행
+            journal_path: 체크포인트 저널 경로 (None이고 resume=True면 '<output_path>.journal.jsonl')
+            chunksize: 스트리밍 청크 크기 (None이면 전체를 한 번에 처리)
+            raw_output_path: 후처리 전 모델 출력 CSV 경로 (None이면 저장하지 않음)
+            batch_job_path: 배치 작업 파일 경로 (None이면 행별 API 호출)
+            batch_poll_interval: 배치 상태 조회 간격(초)
 
         Raises:
-            ValueError: err_sentence 컬럼이 없는 경우
+            ValueError: err_sentence 컬럼이 없거나, 저널이 입력과 맞지 않거나,
+                배치 작업에 chunksize·resume·journal_path를 지정한 경우 (배치 작업은 상태 파일로 이어서 실행)
         """
+        print(f"Prompt: {self.prompt_name}")
+        print(f"Model: {self.model}")
+        print(f"Input: {input_path}")
+        print(f"Output: {output_path}")
+
+        if batch_job_path is not None:
+            if chunksize is not None:
+                raise ValueError("Batch job mode does not support chunksize")
+            if resume or journal_path is not None:
+                raise ValueError(
+                    "Batch job mode resumes from <batch_job_path>.state.json and does not support resume or journal_path"
+                )
+
+        if journal_path is None and resume:
+            journal_path = default_journal_path(output_path)
+        journal = GenerationJournal(journal_path) if journal_path is not None else None
+
+        if chunksize is not None:
+            self._generate_streaming(input_path, output_path, chunksize, journal, resume, raw_output_path)
+            return
+
         # 입력 파일 읽기
         df = pd.read_csv(input_path)
 
         if "err_sentence" not in df.columns:
             raise ValueError("Input CSV must contain 'err_sentence' column")
 
-        print(f"Prompt: {self.prompt_name}")
-        print(f"Model: {self.model}")
-        print(f"Input: {input_path}")
-        print(f"Output: {output_path}")
-
         # 문장 교정 실행
         err_sentences = df["err_sentence"].astype(str).tolist()
-        result_df = self.generate_batch(err_sentences)
+
+        if batch_job_path is not None:
+            result_df = self.generate_batch_job(err_sentences, batch_job_path, poll_interval=batch_poll_interval)
+            result_df["raw_sentence"] = self.last_raw
+        elif journal is None:
+            result_df = self.generate_batch(err_sentences)
+            result_df["raw_sentence"] = self.last_raw
+        else:
+            if resume:
+                done = journal.load(err_sentences)
+            else:
+                journal.reset()
+                done = {}
+            print(f"Journal: {journal.path} ({len(done)} rows done)")
+            result_df = self._generate_chunk(err_sentences, 0, done, journal)
+            journal.close()
 
         # 결과 저장
-        result_df.to_csv(output_path, index=False)
+        result_df[OUTPUT_COLUMNS].to_csv(output_path, index=False)
         print(f"Wrote {len(result_df)} rows to {output_path}")
+        if raw_output_path is not None:
+            raw_frame(result_df["err_sentence"], result_df["raw_sentence"]).to_csv(raw_output_path, index=False)
+            print(f"Raw outputs: {raw_output_path}")
+
+        self._print_run_stats(self.last_attempts)
+
+    def dedup_stats(self) -> Dict[str, Any]:
+        """
+        중복 요청 제거 통계 (생성기 생성 이후 누적)
+
+        Returns:
+            Dict[str, Any]: rows, unique, duplicates, dedup_ratio(%), shared_in_flight
+        """
+        duplicates = self.dedup_rows - self.dedup_unique
+        return {
+            "rows": self.dedup_rows,
+            "unique": self.dedup_unique,
+            "duplicates": duplicates,
+            "dedup_ratio": duplicates / self.dedup_rows * 100 if self.dedup_rows else 0.0,
+            "shared_in_flight": self.dedup_shared,
+        }
+
+    def _print_run_stats(self, attempts: List[int]) -> None:
+        """
+        재시도/캐시 통계 출력
+
+        Args:
+            attempts: 행별 API 호출 횟수
+        """
+        retried = sum(1 for row_attempts in attempts if row_attempts > 1)
+        if retried:
+            print(
+                f"Retries: {retried} rows needed more than one call "
+                f"({sum(attempts)} calls total, budget {self.retry_policy.max_attempts}/row)"
+            )
+
+        if self.clean_classifier is not None:
+            print(
+                f"Pre-classifier: {self.skipped_clean} inputs classified clean and skipped the model "
+                f"(threshold {self.clean_classifier.threshold})"
+            )
+
+        dedup = self.dedup_stats()
+        if dedup["duplicates"] or dedup["shared_in_flight"]:
+            print(
+                f"Dedup: {dedup['rows']} rows -> {dedup['unique']} unique inputs "
+                f"({dedup['dedup_ratio']:.1f}% duplicates), "
+                f"{dedup['shared_in_flight']} requests shared in flight"
+            )
+
+        if self.packed_prompt is not None and self.packed_requests:
+            print(
+                f"Packing: {self.packed_requests} packed requests (up to {self.pack_size} rows each), "
+                f"{self.packed_fallbacks} fell back to single calls"
+            )
+
+        if self.cache is not None:
+            stats = self.cache.stats()
+            print(
+                f"Cache: {stats['hits']} hits / {stats['misses']} misses "
+                f"({stats['hit_rate']:.1f}%), {stats['entries']} entries"
+            )
+
+    def _generate_chunk(
+        self,
+        err_sentences: List[str],
+        offset: int,
+        done: Dict[int, dict],
+        journal: Optional[GenerationJournal]
+    ) -> pd.DataFrame:
+        """
+        청크 교정 (저널에 있는 행은 건너뛰고, 새로 완료된 행은 저널에 기록)
+
+        Args:
+            err_sentences: 청크 입력 문장
+            offset: 청크 첫 행의 전체 입력 기준 인덱스
+            done: 전체 인덱스 → 저널 레코드 (이미 완료된 행)
+            journal: 체크포인트 저널 (None이면 기록하지 않음)
+
+        Returns:
+            pd.DataFrame: err_sentence, cor_sentence, raw_sentence(후처리 전 모델 출력) 컬럼
+
+        Raises:
+            ValueError: 저널 레코드가 입력 문장과 다른 경우
+        """
+        corrections: Dict[int, str] = {}
+        raws: Dict[int, Optional[str]] = {}
+        pending: List[int] = []
+        for i, text in enumerate(err_sentences):
+            record = done.get(offset + i)
+            if record is None:
+                pending.append(i)
+            elif record["err_sentence"] != text:
+                raise ValueError(
+                    f"Journal does not match input at row {offset + i}. "
+                    "Remove it or run without --resume."
+                )
+            else:
+                corrections[i] = record["cor_sentence"]
+                raws[i] = record.get("raw_sentence")
+
+        def record_row(batch_index: int, corrected: str, attempts: int, raw: Optional[str]) -> None:
+            i = pending[batch_index]
+            if journal is not None:
+                journal.append(offset + i, err_sentences[i], corrected, attempts, raw_sentence=raw)
+
+        try:
+            pending_df = self.generate_batch(
+                [err_sentences[i] for i in pending], on_row=record_row
+            )
+        except KeyboardInterrupt:
+            if journal is not None:
+                print(f"\nInterrupted. Completed rows are saved in {journal.path}; rerun with --resume.")
+            raise
+
+        corrections.update(zip(pending, pending_df["cor_sentence"]))
+        raws.update(zip(pending, self.last_raw))
+
+        return pd.DataFrame({
+            "err_sentence": err_sentences,
+            "cor_sentence": [corrections[i] for i in range(len(err_sentences))],
+            "raw_sentence": [raws[i] for i in range(len(err_sentences))]
+        })
+
+    @staticmethod
+    def iter_input_chunks(
+        input_path: str,
+        chunksize: int,
+        start: int = 0
+    ) -> Iterator[Tuple[int, List[str]]]:
+        """
+        입력 CSV를 청크 단위로 읽기
+
+        Args:
+            input_path: 입력 CSV 경로 (err_sentence 컬럼 필수)
+            chunksize: 청크 행 수
+            start: 이 인덱스 이전 행은 건너뜀 (이미 출력에 기록된 행)
+
+        Yields:
+            Tuple[int, List[str]]: (청크 첫 행의 전체 인덱스, 원문 리스트)
+
+        Raises:
+            ValueError: err_sentence 컬럼이 없는 경우
+        """
+        offset = 0
+        for chunk in pd.read_csv(input_path, chunksize=chunksize):
+            if "err_sentence" not in chunk.columns:
+                raise ValueError("Input CSV must contain 'err_sentence' column")
+
+            texts = chunk["err_sentence"].astype(str).tolist()
+            skip = min(len(texts), max(0, start - offset))
+            if skip < len(texts):
+                yield offset + skip, texts[skip:]
+            offset += len(texts)
+
+    def iter_generate(
+        self,
+        chunks: Iterator[Tuple[int, List[str]]],
+        journal: Optional[GenerationJournal] = None,
+        done: Optional[Dict[int, dict]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        청크 스트림 교정 파이프라인 (청크 하나씩 교정·후처리하여 내보냄)
+
+        Args:
+            chunks: iter_input_chunks() 결과
+            journal: 체크포인트 저널
+            done: 이미 완료된 행 (전체 인덱스 → 저널 레코드)
+
+        Yields:
+            pd.DataFrame: 청크별 err_sentence, cor_sentence, raw_sentence 데이터프레임
+        """
+        done = done or {}
+        for offset, texts in chunks:
+            yield self._generate_chunk(texts, offset, done, journal)
+            # 처리한 청크의 저널 레코드는 더 이상 필요 없음
+            for index in range(offset, offset + len(texts)):
+                done.pop(index, None)
+
+    @staticmethod
+    def _count_output_rows(output_path: str, chunksize: int) -> int:
+        """
+        이미 출력 CSV에 기록된 행 수 (스트리밍 재개 지점)
+
+        Args:
+            output_path: 출력 CSV 경로
+            chunksize: 읽기 청크 크기
+
+        Returns:
+            int: 데이터 행 수 (파일이 없거나 비어 있으면 0)
+        """
+        if not os.path.exists(output_path) or os.path.getsize(output_path) == 0:
+            return 0
+        return sum(len(chunk) for chunk in pd.read_csv(output_path, chunksize=chunksize))
+
+    def _truncate_raw_outputs(self, raw_output_path: str, rows: int, chunksize: int) -> None:
+        """
+        원본 출력 파일을 앞 rows행만 남기고 잘라냄 (스트리밍 재개 시 출력 파일과 맞춤)
+
+        Args:
+            raw_output_path: 원본 출력 CSV 경로
+            rows: 남길 행 수
+            chunksize: 읽기 청크 크기
+
+        Raises:
+            ValueError: 원본 출력 파일의 행이 rows보다 적은 경우
+        """
+        raw_rows = self._count_output_rows(raw_output_path, chunksize)
+        if raw_rows < rows:
+            raise ValueError(
+                f"Raw output file {raw_output_path} has {raw_rows} rows but the output has {rows}. "
+                "Remove both files or run without --resume."
+            )
+        if raw_rows == rows:
+            return
+
+        tmp_path = f"{raw_output_path}.tmp"
+        kept = 0
+        with open(tmp_path, "w", encoding="utf-8", newline="") as out:
+            for chunk in pd.read_csv(raw_output_path, chunksize=chunksize, keep_default_na=False):
+                chunk = chunk.iloc[:rows - kept]
+                out.write(chunk.to_csv(index=False, header=kept == 0))
+                kept += len(chunk)
+                if kept >= rows:
+                    break
+        os.replace(tmp_path, raw_output_path)
+
+    def _generate_streaming(
+        self,
+        input_path: str,
+        output_path: str,
+        chunksize: int,
+        journal: Optional[GenerationJournal],
+        resume: bool,
+        raw_output_path: Optional[str] = None
+    ) -> None:
+        """
+        스트리밍 CSV → CSV 교정 (청크마다 출력 파일에 이어 씀)
+
+        재개 시 출력 파일에 이미 기록된 행은 입력에서 건너뛰고,
+        마지막으로 처리 중이던 청크의 완료 행만 저널에서 복구함.
+        원본 출력 파일은 청크마다 출력 파일보다 먼저 기록하므로 중단 시 최대 한 청크 앞설 수 있고,
+        재개 시 출력 파일 행 수에 맞춰 잘라냄
+
+        Args:
+            input_path: 입력 CSV 경로
+            output_path: 출력 CSV 경로
+            chunksize: 청크 행 수
+            journal: 체크포인트 저널
+            resume: 이어서 실행 여부
+            raw_output_path: 후처리 전 모델 출력 CSV 경로 (None이면 저장하지 않음)
+
+        Raises:
+            ValueError: 재개 시 원본 출력 파일이 출력 파일보다 짧은 경우
+        """
+        start = self._count_output_rows(output_path, chunksize) if resume else 0
+        if raw_output_path is not None and start > 0:
+            self._truncate_raw_outputs(raw_output_path, start, chunksize)
+        done: Dict[int, dict] = {}
+        if journal is not None:
+            if resume:
+                done = journal.load(min_index=start)
+            else:
+                journal.reset()
+        print(f"Streaming: chunksize={chunksize}, resuming after {start} written rows")
+
+        written = start
+        total_calls = 0
+        retried = 0
+        write_header = start == 0
+
+        mode = "w" if start == 0 else "a"
+        try:
+            with open(output_path, mode, encoding="utf-8", newline="") as out, \
+                    (open(raw_output_path, mode, encoding="utf-8", newline="")
+                     if raw_output_path is not None else nullcontext()) as raw_out:
+                chunks = self.iter_input_chunks(input_path, chunksize, start)
+                for chunk_df in self.iter_generate(chunks, journal, done):
+                    # 청크 전체를 한 번에 기록하여 중단 시 부분 행이 남지 않도록 함
+                    if raw_out is not None:
+                        raw_out.write(
+                            raw_frame(chunk_df["err_sentence"], chunk_df["raw_sentence"])
+                            .to_csv(index=False, header=write_header)
+                        )
+                        raw_out.flush()
+                    out.write(chunk_df[OUTPUT_COLUMNS].to_csv(index=False, header=write_header))
+                    out.flush()
+                    write_header = False
+                    written += len(chunk_df)
+                    total_calls += sum(self.last_attempts)
+                    retried += sum(1 for attempts in self.last_attempts if attempts > 1)
+
+                if write_header:
+                    # 입력이 비어 있어도 헤더는 기록
+                    out.write(pd.DataFrame(columns=OUTPUT_COLUMNS).to_csv(index=False))
+                    if raw_out is not None:
+                        raw_out.write(raw_frame([], []).to_csv(index=False))
+        finally:
+            if journal is not None:
+                journal.close()
+
+        print(f"Wrote {written} rows to {output_path}")
+        if retried:
+            print(
+                f"Retries: {retried} rows needed more than one call "
+                f"({total_calls} calls total, budget {self.retry_policy.max_attempts}/row)"
+            )
+        self._print_run_stats([])
@@ -5,16 +5,31 @@
 from .lcs import (
     tokenize,
     lcs_table,
+    lcs_bit_rows,
     find_lcs,
+    find_lcs_reference,
+    find_lcs_linear,
     find_differences_with_offsets
 )
 
-from .evaluator import evaluate_correction
+from .evaluator import evaluate_correction, recall_precision, score_pair, score_rows
+from .golden_index import GoldenDiffIndex
+from .incremental import IncrementalEvaluator
+from .vocab import Vocabulary
 
 __all__ = [
     'tokenize',
     'lcs_table',
+    'lcs_bit_rows',
     'find_lcs',
+    'find_lcs_reference',
+    'find_lcs_linear',
     'find_differences_with_offsets',
-    'evaluate_correction'
+    'evaluate_correction',
+    'recall_precision',
+    'score_pair',
+    'score_rows',
+    'GoldenDiffIndex',
+    'IncrementalEvaluator',
+    'Vocabulary'
 ]
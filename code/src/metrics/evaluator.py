@@ -3,89 +3,237 @@
 Recall과 Precision 계산 로직 제공
 """
 
+import multiprocessing
 import pandas as pd
-from typing import Dict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
+from .golden_index import Differences, GoldenDiffIndex
 from .lcs import find_differences_with_offsets
+from .vocab import Vocabulary
 
 
-def evaluate_correction(true_df: pd.DataFrame, pred_df: pd.DataFrame, n_samples: int = 5) -> Dict:
-    """교정 결과 평가 및 점수 계산"""
-    total_tp = 0
-    total_fp = 0
-    total_fm = 0
-    total_fr = 0
-    
-    # 결과 분석을 위한 DataFrame 생성
-    analysis_data = []
-    
-    for i in range(len(true_df)):
-        sample = {
-            'original': true_df.iloc[i]['err_sentence'],
-            'golden': true_df.iloc[i]['cor_sentence'],
-            'prediction': pred_df.iloc[i]['cor_sentence']
-        }
-        
-        # 각 샘플별 점수 계산
-        differences_og = find_differences_with_offsets(sample['original'], sample['golden'])
-        differences_op = find_differences_with_offsets(sample['original'], sample['prediction'])
-        
-        og_idx = 0
-        op_idx = 0
-        tp = fp = fm = fr = 0
-        
-        while True:
-            if og_idx >= len(differences_og) and op_idx >= len(differences_op):
-                break
-            if og_idx >= len(differences_og):
-                fr += 1
-                op_idx += 1
-                continue
-            if op_idx >= len(differences_op):
-                fm += 1
-                og_idx += 1
-                continue
-            if differences_og[og_idx][2] == differences_op[op_idx][2]:
-                if differences_og[og_idx][1] == differences_op[op_idx][1]:
-                    tp += 1
-                else:
-                    fp += 1
-                og_idx += 1
-                op_idx += 1
-            elif differences_og[og_idx][2] < differences_op[op_idx][2]:
-                fm += 1
-                og_idx += 1
-            elif differences_og[og_idx][2] > differences_op[op_idx][2]:
-                fr += 1
-                op_idx += 1
-        
-        # 분석 데이터에 추가 (개별 샘플별 세부 점수)
-        analysis_data.append({
-            'original': sample['original'],
-            'golden': sample['golden'],
-            'prediction': sample['prediction'],
-            'tp': tp,
-            'fp': fp,
-            'fm': fm,
-            'fr': fr
-        })
-        
-        total_tp += tp
-        total_fp += fp
-        total_fm += fm
-        total_fr += fr
-    
+def score_differences(
+    differences_og: Differences,
+    differences_op: Differences
+) -> Tuple[int, int, int, int]:
+    """
+    원문→정답, 원문→예측 차이점을 시작 오프셋 순으로 맞춰 보며 집계
+
+    Args:
+        differences_og: 원문→정답 차이점
+        differences_op: 원문→예측 차이점
+
+    Returns:
+        Tuple[int, int, int, int]: (tp, fp, fm, fr)
+    """
+    n_og = len(differences_og)
+    n_op = len(differences_op)
+
+    og_idx = 0
+    op_idx = 0
+    tp = fp = fm = fr = 0
+
+    while og_idx < n_og and op_idx < n_op:
+        og = differences_og[og_idx]
+        op = differences_op[op_idx]
+        if og[2] == op[2]:
+            if og[1] == op[1]:
+                tp += 1
+            else:
+                fp += 1
+            og_idx += 1
+            op_idx += 1
+        elif og[2] < op[2]:
+            fm += 1
+            og_idx += 1
+        else:
+            fr += 1
+            op_idx += 1
+
+    # 한쪽이 먼저 끝나면 나머지는 모두 누락(fm) 또는 과잉(fr)
+    fm += n_og - og_idx
+    fr += n_op - op_idx
+    return tp, fp, fm, fr
+
+
+def score_pair(
+    original: str,
+    golden: str,
+    prediction: str,
+    vocab: Optional[Vocabulary] = None
+) -> Tuple[int, int, int, int]:
+    """
+    샘플 하나의 점수 계산
+
+    Args:
+        original: 원문
+        golden: 정답 교정문
+        prediction: 예측 교정문
+        vocab: 토큰 ID 어휘 (None이면 호출마다 생성)
+
+    Returns:
+        Tuple[int, int, int, int]: (tp, fp, fm, fr)
+    """
+    return score_differences(
+        find_differences_with_offsets(original, golden, vocab),
+        find_differences_with_offsets(original, prediction, vocab)
+    )
+
+
+def score_rows(
+    originals: List[str],
+    goldens: List[str],
+    predictions: List[str],
+    golden_differences: Optional[List[Differences]] = None
+) -> List[Tuple[int, int, int, int]]:
+    """
+    여러 샘플 점수 계산 (프로세스 풀 작업 단위)
+
+    Args:
+        originals: 원문 리스트
+        goldens: 정답 교정문 리스트
+        predictions: 예측 교정문 리스트
+        golden_differences: 미리 계산한 원문→정답 차이점 (None이면 행마다 계산)
+
+    Returns:
+        List[Tuple[int, int, int, int]]: 행별 (tp, fp, fm, fr)
+    """
+    # 작업 단위(샤드)마다 어휘 하나를 공유하여 반복되는 토큰은 한 번만 등록
+    vocab = Vocabulary()
+    if golden_differences is None:
+        return [score_pair(o, g, p, vocab) for o, g, p in zip(originals, goldens, predictions)]
+    return [
+        score_differences(differences_og, find_differences_with_offsets(o, p, vocab))
+        for o, p, differences_og in zip(originals, predictions, golden_differences)
+    ]
+
+
+def _score_parallel(
+    originals: List[str],
+    goldens: List[str],
+    predictions: List[str],
+    golden_differences: Optional[List[Differences]],
+    workers: int
+) -> List[Tuple[int, int, int, int]]:
+    """
+    행을 연속 구간으로 나눠 프로세스 풀에서 점수 계산 후 원래 순서로 병합
+
+    작업자당 여러 구간을 두어 문장 길이 편차에 따른 부하 불균형을 줄임.
+    생성기/스텁 서버 등 스레드가 떠 있는 프로세스에서 fork하면 교착될 수 있어 spawn 사용
+    """
+    n_shards = min(len(originals), workers * 4)
+    bounds = [len(originals) * k // n_shards for k in range(n_shards + 1)]
+    shards = [slice(bounds[k], bounds[k + 1]) for k in range(n_shards)]
+
+    scores: List[Tuple[int, int, int, int]] = []
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        # map은 제출 순서대로 결과를 반환하므로 병합 결과가 결정적임
+        for shard_scores in executor.map(
+            score_rows,
+            [originals[shard] for shard in shards],
+            [goldens[shard] for shard in shards],
+            [predictions[shard] for shard in shards],
+            [golden_differences[shard] if golden_differences is not None else None for shard in shards]
+        ):
+            scores.extend(shard_scores)
+    return scores
+
+
+def recall_precision(tp: int, fp: int, fm: int, fr: int) -> Tuple[float, float]:
+    """
+    전체 집계로 Recall, Precision 계산 (분모가 0이면 0.0)
+
+    Args:
+        tp: 정확한 교정 수
+        fp: 위치는 맞지만 잘못된 교정 수
+        fm: 누락된 교정 수
+        fr: 불필요한 교정 수
+
+    Returns:
+        Tuple[float, float]: (recall, precision) 백분율
+    """
+    recall = tp / (tp + fp + fm) * 100 if (tp + fp + fm) > 0 else 0.0
+    precision = tp / (tp + fp + fr) * 100 if (tp + fp + fr) > 0 else 0.0
+    return recall, precision
+
+
+def evaluate_correction(
+    true_df: pd.DataFrame,
+    pred_df: pd.DataFrame,
+    n_samples: int = 5,
+    workers: int = 1,
+    golden_index: Optional[GoldenDiffIndex] = None
+) -> Dict:
+    """
+    교정 결과 평가 및 점수 계산
+
+    Args:
+        true_df: 정답 (err_sentence, cor_sentence)
+        pred_df: 예측 (cor_sentence)
+        n_samples: 사용하지 않음 (호환성 유지)
+        workers: 점수 계산 프로세스 수 (1이면 현재 프로세스에서 순차 계산)
+        golden_index: 미리 계산한 원문→정답 차이점 인덱스 (None이면 행마다 계산)
+
+    Returns:
+        Dict: recall, precision, 전체 TP/FP/FM/FR, analysis_df
+
+    Raises:
+        ValueError: workers가 1 미만, 예측 행 부족, 또는 golden_index가 true_df와 다른 경우
+    """
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1 (got {workers})")
+
+    # 행마다 iloc으로 Series를 만들지 않도록 컬럼을 한 번에 리스트로 변환
+    originals = true_df['err_sentence'].tolist()
+    goldens = true_df['cor_sentence'].tolist()
+    predictions = pred_df['cor_sentence'].tolist()
+    if len(predictions) < len(originals):
+        raise ValueError(
+            f"Prediction DF has fewer rows than truth DF ({len(predictions)} < {len(originals)})"
+        )
+    predictions = predictions[:len(originals)]
+
+    golden_differences = None
+    if golden_index is not None:
+        if not golden_index.matches(originals, goldens):
+            raise ValueError("golden_index was built from a different dataset")
+        golden_differences = golden_index.differences
+
+    if workers > 1 and len(originals) > workers:
+        scores = _score_parallel(originals, goldens, predictions, golden_differences, workers)
+    else:
+        scores = score_rows(originals, goldens, predictions, golden_differences)
+
+    tps = [score[0] for score in scores]
+    fps = [score[1] for score in scores]
+    fms = [score[2] for score in scores]
+    frs = [score[3] for score in scores]
+
+    total_tp = sum(tps)
+    total_fp = sum(fps)
+    total_fm = sum(fms)
+    total_fr = sum(frs)
+
     # 전체 점수 계산
-    recall = total_tp / (total_tp + total_fp + total_fm) * 100 if (total_tp + total_fp + total_fm) > 0 else 0.0
-    precision = total_tp / (total_tp + total_fp + total_fr) * 100 if (total_tp + total_fp + total_fr) > 0 else 0.0
+    recall, precision = recall_precision(total_tp, total_fp, total_fm, total_fr)
     
     # 샘플 출력
     print("=== 평가 결과 ===")
     print(f"Recall: {recall:.2f}%")
     print(f"Precision: {precision:.2f}%\n")
     
-    # 분석용 DataFrame 생성
-    analysis_df = pd.DataFrame(analysis_data)
+    # 분석용 DataFrame 생성 (개별 샘플별 세부 점수, 컬럼 단위로 한 번에 구성)
+    analysis_df = pd.DataFrame({
+        'original': originals,
+        'golden': goldens,
+        'prediction': predictions,
+        'tp': tps,
+        'fp': fps,
+        'fm': fms,
+        'fr': frs
+    })
     
     return {
         'recall': recall,
@@ -0,0 +1,203 @@
+"""
+정답 차이점(golden diff) 인덱스 모듈
+
+정답 데이터(원문, 정답 교정문)는 프롬프트 실험 사이에 바뀌지 않으므로
+원문→정답 차이점을 한 번만 계산해 데이터셋 내용 해시를 키로 디스크에 저장하고,
+이후 평가에서는 예측 쪽 차이점만 계산하도록 함
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import pandas as pd
+
+from .lcs import find_differences_with_offsets
+from .vocab import Vocabulary
+
+
+# (원문 구간, 교정 구간, 원문 시작, 원문 끝, 교정 시작, 교정 끝)
+Difference = Tuple[str, str, int, int, int, int]
+Differences = List[Difference]
+
+
+class GoldenDiffIndex:
+    """
+    데이터셋별 원문→정답 차이점 인덱스
+
+    - dataset_hash: (원문, 정답) 행 목록과 인덱스 형식 버전의 SHA-256
+    - differences: 행별 find_differences_with_offsets(원문, 정답) 결과
+    """
+
+    # 차이점 계산 방식이나 저장 형식이 바뀌면 올려서 기존 인덱스를 무효화
+    VERSION = 1
+
+    def __init__(self, dataset_hash: str, differences: List[Differences]):
+        """
+        인덱스 초기화
+
+        Args:
+            dataset_hash: hash_dataset() 결과
+            differences: 행별 원문→정답 차이점
+        """
+        self.dataset_hash = dataset_hash
+        self.differences = differences
+
+    def __len__(self) -> int:
+        return len(self.differences)
+
+    @classmethod
+    def hash_dataset(cls, originals: List[str], goldens: List[str]) -> str:
+        """
+        데이터셋 내용 해시
+
+        NaN(빈 셀)과 문자열 'nan'은 토큰화 결과가 다르므로 구분하여 해시함
+
+        Args:
+            originals: 원문 리스트
+            goldens: 정답 교정문 리스트
+
+        Returns:
+            str: SHA-256 hex digest
+        """
+        digest = hashlib.sha256(f"golden-diff-v{cls.VERSION}\n".encode("utf-8"))
+        for original, golden in zip(originals, goldens):
+            row = [None if pd.isna(original) else str(original),
+                   None if pd.isna(golden) else str(golden)]
+            digest.update(json.dumps(row, ensure_ascii=False).encode("utf-8"))
+            digest.update(b"\n")
+        digest.update(str(len(originals)).encode("utf-8"))
+        return digest.hexdigest()
+
+    @classmethod
+    def build(cls, originals: List[str], goldens: List[str]) -> "GoldenDiffIndex":
+        """
+        인덱스 계산
+
+        Args:
+            originals: 원문 리스트
+            goldens: 정답 교정문 리스트
+
+        Returns:
+            GoldenDiffIndex: 새 인덱스
+        """
+        vocab = Vocabulary()
+        differences = [
+            find_differences_with_offsets(original, golden, vocab)
+            for original, golden in zip(originals, goldens)
+        ]
+        return cls(cls.hash_dataset(originals, goldens), differences)
+
+    def matches(self, originals: List[str], goldens: List[str]) -> bool:
+        """
+        주어진 데이터셋으로 만든 인덱스인지 확인
+
+        Args:
+            originals: 원문 리스트
+            goldens: 정답 교정문 리스트
+
+        Returns:
+            bool: 해시 일치 여부
+        """
+        return len(originals) == len(self) and self.hash_dataset(originals, goldens) == self.dataset_hash
+
+    def save(self, path: str) -> None:
+        """
+        JSON 파일로 저장 (임시 파일에 쓴 뒤 교체하여 중단 시에도 손상되지 않음)
+
+        Args:
+            path: 저장 경로
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": self.VERSION,
+                    "dataset_hash": self.dataset_hash,
+                    "differences": self.differences,
+                },
+                f,
+                ensure_ascii=False,
+            )
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: str) -> "GoldenDiffIndex":
+        """
+        JSON 파일에서 읽기
+
+        Args:
+            path: 저장 경로
+
+        Returns:
+            GoldenDiffIndex: 저장된 인덱스
+
+        Raises:
+            ValueError: 형식 버전이 다른 경우
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+
+        if payload.get("version") != cls.VERSION:
+            raise ValueError(
+                f"Golden diff index {path} has version {payload.get('version')} (expected {cls.VERSION})"
+            )
+
+        differences = [[tuple(d) for d in row] for row in payload["differences"]]
+        return cls(payload["dataset_hash"], differences)
+
+    @classmethod
+    def load_or_build(
+        cls,
+        originals: List[str],
+        goldens: List[str],
+        cache_dir: str
+    ) -> "GoldenDiffIndex":
+        """
+        캐시 디렉토리에 같은 데이터셋의 인덱스가 있으면 읽고, 없으면 계산 후 저장
+
+        Args:
+            originals: 원문 리스트
+            goldens: 정답 교정문 리스트
+            cache_dir: 인덱스 저장 디렉토리 ('<hash>.json' 파일)
+
+        Returns:
+            GoldenDiffIndex: 데이터셋 인덱스
+        """
+        path = Path(cache_dir) / f"{cls.hash_dataset(originals, goldens)}.json"
+        if path.exists():
+            try:
+                index = cls.load(str(path))
+            except (ValueError, KeyError, json.JSONDecodeError):
+                index = None
+            if index is not None and len(index) == len(originals):
+                return index
+
+        index = cls.build(originals, goldens)
+        index.save(str(path))
+        return index
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        true_df: pd.DataFrame,
+        cache_dir: Optional[str] = None
+    ) -> "GoldenDiffIndex":
+        """
+        정답 데이터프레임에서 인덱스 생성
+
+        Args:
+            true_df: 정답 데이터 (err_sentence, cor_sentence)
+            cache_dir: 인덱스 저장 디렉토리 (None이면 저장하지 않고 계산만 함)
+
+        Returns:
+            GoldenDiffIndex: 데이터셋 인덱스
+        """
+        originals = true_df["err_sentence"].tolist()
+        goldens = true_df["cor_sentence"].tolist()
+        if cache_dir is None:
+            return cls.build(originals, goldens)
+        return cls.load_or_build(originals, goldens, cache_dir)
@@ -0,0 +1,206 @@
+"""
+증분 평가 모듈
+
+후처리 규칙만 바꾸는 반복 실험에서는 예측 문장의 일부만 바뀌므로,
+행별 (예측 → 점수)를 보관해 두고 바뀐 행만 다시 채점한 뒤
+전체 TP/FP/FM/FR 합계를 차분으로 갱신함
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from .evaluator import _score_parallel, recall_precision, score_differences
+from .golden_index import GoldenDiffIndex
+from .lcs import find_differences_with_offsets
+from .vocab import Vocabulary
+
+
+Score = Tuple[int, int, int, int]
+
+# 아직 채점하지 않은 행 표시 (None/NaN 예측과 구분)
+_UNSCORED = object()
+
+
+def _same_prediction(new: object, old: object) -> bool:
+    """직전 예측과 같은지 (NaN/None 예측끼리도 같음으로 봄)"""
+    if old is _UNSCORED:
+        return False
+    if pd.isna(new) or pd.isna(old):
+        return bool(pd.isna(new) and pd.isna(old))
+    return new == old
+
+
+def _cache_key(index: int, prediction: object) -> Tuple[int, object]:
+    """(행, 예측) 캐시 키 (NaN은 객체마다 서로 다르므로 None으로 통일)"""
+    return index, None if pd.isna(prediction) else prediction
+
+
+class IncrementalEvaluator:
+    """
+    정답 데이터 하나에 대해 여러 예측을 반복 채점하는 증분 평가기
+
+    - 원문→정답 차이점은 생성 시 한 번만 계산 (또는 GoldenDiffIndex 재사용)
+    - (행, 예측) → 점수 캐시: 이전에 본 예측으로 되돌아가도 다시 계산하지 않음
+    - update()는 마지막 예측과 다른 행만 채점하고 합계를 차분 갱신 (workers > 1이면 바뀐 행을 프로세스 풀에서 채점)
+    """
+
+    def __init__(
+        self,
+        true_df: pd.DataFrame,
+        golden_index: Optional[GoldenDiffIndex] = None,
+        max_cache_entries: Optional[int] = 1_000_000
+    ):
+        """
+        증분 평가기 초기화
+
+        Args:
+            true_df: 정답 데이터 (err_sentence, cor_sentence)
+            golden_index: 미리 계산한 원문→정답 차이점 (None이면 새로 계산)
+            max_cache_entries: (행, 예측) 점수 캐시 최대 항목 수
+                (넘으면 캐시와 토큰 어휘를 함께 비움, None이면 무제한)
+
+        Raises:
+            ValueError: 컬럼이 없거나 golden_index가 true_df와 다른 경우
+        """
+        if not {"err_sentence", "cor_sentence"}.issubset(true_df.columns):
+            raise ValueError(
+                f"Truth DF must have columns 'err_sentence' and 'cor_sentence' (found: {list(true_df.columns)})"
+            )
+
+        self.originals = true_df["err_sentence"].tolist()
+        self.goldens = true_df["cor_sentence"].tolist()
+        if golden_index is None:
+            golden_index = GoldenDiffIndex.build(self.originals, self.goldens)
+        elif not golden_index.matches(self.originals, self.goldens):
+            raise ValueError("golden_index was built from a different dataset")
+        self.golden_differences = golden_index.differences
+        self.vocab = Vocabulary()
+
+        self.max_cache_entries = max_cache_entries
+        self._cache: Dict[Tuple[int, str], Score] = {}
+        self._predictions: List[object] = [_UNSCORED] * len(self.originals)
+        self._scores: List[Score] = [(0, 0, 0, 0)] * len(self.originals)
+        self._totals = [0, 0, 0, 0]
+        self.last_changed_rows = 0
+
+    def __len__(self) -> int:
+        return len(self.originals)
+
+    def _store(self, key: Tuple[int, object], score: Score) -> None:
+        """점수 캐시에 저장"""
+        if self.max_cache_entries is not None and len(self._cache) >= self.max_cache_entries:
+            # 캐시가 차면 어휘와 함께 비움 (ID는 호출 안에서만 비교하므로 새 어휘로 시작해도 점수는 같음).
+            # 항목 하나씩 제거하면 어휘는 지나간 예측의 토큰까지 계속 쌓임
+            self._cache.clear()
+            self.vocab = Vocabulary()
+        self._cache[key] = score
+
+    def _score_row(self, index: int, prediction: str) -> Score:
+        """행 하나 채점 (캐시 우선)"""
+        key = _cache_key(index, prediction)
+        score = self._cache.get(key)
+        if score is None:
+            score = score_differences(
+                self.golden_differences[index],
+                find_differences_with_offsets(self.originals[index], prediction, self.vocab)
+            )
+            self._store(key, score)
+        return score
+
+    def _prefetch(self, rows: List[int], predictions: Sequence[str], workers: int) -> None:
+        """캐시에 없는 바뀐 행을 프로세스 풀에서 미리 채점"""
+        rows = [index for index in rows if _cache_key(index, predictions[index]) not in self._cache]
+        if len(rows) <= workers:
+            return
+        scores = _score_parallel(
+            [self.originals[index] for index in rows],
+            [self.goldens[index] for index in rows],
+            [predictions[index] for index in rows],
+            [self.golden_differences[index] for index in rows],
+            workers
+        )
+        for index, score in zip(rows, scores):
+            self._store(_cache_key(index, predictions[index]), score)
+
+    def update(self, predictions: Sequence[str], workers: int = 1) -> Dict:
+        """
+        새 예측으로 채점 (마지막 예측과 다른 행만 다시 계산)
+
+        Args:
+            predictions: 행별 예측 교정문 (리스트, Series 또는 cor_sentence 컬럼을 가진 DataFrame)
+            workers: 바뀐 행을 채점할 프로세스 수 (1이면 현재 프로세스에서 순차 계산)
+
+        Returns:
+            Dict: recall, precision, true_positives, false_positives,
+                false_missings, false_redundants, changed_rows
+
+        Raises:
+            ValueError: workers가 1 미만이거나 예측 행 수가 정답과 다른 경우
+        """
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1 (got {workers})")
+        if isinstance(predictions, pd.DataFrame):
+            predictions = predictions["cor_sentence"]
+        if isinstance(predictions, pd.Series):
+            predictions = predictions.tolist()
+        if len(predictions) != len(self.originals):
+            raise ValueError(
+                f"Length mismatch: truth={len(self.originals)} vs pred={len(predictions)}"
+            )
+
+        changed = [
+            index for index, prediction in enumerate(predictions)
+            if not _same_prediction(prediction, self._predictions[index])
+        ]
+        if workers > 1:
+            self._prefetch(changed, predictions, workers)
+
+        totals = self._totals
+        for index in changed:
+            prediction = predictions[index]
+            old = self._scores[index]
+            new = self._score_row(index, prediction)
+            for k in range(4):
+                totals[k] += new[k] - old[k]
+            self._scores[index] = new
+            self._predictions[index] = prediction
+
+        self.last_changed_rows = len(changed)
+        return self.result()
+
+    def result(self) -> Dict:
+        """
+        현재 합계 기준 점수
+
+        Returns:
+            Dict: recall, precision, 전체 TP/FP/FM/FR, changed_rows
+        """
+        tp, fp, fm, fr = self._totals
+        recall, precision = recall_precision(tp, fp, fm, fr)
+        return {
+            "recall": recall,
+            "precision": precision,
+            "true_positives": tp,
+            "false_positives": fp,
+            "false_missings": fm,
+            "false_redundants": fr,
+            "changed_rows": self.last_changed_rows,
+        }
+
+    def analysis_df(self) -> pd.DataFrame:
+        """
+        마지막 예측 기준 행별 분석 데이터프레임 (evaluate_correction의 analysis_df와 같은 형식)
+
+        Returns:
+            pd.DataFrame: original, golden, prediction, tp, fp, fm, fr
+        """
+        return pd.DataFrame({
+            "original": self.originals,
+            "golden": self.goldens,
+            "prediction": [None if p is _UNSCORED else p for p in self._predictions],
+            "tp": [score[0] for score in self._scores],
+            "fp": [score[1] for score in self._scores],
+            "fm": [score[2] for score in self._scores],
+            "fr": [score[3] for score in self._scores],
+        })
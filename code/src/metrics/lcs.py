@@ -2,8 +2,18 @@
 최장 공통 부분수열(LCS) 기반 텍스트 차이점 검출 모듈
 """
 
+import math
+
 import pandas as pd
-from typing import List, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from .vocab import Vocabulary
+
+# LCS 커널 입력 토큰 (문자열 또는 Vocabulary가 부여한 정수 ID)
+Token = Union[str, int]
+
+# 원문+교정문 토큰 수가 이를 넘으면 find_lcs_linear로 전환 (문단 단위 평가의 메모리 급증 방지)
+LINEAR_LCS_THRESHOLD = 4000
 
 
 def tokenize(text: str) -> List[str]:
@@ -29,8 +39,8 @@ def lcs_table(X: List[str], Y: List[str]) -> List[List[int]]:
     return L
 
 
-def find_lcs(X: List[str], Y: List[str]) -> List[str]:
-    """최장 공통 부분수열(LCS) 찾기"""
+def find_lcs_reference(X: List[str], Y: List[str]) -> List[str]:
+    """최장 공통 부분수열(LCS) 찾기 - lcs_table 기반 원본 구현 (검증용)"""
     L = lcs_table(X, Y)
     i = len(X)
     j = len(Y)
@@ -47,33 +57,191 @@ def find_lcs(X: List[str], Y: List[str]) -> List[str]:
     return lcs[::-1]
 
 
-def find_differences_with_offsets(original: str, corrected: str) -> List[Tuple[str, str, int, int, int, int]]:
-    """원문과 교정문 간의 차이점 찾기"""
+def _match_masks(Y: Sequence[Token]) -> Dict[Token, int]:
+    """토큰별 Y 내 출현 위치 비트마스크 (j번째 토큰 → j번 비트)"""
+    masks: Dict[Token, int] = {}
+    for j, token in enumerate(Y):
+        masks[token] = masks.get(token, 0) | (1 << j)
+    return masks
+
+
+def lcs_bit_rows(X: Sequence[Token], Y: Sequence[Token]) -> List[int]:
+    """
+    비트 병렬 LCS 행 벡터 계산 (Allison-Dix / Hyyrö)
+
+    행 i의 벡터 V_i에서 0인 비트는 L[i][j] - L[i][j-1] = 1인 열을 나타내므로
+    L[i][j] = j - popcount(V_i & (2^j - 1)) 로 lcs_table의 모든 값을 복원할 수 있음.
+    행 하나를 파이썬 정수 연산 몇 번으로 계산하여 O(m * n / 워드 크기) 시간에 동작
+
+    Args:
+        X: 원문 토큰
+        Y: 교정문 토큰
+
+    Returns:
+        List[int]: V_0 ~ V_m (길이 m + 1)
+    """
+    return _bit_rows(X, _match_masks(Y), (1 << len(Y)) - 1, (1 << len(Y)) - 1)
+
+
+def _bit_rows(X: Sequence[Token], masks: Dict[Token, int], full: int, V: int) -> List[int]:
+    """V에서 시작해 X의 각 토큰을 반영한 행 벡터 목록 (시작 벡터 포함)"""
+    rows = [V]
+    for token in X:
+        U = V & masks.get(token, 0)
+        V = ((V + U) | (V - U)) & full
+        rows.append(V)
+    return rows
+
+
+def _backtrack(
+    X: Sequence[Token],
+    Y: Sequence[Token],
+    rows: List[int],
+    base: int,
+    i: int,
+    j: int,
+    lcs: List[Token]
+) -> Tuple[int, int]:
+    """
+    행 base ~ i 구간 역추적 (rows[k]는 V_(base + k)), lcs에 역순으로 추가
+
+    find_lcs_reference와 같은 순서로 대각선 → 위(L[i-1][j] > L[i][j-1]) → 왼쪽을 선택
+
+    Returns:
+        Tuple[int, int]: 구간을 벗어난 위치 (i == base 또는 j == 0)
+    """
+    while i > base and j > 0:
+        if X[i-1] == Y[j-1]:
+            lcs.append(X[i-1])
+            i -= 1
+            j -= 1
+            continue
+        low = (1 << (j - 1)) - 1
+        up = j - (rows[i-1-base] & (low | (1 << (j - 1)))).bit_count()
+        left = (j - 1) - (rows[i-base] & low).bit_count()
+        if up > left:
+            i -= 1
+        else:
+            j -= 1
+    return i, j
+
+
+def find_lcs(X: Sequence[Token], Y: Sequence[Token]) -> List[Token]:
+    """
+    최장 공통 부분수열(LCS) 찾기
+
+    lcs_bit_rows로 테이블 값을 복원하며 find_lcs_reference와 같은 순서로 역추적하므로
+    동일한 LCS를 반환함 (동점일 때 선택하는 토큰까지 같음)
+    """
+    lcs: List[Token] = []
+    _backtrack(X, Y, lcs_bit_rows(X, Y), 0, len(X), len(Y), lcs)
+    return lcs[::-1]
+
+
+def find_lcs_linear(X: Sequence[Token], Y: Sequence[Token], block: Optional[int] = None) -> List[Token]:
+    """
+    저메모리 최장 공통 부분수열(LCS) 찾기 (긴 문단용)
+
+    Hirschberg 분할 정복은 동점일 때 다른 LCS를 고를 수 있어 차이점 결과가 달라지므로,
+    대신 block 행마다 비트 벡터만 체크포인트로 보관하고 역추적 시 구간별로 다시 계산함.
+    메모리 O(sqrt(m) * n) 비트, 시간은 find_lcs의 약 2배이며 find_lcs와 같은 LCS를 반환
+
+    Args:
+        X: 원문 토큰
+        Y: 교정문 토큰
+        block: 체크포인트 간격 (None이면 sqrt(m))
+
+    Returns:
+        List[Token]: LCS 토큰
+    """
+    m = len(X)
+    block = block or max(1, math.isqrt(m))
+    masks = _match_masks(Y)
+    full = (1 << len(Y)) - 1
+
+    # 전방 계산: block 행마다 체크포인트 보관
+    checkpoints = [full]
+    V = full
+    for i, token in enumerate(X, start=1):
+        U = V & masks.get(token, 0)
+        V = ((V + U) | (V - U)) & full
+        if i % block == 0:
+            checkpoints.append(V)
+
+    # 역추적: 마지막 구간부터 체크포인트에서 행을 다시 계산
+    lcs: List[Token] = []
+    i, j = m, len(Y)
+    while i > 0 and j > 0:
+        base = (i - 1) // block * block
+        rows = _bit_rows(X[base:i], masks, full, checkpoints[base // block])
+        i, j = _backtrack(X, Y, rows, base, i, j, lcs)
+    return lcs[::-1]
+
+
+def find_differences_with_offsets(
+    original: str,
+    corrected: str,
+    vocab: Optional[Vocabulary] = None
+) -> List[Tuple[str, str, int, int, int, int]]:
+    """
+    원문과 교정문 간의 차이점 찾기
+
+    토큰을 정수 ID로 바꿔 LCS와 구간 탐색을 수행하고, 결과는 원래 토큰 문자열로 돌려줌.
+    토큰 수가 LINEAR_LCS_THRESHOLD를 넘으면 저메모리 LCS 사용
+
+    Args:
+        original: 원문
+        corrected: 교정문
+        vocab: 토큰 ID 어휘 (데이터셋 단위로 공유하면 토큰 문자열이 한 번만 등록됨,
+            None이면 이 호출에서만 쓰는 어휘 생성)
+
+    Returns:
+        List[Tuple[str, str, int, int, int, int]]: (원문 구간, 교정 구간, 원문 시작, 원문 끝, 교정 시작, 교정 끝)
+    """
     original_tokens = tokenize(original)
     corrected_tokens = tokenize(corrected)
-    lcs = find_lcs(original_tokens, corrected_tokens)
-    
+    if original_tokens == corrected_tokens:
+        # 변경 없는 문장 (평가 데이터의 상당수) - 차이점 없음
+        return []
+
+    if vocab is None:
+        vocab = Vocabulary()
+    original_ids = vocab.ids(original_tokens)
+    corrected_ids = vocab.ids(corrected_tokens)
+    if len(original_ids) + len(corrected_ids) > LINEAR_LCS_THRESHOLD:
+        lcs = find_lcs_linear(original_ids, corrected_ids)
+    else:
+        lcs = find_lcs(original_ids, corrected_ids)
+
+    n_orig = len(original_tokens)
+    n_corr = len(corrected_tokens)
+    n_lcs = len(lcs)
     orig_index = 0
     corr_index = 0
     lcs_index = 0
     differences = []
     
-    while orig_index < len(original_tokens) or corr_index < len(corrected_tokens):
-        orig_diff = []
-        corr_diff = []
+    while orig_index < n_orig or corr_index < n_corr:
         orig_start = orig_index
         corr_start = corr_index
         
-        while orig_index < len(original_tokens) and (lcs_index >= len(lcs) or original_tokens[orig_index] != lcs[lcs_index]):
-            orig_diff.append(original_tokens[orig_index])
-            orig_index += 1
-        while corr_index < len(corrected_tokens) and (lcs_index >= len(lcs) or corrected_tokens[corr_index] != lcs[lcs_index]):
-            corr_diff.append(corrected_tokens[corr_index])
-            corr_index += 1
+        if lcs_index < n_lcs:
+            common = lcs[lcs_index]
+            while orig_index < n_orig and original_ids[orig_index] != common:
+                orig_index += 1
+            while corr_index < n_corr and corrected_ids[corr_index] != common:
+                corr_index += 1
+        else:
+            orig_index = n_orig
+            corr_index = n_corr
             
-        if orig_diff or corr_diff:
-            differences.append((' '.join(orig_diff), ' '.join(corr_diff), orig_start, orig_index, corr_start, corr_index))
-        if lcs_index < len(lcs):
+        if orig_index > orig_start or corr_index > corr_start:
+            differences.append((
+                ' '.join(original_tokens[orig_start:orig_index]),
+                ' '.join(corrected_tokens[corr_start:corr_index]),
+                orig_start, orig_index, corr_start, corr_index
+            ))
+        if lcs_index < n_lcs:
             lcs_index += 1
             orig_index += 1
             corr_index += 1
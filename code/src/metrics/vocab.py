@@ -0,0 +1,86 @@
+"""
+토큰 ID 어휘 모듈
+
+데이터셋 단위로 토큰 문자열을 정수 ID로 인턴(intern)하여
+LCS 계산이 문자열 대신 정수 배열(array('i')) 위에서 동작하도록 함
+"""
+
+from array import array
+from typing import Dict, Iterable, List
+
+
+class Vocabulary:
+    """
+    토큰 ↔ 정수 ID 사전
+
+    처음 본 토큰에 순서대로 ID를 부여하며, 같은 토큰은 항상 같은 ID로 변환됨.
+    ID는 한 어휘 안에서만 의미가 있으므로 비교하는 두 문장은 같은 어휘로 인코딩해야 함
+    """
+
+    def __init__(self):
+        """어휘 초기화"""
+        self.token_to_id: Dict[str, int] = {}
+        self.tokens: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def __contains__(self, token: str) -> bool:
+        return token in self.token_to_id
+
+    def add(self, token: str) -> int:
+        """
+        토큰 ID 조회 (없으면 새로 부여)
+
+        Args:
+            token: 토큰 문자열
+
+        Returns:
+            int: 토큰 ID
+        """
+        return self.ids([token])[0]
+
+    def ids(self, tokens: List[str]) -> List[int]:
+        """
+        토큰 목록을 ID 리스트로 변환 (LCS 커널 입력용, 처음 본 토큰은 등록)
+
+        Args:
+            tokens: tokenize() 결과
+
+        Returns:
+            List[int]: 토큰 ID
+        """
+        token_to_id = self.token_to_id
+        known = len(token_to_id)
+        # setdefault는 새 토큰에 현재 크기(= 다음 ID)를 부여
+        ids = [token_to_id.setdefault(token, len(token_to_id)) for token in tokens]
+        if len(token_to_id) > known:
+            for token, token_id in zip(tokens, ids):
+                if token_id == len(self.tokens):
+                    self.tokens.append(token)
+        return ids
+
+    def encode(self, tokens: List[str]) -> array:
+        """
+        토큰 목록을 ID 배열로 변환 (보관용 압축 표현, 토큰당 4바이트)
+
+        Args:
+            tokens: tokenize() 결과
+
+        Returns:
+            array: 'i' 타입 정수 배열
+        """
+        return array('i', self.ids(tokens))
+
+    def decode(self, ids: Iterable[int]) -> List[str]:
+        """
+        ID 배열을 토큰 목록으로 변환
+
+        Args:
+            ids: 토큰 ID
+
+        Returns:
+            List[str]: 토큰 문자열
+        """
+        tokens = self.tokens
+        return [tokens[token_id] for token_id in ids]
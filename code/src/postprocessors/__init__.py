@@ -5,9 +5,21 @@
 from .base import BasePostprocessor
 from .enhanced_postprocessor import EnhancedPostprocessor
 from .minimal_rule import MinimalRulePostprocessor
+from .processing_log import ProcessingLog
+from .registry import PostprocessorChain, create_postprocessor, get_registry, list_postprocessors
+from .rule_engine import RuleSet
+from .rule_pack import ReloadingRulePack, RulePack
 
 __all__ = [
     "BasePostprocessor",
     "EnhancedPostprocessor",
-    "MinimalRulePostprocessor"
+    "MinimalRulePostprocessor",
+    "PostprocessorChain",
+    "ProcessingLog",
+    "ReloadingRulePack",
+    "RulePack",
+    "RuleSet",
+    "create_postprocessor",
+    "get_registry",
+    "list_postprocessors"
 ]
@@ -2,7 +2,20 @@
 후처리 기본 추상 클래스
 """
 
+import multiprocessing
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, List, Optional, Sequence, Tuple
+
+
+def _process_shard(
+    postprocessor: "BasePostprocessor",
+    originals: Sequence[str],
+    corrections: Sequence[str]
+) -> Tuple[List[str], Any]:
+    """워커 프로세스에서 구간 하나를 순차 처리 (모듈 수준 함수여야 pickle 가능)"""
+    results = postprocessor.process_batch(originals, corrections)
+    return results, postprocessor.batch_state()
 
 
 class BasePostprocessor(ABC):
@@ -35,3 +48,94 @@ class BasePostprocessor(ABC):
             str: 후처리된 텍스트 (실패 시 원문 반환)
         """
         pass
+
+    def process_batch(
+        self,
+        originals: Sequence[str],
+        corrections: Sequence[str],
+        workers: int = 1,
+        executor: Optional[Executor] = None
+    ) -> List[str]:
+        """
+        여러 (원문, 교정문) 쌍을 후처리
+
+        workers > 1 또는 executor가 주어지면 행을 연속 구간으로 나눠 프로세스 풀에서 처리하고
+        입력 순서대로 병합함 (후처리기 자체가 각 워커로 pickle되어 전달됨)
+
+        Args:
+            originals: 원문 리스트
+            corrections: 교정문 리스트
+            workers: 프로세스 수 (1이면 현재 프로세스에서 순차 처리)
+            executor: 재사용할 실행기 (반복 호출 시 프로세스 생성 비용 절약, workers보다 우선)
+
+        Returns:
+            List[str]: 행별 후처리 결과
+
+        Raises:
+            ValueError: 리스트 길이가 다르거나 workers가 1 미만인 경우
+        """
+        if len(originals) != len(corrections):
+            raise ValueError(
+                f"Length mismatch: originals={len(originals)} vs corrections={len(corrections)}"
+            )
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1 (got {workers})")
+
+        if executor is not None:
+            n_workers = getattr(executor, "_max_workers", workers)
+            return self._process_parallel(originals, corrections, executor, max(n_workers, 1))
+        if workers > 1 and len(originals) > workers:
+            # 스레드가 떠 있는 프로세스에서 fork하면 교착될 수 있어 spawn 사용
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                return self._process_parallel(originals, corrections, pool, workers)
+
+        return [self.process(original, corrected) for original, corrected in zip(originals, corrections)]
+
+    def _process_parallel(
+        self,
+        originals: Sequence[str],
+        corrections: Sequence[str],
+        executor: Executor,
+        workers: int
+    ) -> List[str]:
+        """
+        행을 연속 구간으로 나눠 실행기에서 처리 후 원래 순서로 병합
+
+        작업자당 여러 구간을 두어 문장 길이 편차에 따른 부하 불균형을 줄임
+        """
+        if not originals:
+            return []
+        n_shards = min(len(originals), workers * 4)
+        bounds = [len(originals) * k // n_shards for k in range(n_shards + 1)]
+        shards = [slice(bounds[k], bounds[k + 1]) for k in range(n_shards)]
+
+        results: List[str] = []
+        # map은 제출 순서대로 결과를 반환하므로 병합 결과가 결정적임
+        for shard_results, state in executor.map(
+            _process_shard,
+            [self] * n_shards,
+            [list(originals[shard]) for shard in shards],
+            [list(corrections[shard]) for shard in shards]
+        ):
+            results.extend(shard_results)
+            self.merge_batch_state(state)
+        return results
+
+    def batch_state(self) -> Any:
+        """
+        워커 프로세스에서 부모로 돌려보낼 상태 (예: 처리 로그)
+
+        Returns:
+            Any: merge_batch_state()에 전달할 값 (기본 None)
+        """
+        return None
+
+    def merge_batch_state(self, state: Any) -> None:
+        """
+        워커가 돌려보낸 상태를 반영 (구간 순서대로 호출됨)
+
+        Args:
+            state: batch_state() 결과
+        """
+        pass
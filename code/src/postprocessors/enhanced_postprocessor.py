@@ -12,15 +12,91 @@ Enhanced 후처리 모듈
 import re
 import logging
 import json
-from typing import Dict, List, Tuple, Optional
 from pathlib import Path
+from typing import Dict, List, Tuple, Optional
 
 from .base import BasePostprocessor
+from .rule_engine import RuleSet
+from .processing_log import ProcessingLog
+from .rule_pack import ReloadingRulePack
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
 
+# 메타데이터 화이트리스트: 정상 표현 (임시 보호, placeholder → 패턴)
+WHITELIST_PATTERNS = {
+    '__REF1__': r'참고할\s*(만하다|필요|가능)',
+    '__EXPL1__': r'설명(되기|하기)\s*(어렵|쉬|가능)',
+    '__REF2__': r'참고\s*문헌',
+    '__EXPL2__': r'설명\s*자료',
+}
+
+# 메타데이터 제거 규칙 (적용 순서대로)
+METADATA_RULES = [
+    # 패턴 1: ※ 문구 제거
+    {'name': '※문구', 'pattern': r'※[^\n]*', 'replacement': ''},
+    # 패턴 2: [...] 형태 레이블 제거
+    {'name': '[최종]', 'pattern': r'\[[^\]]*최종[^\]]*\]', 'replacement': ''},
+    {'name': '[시스템]', 'pattern': r'\[[^\]]*시스템[^\]]*\]', 'replacement': ''},
+    {'name': '[오류]', 'pattern': r'\[[^\]]*오류[^\]]*\]', 'replacement': ''},
+    {'name': '[답변]', 'pattern': r'\[[^\]]*답변[^\]]*\]', 'replacement': ''},
+    # 패턴 3: 컨텍스트 기반 메타데이터 키워드
+    # "지시사항을 따라", "규칙을 준수" 등 (단순 단어는 제외)
+    {'name': '지시사항 준수', 'pattern': r'지시사항[을를]?\s*(따라|준수)', 'replacement': '', 'flags': re.IGNORECASE},
+    {'name': '규칙 준수', 'pattern': r'규칙[을를]?\s*(따라|준수)', 'replacement': '', 'flags': re.IGNORECASE},
+    {'name': '원칙 N:', 'pattern': r'원칙\s*\d*\s*[:：]', 'replacement': '', 'flags': re.IGNORECASE},
+    {'name': '규칙 N:', 'pattern': r'규칙\s*\d*\s*[:：]', 'replacement': '', 'flags': re.IGNORECASE},
+    {'name': '수정 사항:', 'pattern': r'수정\s*사항\s*[:：]', 'replacement': '', 'flags': re.IGNORECASE},
+    {'name': '원칙 적용', 'pattern': r'원칙\s*적용', 'replacement': '', 'flags': re.IGNORECASE},
+    {'name': '원칙 준수', 'pattern': r'원칙\s*준수', 'replacement': '', 'flags': re.IGNORECASE},
+    {'name': '오류 재확인', 'pattern': r'오류\s*재확인', 'replacement': '', 'flags': re.IGNORECASE},
+    {'name': '요구사항 충족', 'pattern': r'요구사항\s*충족', 'replacement': '', 'flags': re.IGNORECASE},
+    {'name': '추가 설명 제공', 'pattern': r'추가.*설명[을를]?\s*제공', 'replacement': '', 'flags': re.IGNORECASE},
+    # 패턴 4: 연속된 "다" 제거 (오류 패턴)
+    {'name': '다[', 'pattern': r'다\[', 'replacement': ''},
+    {'name': '다최종', 'pattern': r'다최종', 'replacement': ''},
+    {'name': '다원칙', 'pattern': r'다원칙', 'replacement': ''},
+    # 패턴 5: "교정:", "수정:", "결과:" 등 레이블
+    {'name': '레이블', 'pattern': r'^(교정|수정|결과|답변|정답|최종)\s*[:：]\s*', 'replacement': '', 'flags': re.MULTILINE},
+]
+
+# 응답 정제: 괄호 안 설명문, 강조, 기타 설명 문구 제거 (적용 순서대로)
+RESPONSE_CLEANUP_RULES = [
+    {'name': '(※주참)', 'pattern': r'\s*\([※주참].+?\)', 'replacement': ''},
+    {'name': '(원문)', 'pattern': r'\s*\(원문.+?\)', 'replacement': ''},
+    {'name': '(수정)', 'pattern': r'\s*\(수정.+?\)', 'replacement': ''},
+    {'name': '(교정)', 'pattern': r'\s*\(교정.+?\)', 'replacement': ''},
+    {'name': '(예:)', 'pattern': r'\s*\(예:.+?\)', 'replacement': ''},
+    {'name': '**강조**', 'pattern': r'\*\*[^*]+\*\*', 'replacement': ''},
+    {'name': '수정 사항 없음', 'pattern': r'수정\s*사항\s*없음', 'replacement': '', 'flags': re.IGNORECASE},
+    {'name': '수정 불필요', 'pattern': r'수정\s*불필요', 'replacement': '', 'flags': re.IGNORECASE},
+    {'name': '교정 불필요', 'pattern': r'교정\s*불필요', 'replacement': '', 'flags': re.IGNORECASE},
+    {'name': '이미 정확', 'pattern': r'이미\s*정확', 'replacement': '', 'flags': re.IGNORECASE},
+]
+
+# 명확한 문법 규칙 기본 팩 ('되/돼' 활용, '안 돼', '-ㄹ 수 있다', 보조 용언 띄어쓰기, 적용 순서대로)
+DEFAULT_GRAMMAR_RULE_PACK = Path(__file__).parent / "rules" / "enhanced_grammar.json"
+
+# 단일 용도 패턴 (모듈 로드 시 한 번만 컴파일)
+_PAREN_REPEAT = re.compile(r'\.\s*\(\s*([^.!?]+)\.\s*\1')
+_SENTENCE_SPLIT = re.compile(r'([.!?])')
+_NORMALIZE_BRACKETS = re.compile(r'[\s()\[\]{}]')
+_NORMALIZE_SYMBOLS = re.compile(r'[※：:\-]')
+_RESPONSE_LABEL = re.compile(r'^(교정|수정|결과|답변|정답)\s*[:：]\s*', re.MULTILINE)
+_NUMBERED_LINE = re.compile(r'^\s*[\d\-\*\.]+\s+')
+_QUOTED = re.compile(r'^["\'「『](.*)["\'」』]$')
+_XML_TAG = re.compile(r'<[^>]+>')
+_NUMERIC_RATIO = re.compile(r'\d+\s*[：:]\s*\d+')
+_COLON_SPLIT = re.compile(r'\s*[：:]\s*')
+_WHITESPACE_RUN = re.compile(r'\s+')
+_WHITESPACE = re.compile(r'\s')
+_DECIMAL_PERCENT = re.compile(r'(\d+)\.\s+(\d+)%')
+_DECIMAL_HANGUL = re.compile(r'(\d+)\.\s+(\d+)([가-힣])')
+_NUMBER_UNIT = re.compile(r'\d+만?\s*[명개채대권원건명부곡분]')
+_RATIO_TIME = re.compile(r'\b\d+\s*:\s*\d+\b')
+
+
 class EnhancedPostprocessor(BasePostprocessor):
     """
     강화된 후처리 클래스
@@ -32,21 +108,72 @@ class EnhancedPostprocessor(BasePostprocessor):
     - 처리 전/후 로깅 (비교 분석용)
     """
 
-    def __init__(self, enable_logging: bool = True):
+    def __init__(
+        self,
+        enable_logging: bool = True,
+        grammar_rule_pack: Optional[str] = None,
+        rule_cache_dir: Optional[str] = None,
+        log_max_entries: Optional[int] = None,
+        log_sample_rate: float = 1.0,
+        log_path: Optional[str] = None
+    ):
         """
         Enhanced 후처리 초기화
 
         Args:
             enable_logging: 처리 전/후 로깅 활성화 여부
+            grammar_rule_pack: 문법 규칙 팩 JSON 경로 (None이면 기본 팩 rules/enhanced_grammar.json,
+                파일이 바뀌면 재시작 없이 다시 읽음)
+            rule_cache_dir: 규칙 팩 컴파일 아티팩트 캐시 디렉토리
+            log_max_entries: 메모리에 보관할 최근 처리 로그 수 (None이면 전체 보관, 긴 실행에서는 log_path와 함께 제한 권장)
+            log_sample_rate: 보관/기록할 처리 로그 비율 (요약 통계는 항상 전체 기준)
+            log_path: 처리 로그를 이어 쓸 JSONL 경로 (백그라운드 기록, None이면 쓰지 않음)
         """
         self.enable_logging = enable_logging
-        self.processing_log: List[Dict] = []
+        self.processing_log = ProcessingLog(
+            max_entries=log_max_entries,
+            sample_rate=log_sample_rate,
+            sink_path=log_path if enable_logging else None
+        )
+
+        # 규칙 표는 생성 시 한 번만 컴파일 (안전한 연속 리터럴 규칙은 단일 스캔으로 합침)
+        self.whitelist_patterns = [
+            (placeholder, re.compile(pattern))
+            for placeholder, pattern in WHITELIST_PATTERNS.items()
+        ]
+        self.metadata_rules = RuleSet(METADATA_RULES)
+        self.response_cleanup_rules = RuleSet(RESPONSE_CLEANUP_RULES)
+        self.grammar_rules = ReloadingRulePack(
+            grammar_rule_pack or DEFAULT_GRAMMAR_RULE_PACK, cache_dir=rule_cache_dir
+        )
 
     @property
     def name(self) -> str:
         """후처리 모듈 이름 반환"""
         return "enhanced"
 
+    def __getstate__(self) -> Dict:
+        """
+        process_batch 워커로 보낼 상태
+
+        워커에서는 파일 기록 없이 처리 로그 항목만 모아 batch_state()로 돌려보내고,
+        부모가 merge_batch_state()로 자신의 로그(집계, 샘플링, JSONL 기록)에 반영함
+        """
+        state = self.__dict__.copy()
+        state['processing_log'] = ProcessingLog(max_entries=None)
+        return state
+
+    def batch_state(self) -> Optional[List[Dict]]:
+        """워커에서 쌓인 처리 로그 항목"""
+        if not self.enable_logging:
+            return None
+        return list(self.processing_log)
+
+    def merge_batch_state(self, state: Optional[List[Dict]]) -> None:
+        """워커 처리 로그 항목을 순서대로 부모 로그에 추가"""
+        for entry in state or []:
+            self.processing_log.append(entry)
+
     def process(self, original: str, corrected: str) -> str:
         """
         Enhanced 후처리 수행
@@ -120,62 +247,18 @@ class EnhancedPostprocessor(BasePostprocessor):
         Returns:
             str: 메타데이터가 제거된 텍스트
         """
-        # 화이트리스트: 정상 표현 (임시 보호)
-        whitelist_patterns = {
-            '__REF1__': r'참고할\s*(만하다|필요|가능)',
-            '__EXPL1__': r'설명(되기|하기)\s*(어렵|쉬|가능)',
-            '__REF2__': r'참고\s*문헌',
-            '__EXPL2__': r'설명\s*자료',
-        }
-
-        # 임시 치환 (보호)
+        # 화이트리스트: 정상 표현 임시 치환 (보호)
         whitelist_backup = {}
-        for placeholder, pattern in whitelist_patterns.items():
-            matches = re.findall(pattern, text)
+        for placeholder, pattern in self.whitelist_patterns:
+            matches = pattern.findall(text)
             if matches:
                 # 첫 번째 매치를 문자열로 저장 (튜플인 경우 첫 요소)
                 first_match = matches[0] if isinstance(matches[0], str) else ''.join(matches[0])
-                text = re.sub(pattern, placeholder, text, count=1)
+                text = pattern.sub(placeholder, text, count=1)
                 whitelist_backup[placeholder] = first_match
 
-        # 패턴 1: ※ 문구 제거
-        text = re.sub(r'※[^\n]*', '', text)
-
-        # 패턴 2: [...] 형태 레이블 제거
-        text = re.sub(r'\[[^\]]*최종[^\]]*\]', '', text)
-        text = re.sub(r'\[[^\]]*시스템[^\]]*\]', '', text)
-        text = re.sub(r'\[[^\]]*오류[^\]]*\]', '', text)
-        text = re.sub(r'\[[^\]]*답변[^\]]*\]', '', text)
-
-        # 패턴 3: 컨텍스트 기반 메타데이터 키워드
-        # "지시사항을 따라", "규칙을 준수" 등 (단순 단어는 제외)
-        metadata_keywords = [
-            r'지시사항[을를]?\s*(따라|준수)',
-            r'규칙[을를]?\s*(따라|준수)',
-            r'원칙\s*\d*\s*[:：]',
-            r'규칙\s*\d*\s*[:：]',
-            r'수정\s*사항\s*[:：]',
-            r'원칙\s*적용',
-            r'원칙\s*준수',
-            r'오류\s*재확인',
-            r'요구사항\s*충족',
-            r'추가.*설명[을를]?\s*제공',
-        ]
-        for keyword in metadata_keywords:
-            text = re.sub(keyword, '', text, flags=re.IGNORECASE)
-
-        # 패턴 4: 연속된 "다" 제거 (오류 패턴)
-        text = re.sub(r'다\[', '', text)
-        text = re.sub(r'다최종', '', text)
-        text = re.sub(r'다원칙', '', text)
-
-        # 패턴 5: "교정:", "수정:", "결과:" 등 레이블
-        text = re.sub(
-            r'^(교정|수정|결과|답변|정답|최종)\s*[:：]\s*',
-            '',
-            text,
-            flags=re.MULTILINE
-        )
+        # 패턴 1~5: ※ 문구, [...] 레이블, 메타데이터 키워드, "다" 오류 패턴, 레이블
+        text = self.metadata_rules.apply(text)
 
         # 화이트리스트 복원
         for placeholder, original in whitelist_backup.items():
@@ -203,10 +286,10 @@ class EnhancedPostprocessor(BasePostprocessor):
         """
         # 1단계: 괄호로 시작하는 중복 패턴 제거
         # 예: "문장A. ( 문장A." → "문장A."
-        text = re.sub(r'\.\s*\(\s*([^.!?]+)\.\s*\1', r'. \1', text)
+        text = _PAREN_REPEAT.sub(r'. \1', text)
 
         # 2단계: 문장 분리 (마침표, 느낌표, 물음표 기준)
-        sentences = re.split(r'([.!?])', text)
+        sentences = _SENTENCE_SPLIT.split(text)
 
         # 문장과 구분자를 다시 결합
         combined_sentences = []
@@ -221,8 +304,8 @@ class EnhancedPostprocessor(BasePostprocessor):
 
         for sent in combined_sentences:
             # 정규화: 공백, 괄호, 특수문자 제거 후 비교
-            normalized = re.sub(r'[\s()\[\]{}]', '', sent)
-            normalized = re.sub(r'[※：:\-]', '', normalized)
+            normalized = _NORMALIZE_BRACKETS.sub('', sent)
+            normalized = _NORMALIZE_SYMBOLS.sub('', normalized)
 
             # 빈 문장은 건너뛰기
             if not normalized:
@@ -254,31 +337,26 @@ class EnhancedPostprocessor(BasePostprocessor):
             str: 정제된 텍스트
         """
         # 레이블 제거 (교정:, 수정:, 결과: 등)
-        text = re.sub(
-            r'^(교정|수정|결과|답변|정답)\s*[:：]\s*',
-            '',
-            text,
-            flags=re.MULTILINE
-        )
+        text = _RESPONSE_LABEL.sub('', text)
 
         # 번호 리스트 제거
         lines = text.split('\n')
         cleaned_lines = []
         for line in lines:
-            if not re.match(r'^\s*[\d\-\*\.]+\s+', line):
+            if not _NUMBERED_LINE.match(line):
                 cleaned_lines.append(line)
 
         text = '\n'.join(cleaned_lines)
 
         # 따옴표 제거
-        text = re.sub(r'^["\'「『](.*)["\'」』]$', r'\1', text.strip())
+        text = _QUOTED.sub(r'\1', text.strip())
 
         # XML/HTML 태그 제거
-        text = re.sub(r'<[^>]+>', '', text)
+        text = _XML_TAG.sub('', text)
 
         # "원문 : 교정문" 형식 처리
         if ':' in text or '：' in text:
-            if not re.search(r'\d+\s*[：:]\s*\d+', text):
+            if not _NUMERIC_RATIO.search(text):
                 colon_pos = text.find(':')
                 if colon_pos < 0:
                     colon_pos = text.find('：')
@@ -287,25 +365,12 @@ class EnhancedPostprocessor(BasePostprocessor):
                     before_colon = text[:colon_pos].strip()
                     keywords = ['원문', '교정', '수정', '결과', '답변', '정답']
                     if any(kw in before_colon for kw in keywords):
-                        parts = re.split(r'\s*[：:]\s*', text, maxsplit=1)
+                        parts = _COLON_SPLIT.split(text, maxsplit=1)
                         if len(parts) == 2:
                             text = parts[1]
 
-        # 괄호 안 설명문 제거
-        text = re.sub(r'\s*\([※주참].+?\)', '', text)
-        text = re.sub(r'\s*\(원문.+?\)', '', text)
-        text = re.sub(r'\s*\(수정.+?\)', '', text)
-        text = re.sub(r'\s*\(교정.+?\)', '', text)
-        text = re.sub(r'\s*\(예:.+?\)', '', text)
-
-        # ** 강조 문구 제거
-        text = re.sub(r'\*\*[^*]+\*\*', '', text)
-
-        # 기타 설명 문구 제거
-        text = re.sub(r'수정\s*사항\s*없음', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'수정\s*불필요', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'교정\s*불필요', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'이미\s*정확', '', text, flags=re.IGNORECASE)
+        # 괄호 안 설명문, ** 강조 문구, 기타 설명 문구 제거
+        text = self.response_cleanup_rules.apply(text)
 
         return text
 
@@ -319,39 +384,8 @@ class EnhancedPostprocessor(BasePostprocessor):
         Returns:
             str: 규칙이 적용된 텍스트
         """
-        # 규칙 1: '되/돼' 활용 규칙
-        text = re.sub(r'(?<![가-힣])되요(?![가-힣])', '돼요', text)
-        text = re.sub(r'(?<![가-힣])되서(?![가-힣])', '돼서', text)
-        text = re.sub(r'되여요', '돼요', text)
-        text = re.sub(r'되여서', '돼서', text)
-
-        # 규칙 2: '안 돼' 띄어쓰기
-        text = re.sub(r'안돼요', '안 돼요', text)
-        text = re.sub(r'안돼서', '안 돼서', text)
-        text = re.sub(r'안된다(?![가-힣])', '안 된다', text)
-        text = re.sub(r'안돼(?![가-힣])', '안 돼', text)
-
-        # 규칙 3: '-ㄹ 수 있다' 띄어쓰기
-        text = re.sub(r'([가-힣])수있다', r'\1 수 있다', text)
-        text = re.sub(r'([가-힣])수있어', r'\1 수 있어', text)
-        text = re.sub(r'([가-힣])수있어요', r'\1 수 있어요', text)
-        text = re.sub(r'([가-힣])수있습니다', r'\1 수 있습니다', text)
-        text = re.sub(r'([가-힣])수없다', r'\1 수 없다', text)
-        text = re.sub(r'([가-힣])수없어', r'\1 수 없어', text)
-        text = re.sub(r'([가-힣])수없어요', r'\1 수 없어요', text)
-        text = re.sub(r'([가-힣])수없습니다', r'\1 수 없습니다', text)
-
-        # 규칙 4: 보조 용언 띄어쓰기
-        text = re.sub(r'해보다(?![가-힣])', '해 보다', text)
-        text = re.sub(r'해보았', '해 보았', text)
-        text = re.sub(r'해보았다', '해 보았다', text)
-        text = re.sub(r'해보았어', '해 보았어', text)
-        text = re.sub(r'해봤', '해 봤', text)
-        text = re.sub(r'해봤다', '해 봤다', text)
-        text = re.sub(r'해봤어', '해 봤어', text)
-        text = re.sub(r'해봐요', '해 봐요', text)
-        text = re.sub(r'해봐(?![가-힣])', '해 봐', text)
-        text = re.sub(r'해보자', '해 보자', text)
+        # 규칙 1~4: '되/돼' 활용, '안 돼', '-ㄹ 수 있다', 보조 용언 띄어쓰기
+        text = self.grammar_rules.apply(text)
 
         return text
 
@@ -369,7 +403,7 @@ class EnhancedPostprocessor(BasePostprocessor):
         text = text.replace('\n', ' ')
 
         # 연속된 공백을 하나로
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RUN.sub(' ', text)
 
         # 앞뒤 공백 제거
         text = text.strip()
@@ -401,17 +435,13 @@ class EnhancedPostprocessor(BasePostprocessor):
         """
         # 패턴 0: 소수점 띄어쓰기 수정 (최우선)
         # "1. 4%" → "1.4%", "42. 67%" → "42.67%"
-        corrected = re.sub(r'(\d+)\.\s+(\d+)%', r'\1.\2%', corrected)
-        corrected = re.sub(r'(\d+)\.\s+(\d+)([가-힣])', r'\1.\2\3', corrected)
+        corrected = _DECIMAL_PERCENT.sub(r'\1.\2%', corrected)
+        corrected = _DECIMAL_HANGUL.sub(r'\1.\2\3', corrected)
 
         # 패턴 1: 숫자+단위 (예: 10만명, 186만명)
-        number_unit_pattern = r'\d+만?\s*[명개채대권원건명부곡분]'
-
-        # 원문에서 숫자+단위 추출
-        original_numbers = re.findall(number_unit_pattern, original)
-
-        # 교정문에서 숫자+단위 추출
-        corrected_numbers = re.findall(number_unit_pattern, corrected)
+        # 원문/교정문에서 숫자+단위 추출
+        original_numbers = _NUMBER_UNIT.findall(original)
+        corrected_numbers = _NUMBER_UNIT.findall(corrected)
 
         # 변경된 경우 원문으로 복원
         # (단, 개수가 다르면 복원하지 않음 - 실제 오류일 수 있음)
@@ -427,20 +457,16 @@ class EnhancedPostprocessor(BasePostprocessor):
 
         # 패턴 2: 비율/시간 (예: 7:3, 19:30)
         # 단, 소수점과 혼동하지 않도록 주의
-        ratio_time_pattern = r'\b\d+\s*:\s*\d+\b'
-
-        # 원문에서 비율/시간 추출
-        original_ratios = re.findall(ratio_time_pattern, original)
-
-        # 교정문에서 비율/시간 추출
-        corrected_ratios = re.findall(ratio_time_pattern, corrected)
+        # 원문/교정문에서 비율/시간 추출
+        original_ratios = _RATIO_TIME.findall(original)
+        corrected_ratios = _RATIO_TIME.findall(corrected)
 
         # 변경된 경우 원문으로 복원
         if len(original_ratios) == len(corrected_ratios):
             for orig, corr in zip(original_ratios, corrected_ratios):
                 # 원문과 교정문이 다른 경우만 복원
-                orig_norm = re.sub(r'\s', '', orig)
-                corr_norm = re.sub(r'\s', '', corr)
+                orig_norm = _WHITESPACE.sub('', orig)
+                corr_norm = _WHITESPACE.sub('', corr)
                 if orig_norm != corr_norm:
                     logger.info(f"Restoring ratio/time: '{corr}' → '{orig}'")
                     corrected = corrected.replace(corr, orig, 1)
@@ -508,49 +534,27 @@ class EnhancedPostprocessor(BasePostprocessor):
 
     def save_processing_log(self, output_path: str) -> None:
         """
-        처리 로그를 JSON 파일로 저장
+        보관 중인 처리 로그를 파일로 저장 (.jsonl이면 JSONL, 그 외는 JSON)
+
+        기본값(log_max_entries=None)이면 전체 로그가 저장됨.
+        log_max_entries로 보관 수를 제한한 경우 전체 로그는 log_path의 JSONL에 기록됨
 
         Args:
             output_path: 저장 경로 (예: outputs/analysis/postprocess_comparison.json)
         """
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(self.processing_log, f, ensure_ascii=False, indent=2)
+        self.processing_log.flush()
+        self.processing_log.save(output_path)
 
-        logger.info(f"Saved processing log to {output_file}")
+        logger.info(f"Saved processing log to {output_path}")
 
     def get_processing_summary(self) -> Dict:
         """
-        처리 로그 요약 통계
+        처리 로그 요약 통계 (누적 집계 기준)
 
         Returns:
             Dict: 요약 통계
         """
-        if not self.processing_log:
-            return {}
-
-        total = len(self.processing_log)
-        metadata_removed_count = sum(
-            1 for log in self.processing_log if log['metadata_removed']
-        )
-
-        avg_length_ratio_before = sum(
-            log['length_ratio_before'] for log in self.processing_log
-        ) / total
-
-        avg_length_ratio_after = sum(
-            log['length_ratio_after'] for log in self.processing_log
-        ) / total
-
-        return {
-            'total_cases': total,
-            'metadata_removed_count': metadata_removed_count,
-            'metadata_removed_rate': metadata_removed_count / total * 100,
-            'avg_length_ratio_before': avg_length_ratio_before * 100,
-            'avg_length_ratio_after': avg_length_ratio_after * 100,
-        }
+        return self.processing_log.get_summary()
 
 
 # 함수 단위 테스트 및 드라이런 지원
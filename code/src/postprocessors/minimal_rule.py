@@ -3,10 +3,17 @@
 Baseline이 교정하지 않은 경우에만 명확한 규칙 적용
 """
 
-import re
+from pathlib import Path
+from typing import Dict, List, Optional
 
+from .base import BasePostprocessor
+from .rule_pack import ReloadingRulePack
 
-class MinimalRulePostprocessor:
+
+DEFAULT_RULE_PACK = Path(__file__).parent / "rules" / "minimal_rule.json"
+
+
+class MinimalRulePostprocessor(BasePostprocessor):
     """
     초보수적 규칙 후처리기
 
@@ -16,34 +23,26 @@ class MinimalRulePostprocessor:
     - 60% 길이 가드, 150% 길이 가드 적용
     """
 
-    def __init__(self):
+    def __init__(self, rule_pack: Optional[str] = None, cache_dir: Optional[str] = None):
         """
         후처리기 초기화
+
+        Args:
+            rule_pack: 규칙 팩 JSON 경로 (None이면 기본 팩 rules/minimal_rule.json)
+            cache_dir: 컴파일 아티팩트 캐시 디렉토리 (None이면 캐시하지 않음)
         """
-        # 초보수적 규칙 정의 (False Positive ≈ 0%)
-        self.rules = [
-            # 규칙 1: 금새 → 금세 (100% 확실)
-            {
-                'name': '금새→금세',
-                'pattern': re.compile(r'금새'),
-                'replacement': '금세',
-                'confidence': 'HIGH'
-            },
-            # 규칙 2: 치 않 → 지 않 (형용사 뒤, 95%+ 확실)
-            {
-                'name': '치않→지않',
-                'pattern': re.compile(r'([가-힣]+)치\s+(않[가-힣]*)'),
-                'replacement': r'\1지 \2',
-                'confidence': 'HIGH'
-            },
-            # 규칙 3: 추측컨대 → 추측건대 (100% 확실)
-            {
-                'name': '추측컨대→추측건대',
-                'pattern': re.compile(r'추측컨대'),
-                'replacement': '추측건대',
-                'confidence': 'HIGH'
-            },
-        ]
+        # 초보수적 규칙 정의 (False Positive ≈ 0%), 팩 파일이 바뀌면 재시작 없이 다시 읽음
+        self.rule_pack = ReloadingRulePack(rule_pack or DEFAULT_RULE_PACK, cache_dir=cache_dir)
+
+    @property
+    def name(self) -> str:
+        """후처리 모듈 이름 반환"""
+        return "minimal_rule"
+
+    @property
+    def rules(self) -> List[Dict]:
+        """현재 규칙 목록"""
+        return self.rule_pack.rules
 
     def _apply_rules(self, text: str) -> str:
         """
@@ -55,12 +54,7 @@ class MinimalRulePostprocessor:
         Returns:
             str: 규칙 적용 후 텍스트
         """
-        result = text
-
-        for rule in self.rules:
-            result = rule['pattern'].sub(rule['replacement'], result)
-
-        return result
+        return self.rule_pack.apply(text)
 
     def _check_length_guard(self, original: str, corrected: str) -> bool:
         """
@@ -0,0 +1,179 @@
+"""
+후처리 로그 모듈
+
+문장마다 쌓이던 처리 로그를 크기가 고정된 링 버퍼와 누적 집계로 관리하고,
+필요하면 전체 로그를 JSONL 파일로 백그라운드 스레드에서 흘려 씀.
+긴 실행에서도 메모리 사용량이 처리 문장 수와 무관하게 일정함
+"""
+
+import atexit
+import json
+import logging
+import queue
+import random
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# 백그라운드 스레드 종료 신호
+_CLOSE = object()
+
+
+class ProcessingLog:
+    """
+    고정 크기 처리 로그
+
+    - 요약 통계(get_summary)는 모든 항목의 누적 집계로 계산 (샘플링과 무관)
+    - 최근 max_entries개 항목만 메모리에 보관 (sample_rate 비율로 표본 추출)
+    - sink_path가 있으면 표본 항목을 compact JSONL로 이어 씀 (백그라운드 스레드)
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = 1000,
+        sample_rate: float = 1.0,
+        sink_path: Optional[str] = None,
+        flush_interval: float = 1.0,
+        seed: Optional[int] = None
+    ):
+        """
+        로그 초기화
+
+        Args:
+            max_entries: 메모리에 보관할 최근 항목 수 (None이면 무제한, 0이면 보관하지 않음)
+            sample_rate: 보관/기록할 항목 비율 (0~1, 집계에는 항상 모든 항목 반영)
+            sink_path: JSONL 기록 경로 (None이면 파일로 쓰지 않음, 기존 파일에 이어 씀)
+            flush_interval: 백그라운드 스레드의 파일 flush 간격 (초)
+            seed: 표본 추출 난수 시드
+
+        Raises:
+            ValueError: sample_rate가 0~1 범위를 벗어나거나 max_entries가 음수인 경우
+        """
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(f"sample_rate must be between 0 and 1 (got {sample_rate})")
+        if max_entries is not None and max_entries < 0:
+            raise ValueError(f"max_entries must be >= 0 (got {max_entries})")
+
+        self.entries: deque = deque(maxlen=max_entries)
+        self.sample_rate = sample_rate
+        self.sink_path = sink_path
+        self.flush_interval = flush_interval
+        self._rng = random.Random(seed)
+
+        # 누적 집계
+        self.total = 0
+        self.metadata_removed_count = 0
+        self._sum_length_ratio_before = 0.0
+        self._sum_length_ratio_after = 0.0
+
+        self._queue: Optional[queue.Queue] = None
+        self._writer: Optional[threading.Thread] = None
+        if sink_path is not None:
+            Path(sink_path).parent.mkdir(parents=True, exist_ok=True)
+            # 기록이 밀리면 append()가 잠시 대기하도록 큐 크기 제한 (메모리 상한)
+            self._queue = queue.Queue(maxsize=10000)
+            self._writer = threading.Thread(target=self._write_loop, name="processing-log-writer", daemon=True)
+            self._writer.start()
+            atexit.register(self.close)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[Dict]:
+        return iter(self.entries)
+
+    def append(self, entry: Dict) -> None:
+        """
+        항목 추가 (집계 갱신 후 표본이면 보관/기록)
+
+        Args:
+            entry: 처리 로그 항목 (metadata_removed, length_ratio_before/after 포함)
+        """
+        self.total += 1
+        if entry['metadata_removed']:
+            self.metadata_removed_count += 1
+        self._sum_length_ratio_before += entry['length_ratio_before']
+        self._sum_length_ratio_after += entry['length_ratio_after']
+
+        if self.sample_rate < 1.0 and self._rng.random() >= self.sample_rate:
+            return
+        self.entries.append(entry)
+        if self._queue is not None:
+            self._queue.put(entry)
+
+    def get_summary(self) -> Dict:
+        """
+        누적 요약 통계
+
+        Returns:
+            Dict: total_cases, metadata_removed_count/rate, 평균 길이 비율 (%) (항목이 없으면 빈 dict)
+        """
+        if not self.total:
+            return {}
+
+        return {
+            'total_cases': self.total,
+            'metadata_removed_count': self.metadata_removed_count,
+            'metadata_removed_rate': self.metadata_removed_count / self.total * 100,
+            'avg_length_ratio_before': self._sum_length_ratio_before / self.total * 100,
+            'avg_length_ratio_after': self._sum_length_ratio_after / self.total * 100,
+        }
+
+    def _write_loop(self) -> None:
+        """큐의 항목을 JSONL로 기록 (큐가 비었거나 flush_interval이 지나면 flush)"""
+        with open(self.sink_path, 'a', encoding='utf-8') as f:
+            while True:
+                try:
+                    entry = self._queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    f.flush()
+                    continue
+
+                if entry is _CLOSE:
+                    f.flush()
+                    self._queue.task_done()
+                    return
+                try:
+                    f.write(json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n')
+                except (TypeError, ValueError) as e:
+                    logger.warning(f"Skipping unserializable processing log entry: {e}")
+                if self._queue.empty():
+                    f.flush()
+                self._queue.task_done()
+
+    def flush(self) -> None:
+        """지금까지 추가한 항목이 모두 파일에 기록될 때까지 대기"""
+        if self._queue is not None and self._writer.is_alive():
+            self._queue.join()
+
+    def close(self) -> None:
+        """남은 항목을 기록하고 백그라운드 스레드 종료 (여러 번 호출해도 안전)"""
+        if self._writer is None:
+            return
+        if self._writer.is_alive():
+            self._queue.put(_CLOSE)
+            self._writer.join()
+        self._writer = None
+        self._queue = None
+        atexit.unregister(self.close)
+
+    def save(self, output_path: str) -> None:
+        """
+        보관 중인 항목을 파일로 저장 (.jsonl이면 한 줄에 한 항목, 그 외는 JSON 배열)
+
+        Args:
+            output_path: 저장 경로
+        """
+        output_file = Path(output_path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(output_file, 'w', encoding='utf-8') as f:
+            if output_file.suffix == '.jsonl':
+                for entry in self.entries:
+                    f.write(json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n')
+            else:
+                json.dump(list(self.entries), f, ensure_ascii=False, indent=2)
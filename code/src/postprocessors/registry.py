@@ -0,0 +1,142 @@
+"""
+후처리기 레지스트리
+
+scripts에서 후처리기 클래스를 이름으로 조회하고, 여러 후처리기를 순서대로 잇는 체인을 만들 수 있도록 하는 레지스트리
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Type
+
+from .base import BasePostprocessor
+from .enhanced_postprocessor import EnhancedPostprocessor
+from .minimal_rule import MinimalRulePostprocessor
+
+
+# 후처리기 레지스트리 (이름 → 클래스 매핑)
+_REGISTRY: Dict[str, Type[BasePostprocessor]] = {}
+
+
+class PostprocessorChain(BasePostprocessor):
+    """
+    여러 후처리기를 순서대로 적용하는 후처리기
+
+    각 단계는 (원문, 앞 단계 결과)를 입력으로 받음
+    """
+
+    def __init__(self, postprocessors: Sequence[BasePostprocessor]):
+        """
+        체인 초기화
+
+        Args:
+            postprocessors: 적용 순서의 후처리기 목록
+
+        Raises:
+            ValueError: 후처리기가 없는 경우
+        """
+        if not postprocessors:
+            raise ValueError("PostprocessorChain needs at least one postprocessor")
+        self.postprocessors = list(postprocessors)
+
+    @property
+    def name(self) -> str:
+        """후처리 모듈 이름 반환 (단계 이름을 '+'로 연결)"""
+        return "+".join(postprocessor.name for postprocessor in self.postprocessors)
+
+    def process(self, original: str, corrected: str) -> str:
+        """
+        모든 단계를 순서대로 적용
+
+        Args:
+            original: 원문 텍스트
+            corrected: 교정된 텍스트
+
+        Returns:
+            str: 후처리된 텍스트
+        """
+        for postprocessor in self.postprocessors:
+            corrected = postprocessor.process(original, corrected)
+        return corrected
+
+    def batch_state(self) -> List[Any]:
+        """단계별 워커 상태"""
+        return [postprocessor.batch_state() for postprocessor in self.postprocessors]
+
+    def merge_batch_state(self, state: Optional[List[Any]]) -> None:
+        """단계별 워커 상태 반영"""
+        for postprocessor, stage_state in zip(self.postprocessors, state or []):
+            postprocessor.merge_batch_state(stage_state)
+
+
+def register_default_postprocessors():
+    """
+    기본 후처리기를 레지스트리에 등록
+
+    등록되는 후처리기:
+    - enhanced: EnhancedPostprocessor (메타데이터 제거, 문법 규칙, 숫자/단위 복원)
+    - minimal_rule: MinimalRulePostprocessor (원문 = 모델 출력일 때만 초보수적 규칙 적용)
+    """
+    _REGISTRY['enhanced'] = EnhancedPostprocessor
+    _REGISTRY['minimal_rule'] = MinimalRulePostprocessor
+
+
+def register_postprocessor(name: str, postprocessor_cls: Type[BasePostprocessor]) -> None:
+    """
+    후처리기 등록 (같은 이름이 있으면 교체)
+
+    Args:
+        name: 후처리기 이름
+        postprocessor_cls: BasePostprocessor 하위 클래스
+    """
+    get_registry()[name] = postprocessor_cls
+
+
+def get_registry() -> Dict[str, Type[BasePostprocessor]]:
+    """
+    후처리기 레지스트리 반환
+
+    Returns:
+        Dict[str, Type[BasePostprocessor]]: 후처리기 이름 → 클래스 매핑
+    """
+    if not _REGISTRY:
+        register_default_postprocessors()
+    return _REGISTRY
+
+
+def list_postprocessors() -> list:
+    """
+    등록된 후처리기 이름 목록 반환
+
+    Returns:
+        list: 후처리기 이름 목록
+    """
+    return list(get_registry().keys())
+
+
+def create_postprocessor(
+    names: Sequence[str],
+    options: Optional[Dict[str, Dict[str, Any]]] = None
+) -> BasePostprocessor:
+    """
+    이름으로 후처리기 생성 (여러 개면 순서대로 적용하는 체인)
+
+    Args:
+        names: 후처리기 이름 목록 (예: ['enhanced', 'minimal_rule'])
+        options: 이름별 생성자 인자 (예: {'enhanced': {'enable_logging': False}})
+
+    Returns:
+        BasePostprocessor: 후처리기 (하나면 그 자체, 여러 개면 PostprocessorChain)
+
+    Raises:
+        ValueError: 등록되지 않은 이름이 있거나 이름이 없는 경우
+    """
+    registry = get_registry()
+    unknown = [name for name in names if name not in registry]
+    if unknown:
+        raise ValueError(f"Unknown postprocessor(s) {unknown}. Available: {list_postprocessors()}")
+    if not names:
+        raise ValueError("At least one postprocessor name is required")
+
+    options = options or {}
+    postprocessors = [registry[name](**options.get(name, {})) for name in names]
+    if len(postprocessors) == 1:
+        return postprocessors[0]
+    return PostprocessorChain(postprocessors)
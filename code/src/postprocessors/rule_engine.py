@@ -0,0 +1,440 @@
+"""
+치환 규칙 컴파일 엔진
+
+규칙 표(dict 목록)를 생성 시 한 번만 컴파일하고,
+의미가 바뀌지 않는 것이 보장되는 연속 리터럴 규칙은 하나로 합쳐 한 번의 스캔으로 적용함
+(작은 묶음은 정규식 대안(alternation) + 치환 사전, 큰 묶음은 Aho–Corasick 오토마톤)
+
+규칙 형식:
+    {'name': 규칙 이름, 'pattern': 정규식, 'replacement': 치환 문자열,
+     'flags': re 플래그 (선택, 기본 0), 'count': 최대 치환 횟수 (선택, 기본 0 = 전체),
+     'guards': 적용 조건 (선택, {'requires': 정규식, 'forbids': 정규식})}
+
+guards가 있으면 텍스트에 requires가 있고 forbids가 없을 때만 규칙을 적용함
+"""
+
+import re
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+
+# 이스케이프 없이 쓰이면 정규식 의미를 갖는 문자
+_REGEX_META = set('.^$*+?{}[]|()')
+
+
+def literal_text(pattern: str) -> Optional[str]:
+    """
+    정규식이 순수 리터럴이면 매칭 문자열 반환
+
+    '다\\[' 처럼 영숫자가 아닌 문자의 이스케이프는 리터럴로 취급하고,
+    메타 문자나 '\\d', '\\s' 같은 특수 이스케이프가 있으면 리터럴이 아님
+
+    Args:
+        pattern: 정규식 문자열
+
+    Returns:
+        Optional[str]: 리터럴 문자열 (리터럴이 아니거나 빈 패턴이면 None)
+    """
+    chars = []
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == '\\':
+            if i + 1 >= len(pattern):
+                return None
+            escaped = pattern[i + 1]
+            if escaped.isascii() and (escaped.isalnum() or escaped == '_'):
+                return None
+            chars.append(escaped)
+            i += 2
+            continue
+        if ch in _REGEX_META:
+            return None
+        chars.append(ch)
+        i += 1
+    return ''.join(chars) or None
+
+
+def _overlaps(a: str, b: str) -> bool:
+    """a의 접미사가 b의 접두사이거나 그 반대인지 (길이 1 이상, 전체 포함은 제외)"""
+    for k in range(1, min(len(a), len(b))):
+        if a[-k:] == b[:k] or b[-k:] == a[:k]:
+            return True
+    return False
+
+
+def _interacts(a: str, b: str) -> bool:
+    """두 문자열이 텍스트에서 겹치거나 포함 관계로 상호작용할 수 있는지"""
+    return a in b or b in a or _overlaps(a, b)
+
+
+def can_fuse(group: Sequence[Tuple[str, str]], pattern: str, replacement: str) -> bool:
+    """
+    리터럴 규칙 (pattern → replacement)을 앞선 리터럴 규칙 묶음 뒤에 합쳐도 순차 적용과 결과가 같은지
+
+    순차 str 치환과 단일 대안 스캔이 같으려면 (보수적 충분 조건):
+    - 패턴끼리 포함/겹침이 없어 텍스트 내 매칭 위치가 서로 분리됨
+    - 앞선 규칙의 치환 결과가 뒤 규칙 패턴을 만들거나 포함하지 않음
+      (치환 결과와 뒤 패턴이 포함/겹침 관계가 아니고, 삭제(빈 치환)로 양옆이 붙지 않음)
+
+    Args:
+        group: 앞선 (리터럴, 치환) 목록 (적용 순서)
+        pattern: 추가할 리터럴
+        replacement: 추가할 치환 문자열
+
+    Returns:
+        bool: 합쳐도 안전한지 여부
+    """
+    for earlier_pattern, earlier_replacement in group:
+        if _interacts(earlier_pattern, pattern):
+            return False
+        if not earlier_replacement or _interacts(earlier_replacement, pattern):
+            return False
+    return True
+
+
+def _substrings(text: str) -> Iterator[str]:
+    """비어 있지 않은 모든 부분 문자열"""
+    for start in range(len(text)):
+        for end in range(start + 1, len(text) + 1):
+            yield text[start:end]
+
+
+class _LiteralGroup:
+    """
+    합치는 중인 리터럴 묶음
+
+    can_fuse()와 같은 판정을 부분 문자열/접두사/접미사 집합으로 하여
+    묶음 크기와 무관하게 규칙 하나를 추가할 수 있는지 확인함 (수천 개 규칙 컴파일용)
+    """
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.literals: List[Tuple[str, str]] = []
+        # 앞선 패턴과 치환 문자열 자체, 그 부분 문자열, 진접두사, 진접미사
+        self._members: set = set()
+        self._substrings: set = set()
+        self._prefixes: set = set()
+        self._suffixes: set = set()
+        self._has_deletion = False
+
+    def __len__(self) -> int:
+        return len(self.literals)
+
+    def accepts(self, pattern: str) -> bool:
+        """pattern 리터럴을 묶음 뒤에 합쳐도 안전한지 (can_fuse와 같은 판정)"""
+        if not self.literals:
+            return True
+        if self._has_deletion or pattern in self._substrings:
+            return False
+        for k in range(1, len(pattern)):
+            if pattern[:k] in self._suffixes or pattern[-k:] in self._prefixes:
+                return False
+        # 앞선 패턴/치환 문자열이 pattern 안에 포함되는 경우
+        return self._members.isdisjoint(_substrings(pattern))
+
+    def add(self, name: str, pattern: str, replacement: str) -> None:
+        """규칙 추가"""
+        self.names.append(name)
+        self.literals.append((pattern, replacement))
+        for text in (pattern, replacement):
+            self._members.add(text)
+            self._substrings.update(_substrings(text))
+            for k in range(1, len(text)):
+                self._prefixes.add(text[:k])
+                self._suffixes.add(text[-k:])
+        self._has_deletion = self._has_deletion or not replacement
+
+
+class CompiledRule:
+    """컴파일된 정규식 치환 규칙 하나"""
+
+    def __init__(
+        self,
+        name: str,
+        pattern: str,
+        replacement: str,
+        flags: int = 0,
+        count: int = 0,
+        guards: Optional[Dict[str, str]] = None
+    ):
+        """
+        규칙 컴파일
+
+        Args:
+            name: 규칙 이름
+            pattern: 정규식
+            replacement: 치환 문자열 (re.sub 형식, 역참조 가능)
+            flags: re 플래그
+            count: 최대 치환 횟수 (0이면 전체)
+            guards: 적용 조건 ('requires', 'forbids' 정규식, 규칙과 같은 flags로 컴파일)
+
+        Raises:
+            ValueError: 알 수 없는 guard 키가 있는 경우
+        """
+        guards = guards or {}
+        unknown = set(guards) - {'requires', 'forbids'}
+        if unknown:
+            raise ValueError(f"Unknown guards in rule '{name}': {sorted(unknown)}")
+
+        self.name = name
+        self.names = [name]
+        self.pattern = re.compile(pattern, flags)
+        self.replacement = replacement
+        self.count = count
+        self.requires = re.compile(guards['requires'], flags) if guards.get('requires') else None
+        self.forbids = re.compile(guards['forbids'], flags) if guards.get('forbids') else None
+
+    def apply(self, text: str) -> str:
+        """규칙 적용"""
+        if self.requires is not None and not self.requires.search(text):
+            return text
+        if self.forbids is not None and self.forbids.search(text):
+            return text
+        return self.pattern.sub(self.replacement, text, self.count)
+
+
+class AhoCorasick:
+    """
+    Aho–Corasick 다중 리터럴 매처
+
+    모든 리터럴에 대해 트라이 + 실패 링크 오토마톤을 만들어
+    리터럴 수와 무관하게 텍스트를 한 번(선형 시간)만 훑어 매칭 위치를 찾음
+    """
+
+    def __init__(self, literals: Sequence[str]):
+        """
+        오토마톤 생성
+
+        Args:
+            literals: 매칭할 리터럴 목록 (빈 문자열 불가)
+
+        Raises:
+            ValueError: 빈 리터럴이 있는 경우
+        """
+        if any(not literal for literal in literals):
+            raise ValueError("Aho-Corasick literals must be non-empty")
+
+        self.literals = list(literals)
+        self._lengths = [len(literal) for literal in self.literals]
+        # 노드별 전이, 실패 링크, 출력(해당 노드에서 끝나는 리터럴 인덱스, 긴 것 우선)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+
+        for index, literal in enumerate(self.literals):
+            node = 0
+            for ch in literal:
+                next_node = self._goto[node].get(ch)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][ch] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                node = next_node
+            self._out[node].append(index)
+
+        # 너비 우선으로 실패 링크 계산
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+        # 루트 상태에서는 리터럴 첫 글자가 나올 때까지 C 정규식 검색으로 건너뜀
+        self._first_char = re.compile(
+            '[' + ''.join(re.escape(ch) for ch in sorted(self._goto[0])) + ']'
+        )
+
+    def __len__(self) -> int:
+        return len(self.literals)
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """
+        왼쪽부터 겹치지 않는 매칭 찾기
+
+        끝 위치 순으로 발견한 매칭 중 앞 매칭과 겹치지 않는 것만 반환하므로,
+        리터럴끼리 포함/겹침 관계가 없으면 re 대안 스캔(leftmost, non-overlapping)과 같은 결과
+
+        Args:
+            text: 입력 텍스트
+
+        Yields:
+            Tuple[int, int, int]: (시작, 끝, 리터럴 인덱스)
+        """
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        lengths = self._lengths
+        search_first = self._first_char.search
+        size = len(text)
+        node = 0
+        last_end = 0
+        position = 0
+        while position < size:
+            if not node:
+                match = search_first(text, position)
+                if match is None:
+                    return
+                position = match.start()
+            ch = text[position]
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            position += 1
+            if out[node]:
+                for index in out[node]:
+                    start = position - lengths[index]
+                    if start >= last_end:
+                        yield start, position, index
+                        last_end = position
+                        break
+
+
+class FusedLiteralRule:
+    """
+    연속 리터럴 규칙 묶음 (한 번의 스캔으로 모든 리터럴 치환)
+
+    리터럴이 적으면 C로 구현된 re 대안 스캔이 더 빠르므로 정규식을 쓰고,
+    AHO_CORASICK_MIN_LITERALS개 이상이면 리터럴 수와 무관하게 선형인 Aho–Corasick을 사용
+    """
+
+    # 이 개수 이상이면 Aho–Corasick 사용 (re 대안은 위치마다 모든 대안을 시도함)
+    AHO_CORASICK_MIN_LITERALS = 256
+
+    def __init__(self, names: List[str], literals: List[Tuple[str, str]]):
+        """
+        리터럴 묶음 컴파일
+
+        Args:
+            names: 원래 규칙 이름 목록
+            literals: (리터럴, 치환 문자열) 목록 (적용 순서)
+        """
+        self.name = '+'.join(names)
+        self.names = names
+        self.dispatch: Dict[str, str] = dict(literals)
+        self.automaton: Optional[AhoCorasick] = None
+        self.pattern = None
+        if len(literals) >= self.AHO_CORASICK_MIN_LITERALS:
+            self.automaton = AhoCorasick([literal for literal, _ in literals])
+            self._replacements = [replacement for _, replacement in literals]
+        else:
+            self.pattern = re.compile('|'.join(re.escape(literal) for literal, _ in literals))
+
+    def _replace(self, match: re.Match) -> str:
+        return self.dispatch[match.group()]
+
+    def apply(self, text: str) -> str:
+        """묶음 전체를 한 번의 스캔으로 적용"""
+        if self.automaton is None:
+            return self.pattern.sub(self._replace, text)
+
+        pieces = []
+        cursor = 0
+        for start, end, index in self.automaton.finditer(text):
+            pieces.append(text[cursor:start])
+            pieces.append(self._replacements[index])
+            cursor = end
+        if not pieces:
+            return text
+        pieces.append(text[cursor:])
+        return ''.join(pieces)
+
+
+Step = Union[CompiledRule, FusedLiteralRule]
+
+
+def _fusible_literal(rule: Dict) -> Optional[Tuple[str, str]]:
+    """합칠 수 있는 리터럴 규칙이면 (리터럴, 치환 문자열) 반환"""
+    if rule.get('flags', 0) or rule.get('count', 0) or rule.get('guards'):
+        return None
+    replacement = rule['replacement']
+    # 역참조/이스케이프가 있는 치환 문자열은 re.sub 처리 결과가 다를 수 있음
+    if '\\' in replacement:
+        return None
+    literal = literal_text(rule['pattern'])
+    if literal is None:
+        return None
+    return literal, replacement
+
+
+class RuleSet:
+    """
+    순서가 있는 치환 규칙 표
+
+    생성 시 모든 규칙을 컴파일하고 fuse_literals=True이면 안전한 연속 리터럴 규칙을 합침.
+    apply() 결과는 규칙을 순서대로 re.sub 한 결과와 항상 같음
+    """
+
+    def __init__(self, rules: Sequence[Dict], fuse_literals: bool = True):
+        """
+        규칙 표 컴파일
+
+        Args:
+            rules: 규칙 dict 목록 (모듈 docstring 형식)
+            fuse_literals: 연속 리터럴 규칙 합치기 여부
+
+        Raises:
+            ValueError: 규칙에 pattern 또는 replacement가 없거나 정규식이 잘못된 경우
+        """
+        for rule in rules:
+            if 'pattern' not in rule or 'replacement' not in rule:
+                raise ValueError(f"Rule must have 'pattern' and 'replacement': {rule}")
+
+        self.rules = list(rules)
+        self.steps: List[Step] = self._compile(self.rules, fuse_literals)
+
+    @staticmethod
+    def _compile(rules: Sequence[Dict], fuse_literals: bool) -> List[Step]:
+        steps: List[Step] = []
+        group = _LiteralGroup()
+
+        def flush() -> None:
+            nonlocal group
+            if len(group) == 1:
+                literal, replacement = group.literals[0]
+                steps.append(CompiledRule(group.names[0], re.escape(literal), replacement))
+            elif group:
+                steps.append(FusedLiteralRule(group.names, group.literals))
+            group = _LiteralGroup()
+
+        for index, rule in enumerate(rules):
+            name = rule.get('name', f"rule_{index}")
+            literal = _fusible_literal(rule) if fuse_literals else None
+            if literal is None:
+                flush()
+                try:
+                    steps.append(CompiledRule(
+                        name, rule['pattern'], rule['replacement'],
+                        rule.get('flags', 0), rule.get('count', 0), rule.get('guards')
+                    ))
+                except re.error as e:
+                    raise ValueError(f"Rule '{name}' has invalid pattern: {e}") from None
+                continue
+            if not group.accepts(literal[0]):
+                flush()
+            group.add(name, *literal)
+        flush()
+        return steps
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def apply(self, text: str) -> str:
+        """
+        규칙 순서대로 적용
+
+        Args:
+            text: 입력 텍스트
+
+        Returns:
+            str: 치환 결과
+        """
+        for step in self.steps:
+            text = step.apply(text)
+        return text
@@ -0,0 +1,358 @@
+"""
+규칙 팩(rule pack) 모듈
+
+후처리 치환 규칙을 코드 대신 JSON 파일로 정의하고,
+컴파일 결과(RuleSet)를 pickle 아티팩트로 캐시하며,
+파일이 바뀌면 프로세스 재시작 없이 다시 읽음
+
+팩 형식:
+    {
+        "name": "minimal_rule",
+        "rules": [
+            {"name": "금새→금세", "pattern": "금새", "replacement": "금세",
+             "confidence": "HIGH", "precedence": 0,
+             "flags": ["IGNORECASE"], "count": 0,
+             "guards": {"requires": "정규식", "forbids": "정규식"}}
+        ]
+    }
+
+- pattern, replacement만 필수이고 나머지는 선택
+- precedence: 작을수록 먼저 적용 (같으면 파일 순서), 기본 0
+- confidence: HIGH/MEDIUM/LOW (기본 HIGH), min_confidence로 낮은 규칙을 빼고 읽을 수 있음
+- flags: re 플래그 이름 목록
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import re
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .rule_engine import RuleSet
+
+logger = logging.getLogger(__name__)
+
+
+CONFIDENCE_LEVELS = {'LOW': 0, 'MEDIUM': 1, 'HIGH': 2}
+
+_RULE_KEYS = {'name', 'pattern', 'replacement', 'confidence', 'precedence', 'flags', 'count', 'guards'}
+
+
+def _parse_flags(value, rule_name: str) -> int:
+    """플래그 이름 목록(또는 단일 이름)을 re 플래그 값으로 변환"""
+    names = [value] if isinstance(value, str) else list(value or [])
+    flags = 0
+    for flag_name in names:
+        try:
+            flags |= re.RegexFlag[flag_name.upper()]
+        except KeyError:
+            raise ValueError(f"Unknown regex flag '{flag_name}' in rule '{rule_name}'") from None
+    return flags
+
+
+def _flag_names(flags: int) -> List[str]:
+    """re 플래그 값을 이름 목록으로 변환"""
+    return [flag.name for flag in re.RegexFlag if flag.value and flags & flag.value == flag.value]
+
+
+class RulePack:
+    """
+    컴파일된 규칙 팩
+
+    - name: 팩 이름
+    - rules: 적용 순서로 정렬된 규칙 dict (rule_engine 형식 + confidence, precedence)
+    - rule_set: 컴파일된 RuleSet
+    - source_hash: 팩 원본과 로드 옵션의 SHA-256 (캐시 아티팩트 키)
+    """
+
+    # 아티팩트 형식이나 규칙 엔진 컴파일 결과가 바뀌면 올려서 기존 캐시를 무효화
+    ARTIFACT_VERSION = 1
+
+    def __init__(self, name: str, rules: List[Dict], source_hash: str = ""):
+        """
+        규칙 팩 컴파일
+
+        Args:
+            name: 팩 이름
+            rules: 적용 순서의 규칙 dict 목록
+            source_hash: 원본 해시
+
+        Raises:
+            ValueError: 정규식이 잘못된 규칙이 있는 경우
+        """
+        self.name = name
+        self.rules = rules
+        self.source_hash = source_hash
+        self.rule_set = RuleSet(rules)
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def apply(self, text: str) -> str:
+        """
+        규칙 순서대로 적용
+
+        Args:
+            text: 입력 텍스트
+
+        Returns:
+            str: 치환 결과
+        """
+        return self.rule_set.apply(text)
+
+    @staticmethod
+    def parse_rules(payload: Dict, min_confidence: Optional[str] = None) -> List[Dict]:
+        """
+        팩 내용을 검증하고 적용 순서의 규칙 dict 목록으로 변환 (정규식 문법은 컴파일 시 검증)
+
+        Args:
+            payload: JSON으로 읽은 팩 내용
+            min_confidence: 이보다 신뢰도가 낮은 규칙은 제외 (None이면 전부 사용)
+
+        Returns:
+            List[Dict]: precedence 순으로 정렬된 규칙
+
+        Raises:
+            ValueError: 형식이 잘못된 경우
+        """
+        if not isinstance(payload, dict) or not isinstance(payload.get('rules'), list):
+            raise ValueError("Rule pack must be an object with a 'rules' list")
+        if min_confidence is not None and min_confidence not in CONFIDENCE_LEVELS:
+            raise ValueError(f"min_confidence must be one of {list(CONFIDENCE_LEVELS)}")
+
+        rules = []
+        for index, raw in enumerate(payload['rules']):
+            if not isinstance(raw, dict) or 'pattern' not in raw or 'replacement' not in raw:
+                raise ValueError(f"Rule #{index} must have 'pattern' and 'replacement': {raw}")
+            unknown = set(raw) - _RULE_KEYS
+            if unknown:
+                raise ValueError(f"Rule #{index} has unknown fields: {sorted(unknown)}")
+
+            name = raw.get('name', f"rule_{index}")
+            confidence = raw.get('confidence', 'HIGH')
+            if confidence not in CONFIDENCE_LEVELS:
+                raise ValueError(
+                    f"Rule '{name}' has confidence '{confidence}' (expected one of {list(CONFIDENCE_LEVELS)})"
+                )
+            if min_confidence is not None and CONFIDENCE_LEVELS[confidence] < CONFIDENCE_LEVELS[min_confidence]:
+                continue
+
+            rule = {
+                'name': name,
+                'pattern': raw['pattern'],
+                'replacement': raw['replacement'],
+                'flags': _parse_flags(raw.get('flags'), name),
+                'count': int(raw.get('count', 0)),
+                'confidence': confidence,
+                'precedence': int(raw.get('precedence', 0)),
+            }
+            if raw.get('guards'):
+                rule['guards'] = dict(raw['guards'])
+            # 정규식은 RuleSet 컴파일 시 한 번만 검증 (여기서 컴파일하면 큰 팩은 re 캐시를 넘어 두 번 컴파일됨)
+            rules.append(rule)
+
+        # sorted는 안정 정렬이므로 같은 precedence는 파일 순서 유지
+        return sorted(rules, key=lambda rule: rule['precedence'])
+
+    @classmethod
+    def from_dict(cls, payload: Dict, min_confidence: Optional[str] = None) -> "RulePack":
+        """
+        팩 내용으로 컴파일 (캐시 없음)
+
+        Args:
+            payload: 팩 내용
+            min_confidence: 최소 신뢰도
+
+        Returns:
+            RulePack: 컴파일된 팩
+        """
+        rules = cls.parse_rules(payload, min_confidence)
+        return cls(payload.get('name', 'rules'), rules)
+
+    @classmethod
+    def _hash_source(cls, data: bytes, min_confidence: Optional[str]) -> str:
+        digest = hashlib.sha256(f"rule-pack-v{cls.ARTIFACT_VERSION}:{min_confidence}\n".encode("utf-8"))
+        digest.update(data)
+        return digest.hexdigest()
+
+    @classmethod
+    def load(
+        cls,
+        path: str,
+        cache_dir: Optional[str] = None,
+        min_confidence: Optional[str] = None
+    ) -> "RulePack":
+        """
+        JSON 팩 파일 읽기
+
+        cache_dir가 있으면 '<dir>/<source_hash>.pickle'에 컴파일 결과(RuleSet)를 저장하고,
+        같은 내용의 팩은 다음부터 JSON 검증·리터럴 묶음 분석·Aho–Corasick 오토마톤 생성 없이 아티팩트를 읽음.
+        정규식 객체는 프로세스 간에 공유할 수 없어 pickle 복원 시 re가 다시 컴파일하므로,
+        이득은 리터럴 규칙이 많은 큰 팩에서 나옴
+        (아티팩트는 pickle이므로 신뢰할 수 있는 디렉토리만 지정해야 함)
+
+        Args:
+            path: 팩 파일 경로
+            cache_dir: 컴파일 아티팩트 디렉토리 (None이면 캐시하지 않음)
+            min_confidence: 최소 신뢰도
+
+        Returns:
+            RulePack: 컴파일된 팩
+
+        Raises:
+            ValueError: 팩 형식이 잘못된 경우
+        """
+        data = Path(path).read_bytes()
+        source_hash = cls._hash_source(data, min_confidence)
+
+        artifact_path = Path(cache_dir) / f"{source_hash}.pickle" if cache_dir is not None else None
+        if artifact_path is not None and artifact_path.exists():
+            try:
+                with open(artifact_path, "rb") as f:
+                    pack = pickle.load(f)
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable rule pack artifact {artifact_path}: {e}")
+                pack = None
+            if isinstance(pack, cls) and pack.source_hash == source_hash:
+                return pack
+
+        try:
+            payload = json.loads(data.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ValueError(f"Rule pack {path} is not valid JSON: {e}") from None
+        rules = cls.parse_rules(payload, min_confidence)
+        pack = cls(payload.get('name', Path(path).stem), rules, source_hash)
+
+        if artifact_path is not None:
+            artifact_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = artifact_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(pack, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(artifact_path)
+        return pack
+
+    @staticmethod
+    def save(path: str, name: str, rules: List[Dict]) -> None:
+        """
+        규칙 dict 목록(rule_engine 형식)을 JSON 팩 파일로 저장
+
+        Args:
+            path: 저장 경로
+            name: 팩 이름
+            rules: 규칙 dict 목록 (flags는 re 플래그 값)
+        """
+        packed = []
+        for rule in rules:
+            entry = {key: value for key, value in rule.items() if key in _RULE_KEYS and key != 'flags'}
+            if rule.get('flags'):
+                entry['flags'] = _flag_names(rule['flags'])
+            packed.append(entry)
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({'name': name, 'rules': packed}, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+
+
+class ReloadingRulePack:
+    """
+    파일 변경 시 자동으로 다시 읽는 규칙 팩
+
+    apply() 호출 시 check_interval초마다 한 번 파일 mtime/크기를 확인하고,
+    바뀌었으면 다시 컴파일함. 새 팩이 잘못된 경우 경고를 남기고 이전 규칙을 계속 사용함
+    """
+
+    def __init__(
+        self,
+        path: str,
+        cache_dir: Optional[str] = None,
+        min_confidence: Optional[str] = None,
+        check_interval: float = 1.0
+    ):
+        """
+        팩 읽기
+
+        Args:
+            path: 팩 파일 경로
+            cache_dir: 컴파일 아티팩트 디렉토리
+            min_confidence: 최소 신뢰도
+            check_interval: 파일 변경 확인 간격 (초, 0이면 매 호출마다 확인)
+
+        Raises:
+            ValueError: 처음 읽은 팩 형식이 잘못된 경우
+        """
+        self.path = str(path)
+        self.cache_dir = cache_dir
+        self.min_confidence = min_confidence
+        self.check_interval = check_interval
+        self.reloads = 0
+
+        self._signature = self._stat()
+        self._pack = RulePack.load(self.path, cache_dir, min_confidence)
+        self._next_check = time.monotonic() + check_interval
+
+    def _stat(self):
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def reload(self) -> bool:
+        """
+        파일이 바뀌었으면 다시 읽기
+
+        Returns:
+            bool: 새 규칙으로 교체했는지 여부
+        """
+        self._next_check = time.monotonic() + self.check_interval
+        try:
+            signature = self._stat()
+        except OSError as e:
+            logger.warning(f"Keeping previous rules; cannot stat rule pack {self.path}: {e}")
+            return False
+        if signature == self._signature:
+            return False
+
+        try:
+            pack = RulePack.load(self.path, self.cache_dir, self.min_confidence)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Keeping previous rules; failed to reload rule pack {self.path}: {e}")
+            # 같은 잘못된 파일을 매번 다시 컴파일하지 않도록 서명은 갱신
+            self._signature = signature
+            return False
+
+        self._signature = signature
+        self._pack = pack
+        self.reloads += 1
+        logger.info(f"Reloaded rule pack {self.path} ({len(pack)} rules)")
+        return True
+
+    @property
+    def pack(self) -> RulePack:
+        """현재 규칙 팩 (확인 간격이 지났으면 변경 여부 확인)"""
+        if time.monotonic() >= self._next_check:
+            self.reload()
+        return self._pack
+
+    @property
+    def rules(self) -> List[Dict]:
+        """현재 규칙 목록"""
+        return self.pack.rules
+
+    def __len__(self) -> int:
+        return len(self.pack)
+
+    def apply(self, text: str) -> str:
+        """
+        현재 규칙 순서대로 적용
+
+        Args:
+            text: 입력 텍스트
+
+        Returns:
+            str: 치환 결과
+        """
+        return self.pack.apply(text)
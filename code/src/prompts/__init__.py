@@ -6,18 +6,24 @@
 - ZeroShotPrompt: 예시 0개
 - BaselineJosaPrompt: 조사 1개 예시
 - BaselinePlus3ExamplesPrompt: 4개 예시
+- BaselinePackedPrompt: Baseline의 다중 문장 묶음 버전 (--pack-size)
 """
 
-from .base import BasePrompt
+from .base import BasePrompt, PromptTemplate
 from .baseline import BaselinePrompt
 from .zero_shot import ZeroShotPrompt
 from .baseline_josa import BaselineJosaPrompt
 from .baseline_plus_3examples import BaselinePlus3ExamplesPrompt
+from .packed import PackedPrompt, BaselinePackedPrompt, get_packed_prompt
 
 __all__ = [
     'BasePrompt',
+    'PromptTemplate',
     'BaselinePrompt',
     'ZeroShotPrompt',
     'BaselineJosaPrompt',
     'BaselinePlus3ExamplesPrompt',
+    'PackedPrompt',
+    'BaselinePackedPrompt',
+    'get_packed_prompt',
 ]
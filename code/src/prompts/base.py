@@ -2,15 +2,86 @@
 프롬프트 기본 추상 클래스
 """
 
+import hashlib
+import json
+import string
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from functools import cached_property
+from typing import List, Dict, Any, Optional
+
+
+class PromptTemplate:
+    """
+    미리 분할된 불변 사용자 메시지 템플릿
+
+    템플릿 문자열을 한 번만 파싱하여 {text} 슬롯 앞뒤의 고정 문자열(prefix, suffix)을 상수로 보관하고,
+    렌더링 시에는 문자열 연결만 수행함. 결과는 template.format(text=text)와 같음
+    """
+
+    __slots__ = ("_prefix", "_suffix")
+
+    def __init__(self, template: str, slot: str = "text"):
+        """
+        템플릿 컴파일
+
+        Args:
+            template: str.format 형식 템플릿 ({{, }} 이스케이프 지원)
+            slot: 입력 텍스트가 들어갈 필드 이름
+
+        Raises:
+            ValueError: 슬롯이 정확히 한 번 나오지 않거나, 다른 필드·변환·포맷 지정이 있는 경우
+        """
+        parts = [[]]
+        for literal, field, format_spec, conversion in string.Formatter().parse(template):
+            parts[-1].append(literal)
+            if field is None:
+                continue
+            if field != slot or format_spec or conversion:
+                raise ValueError(f"Template may only contain a plain {{{slot}}} field, got {{{field}}}")
+            parts.append([])
+        if len(parts) != 2:
+            raise ValueError(f"Template must contain exactly one {{{slot}}} field, found {len(parts) - 1}")
+
+        object.__setattr__(self, "_prefix", "".join(parts[0]))
+        object.__setattr__(self, "_suffix", "".join(parts[1]))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("PromptTemplate is immutable")
+
+    @property
+    def prefix(self) -> str:
+        """슬롯 앞 고정 문자열"""
+        return self._prefix
+
+    @property
+    def suffix(self) -> str:
+        """슬롯 뒤 고정 문자열"""
+        return self._suffix
+
+    def render(self, text: str) -> str:
+        """
+        슬롯에 텍스트를 채운 메시지 반환
+
+        Args:
+            text: 교정할 원문 텍스트
+
+        Returns:
+            str: 렌더링된 메시지
+        """
+        return self._prefix + text + self._suffix
 
 
 class BasePrompt(ABC):
     """
     모든 프롬프트 클래스의 기본 추상 클래스
+
+    하위 클래스는 template 클래스 속성(PromptTemplate)을 지정하면 format_user_message를
+    따로 구현하지 않아도 됨. 템플릿이 없으면 format_user_message를 직접 구현해야 함
     """
 
+    # 미리 컴파일된 사용자 메시지 템플릿 (None이면 format_user_message 직접 구현)
+    template: Optional[PromptTemplate] = None
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -32,7 +103,6 @@ class BasePrompt(ABC):
         """
         pass
 
-    @abstractmethod
     def format_user_message(self, text: str) -> str:
         """
         사용자 메시지 포맷팅
@@ -42,8 +112,53 @@ class BasePrompt(ABC):
 
         Returns:
             str: 포맷팅된 사용자 메시지
+
+        Raises:
+            NotImplementedError: template도 없고 하위 클래스가 구현하지도 않은 경우
         """
-        pass
+        if self.template is None:
+            raise NotImplementedError(f"{type(self).__name__} must define template or format_user_message")
+        return self.template.render(text)
+
+    @cached_property
+    def _system_content(self) -> str:
+        """
+        시스템 메시지 (인스턴스마다 한 번만 생성)
+
+        Returns:
+            str: 시스템 프롬프트 내용 (없으면 빈 문자열)
+        """
+        return self.system_message()
+
+    def user_prefix(self) -> str:
+        """
+        입력 텍스트 앞에 오는 사용자 메시지 고정 부분
+
+        Returns:
+            str: 사용자 메시지 접두부
+        """
+        if self.template is not None and type(self).format_user_message is BasePrompt.format_user_message:
+            return self.template.prefix
+        sentinel = "\x00"
+        rendered = self.format_user_message(sentinel)
+        return rendered[:rendered.index(sentinel)] if sentinel in rendered else rendered
+
+    @cached_property
+    def prefix_key(self) -> str:
+        """
+        입력과 무관한 고정 접두부(시스템 메시지 + 사용자 메시지 접두부)의 안정적인 키
+
+        같은 키를 가진 요청은 입력 텍스트 앞까지 토큰이 완전히 같으므로
+        접두부 단위 캐싱·요청 그룹핑에 사용할 수 있음 (ResponseCache.make_key의 prefix_key)
+
+        Returns:
+            str: sha256 hex digest
+        """
+        payload = json.dumps(
+            {"system": self._system_content, "user_prefix": self.user_prefix()},
+            ensure_ascii=False, sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
     def to_messages(self, text: str) -> List[Dict[str, Any]]:
         """
@@ -53,20 +168,8 @@ class BasePrompt(ABC):
             text: 교정할 원문 텍스트
 
         Returns:
-            List[Dict[str, Any]]: OpenAI API 메시지 포맷
+            List[Dict[str, Any]]: OpenAI API 메시지 포맷 (호출마다 새 리스트·dict)
         """
-        messages = []
-
-        system_msg = self.system_message()
-        if system_msg:
-            messages.append({
-                "role": "system",
-                "content": system_msg
-            })
-
-        messages.append({
-            "role": "user",
-            "content": self.format_user_message(text)
-        })
-
+        messages = [{"role": "system", "content": self._system_content}] if self._system_content else []
+        messages.append({"role": "user", "content": self.format_user_message(text)})
         return messages
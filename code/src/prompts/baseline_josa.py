@@ -7,7 +7,7 @@ Baseline + 조사 예시 1개
 - 조사 오류는 가장 많은 샘플 수(41개)를 가진 핵심 오류
 """
 
-from .base import BasePrompt
+from .base import BasePrompt, PromptTemplate
 
 
 class BaselineJosaPrompt(BasePrompt):
@@ -20,25 +20,8 @@ class BaselineJosaPrompt(BasePrompt):
     - 목표: 34%+ 달성
     """
 
-    @property
-    def name(self) -> str:
-        return "baseline_josa"
-
-    def system_message(self) -> str:
-        """시스템 메시지 반환 (사용하지 않음)"""
-        return ""
-
-    def format_user_message(self, text: str) -> str:
-        """
-        사용자 메시지 포맷팅
-
-        Args:
-            text: 교정할 원문 텍스트
-
-        Returns:
-            str: 포맷팅된 프롬프트
-        """
-        template = """# 지시
+    # 사용자 메시지 템플릿 (import 시 한 번만 컴파일)
+    template = PromptTemplate("""# 지시
 - 다음 규칙에 따라 원문을 교정하세요.
 - 맞춤법, 띄어쓰기, 문장 부호, 문법을 자연스럽게 교정합니다.
 - 어떤 경우에도 설명이나 부가적인 내용은 포함하지 않습니다.
@@ -53,6 +36,12 @@ class BaselineJosaPrompt(BasePrompt):
 # 교정할 문장
 <원문>
 {text}
-<교정>"""
+<교정>""")
+
+    @property
+    def name(self) -> str:
+        return "baseline_josa"
 
-        return template.format(text=text)
+    def system_message(self) -> str:
+        """시스템 메시지 반환 (사용하지 않음)"""
+        return ""
@@ -0,0 +1,156 @@
+"""
+다중 문장 묶음(packed) 프롬프트
+
+K개 문장에 [1]..[K] 번호를 붙여 한 번의 요청으로 교정하고,
+번호가 붙은 응답을 다시 행 단위로 분리함.
+응답을 분리할 수 없으면 parse()가 None을 반환하고, 생성기는 해당 묶음을 단일 문장 호출로 처리함
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Type
+
+from .base import PromptTemplate
+
+
+# 응답 한 줄: "[번호] 교정문"
+_TAGGED_LINE = re.compile(r"^\s*\[(\d+)\]\s?(.*)$")
+
+
+class PackedPrompt:
+    """
+    다중 문장 묶음 프롬프트 기본 클래스
+
+    하위 클래스는 name, template({text} 슬롯에 번호 붙은 문장 목록이 들어감)을 지정함
+    """
+
+    name: str = ""
+    # 사용자 메시지 템플릿 ({text}에 "[1] 문장" 형식의 줄들이 들어감)
+    template: PromptTemplate
+
+    @staticmethod
+    def can_pack(text: str) -> bool:
+        """
+        묶음 요청에 넣을 수 있는 문장인지 (한 줄짜리 비어 있지 않은 문장만 허용)
+
+        Args:
+            text: 원문 텍스트
+
+        Returns:
+            bool: 묶을 수 있으면 True
+        """
+        return bool(text.strip()) and "\n" not in text and "\r" not in text
+
+    def format_user_message(self, texts: List[str]) -> str:
+        """
+        번호 붙은 사용자 메시지 생성
+
+        Args:
+            texts: 교정할 원문 리스트 (can_pack을 만족해야 함)
+
+        Returns:
+            str: 포맷팅된 사용자 메시지
+        """
+        return self.template.render("\n".join(f"[{i}] {text}" for i, text in enumerate(texts, 1)))
+
+    def to_messages(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        OpenAI API 포맷으로 메시지 변환
+
+        Args:
+            texts: 교정할 원문 리스트
+
+        Returns:
+            List[Dict[str, Any]]: OpenAI API 메시지 포맷
+        """
+        return [{"role": "user", "content": self.format_user_message(texts)}]
+
+    @staticmethod
+    def parse(response: str, count: int) -> Optional[List[str]]:
+        """
+        번호 붙은 응답을 문장별로 분리
+
+        첫 번호 줄 앞의 줄(서두, 라벨 반복 등)과 빈 줄은 무시함.
+        번호가 1..count 순서로 정확히 한 번씩 나오지 않거나, 번호 줄 사이에 번호 없는 줄이 있거나,
+        교정문이 빈 경우에는 행 대응을 신뢰할 수 없으므로 None 반환
+
+        Args:
+            response: 모델 응답
+            count: 묶음의 문장 수
+
+        Returns:
+            Optional[List[str]]: 입력 순서의 교정문 리스트 (분리 실패 시 None)
+        """
+        sentences: List[str] = []
+        for line in response.splitlines():
+            if not line.strip():
+                continue
+            match = _TAGGED_LINE.match(line)
+            if match is None:
+                if sentences:
+                    return None
+                continue
+            number, sentence = int(match.group(1)), match.group(2).strip()
+            if number != len(sentences) + 1 or not sentence:
+                return None
+            sentences.append(sentence)
+
+        if len(sentences) != count:
+            return None
+        return sentences
+
+
+class BaselinePackedPrompt(PackedPrompt):
+    """
+    Baseline 프롬프트의 묶음 버전
+
+    Baseline과 같은 지시·예시를 번호 형식으로 바꾸고, 번호 유지·한 줄 출력 규칙만 추가
+    """
+
+    name = "baseline_packed"
+    # 사용자 메시지 템플릿 (import 시 한 번만 컴파일)
+    template = PromptTemplate("""# 지시
+- 다음 규칙에 따라 번호가 붙은 원문을 각각 교정하세요.
+- 맞춤법, 띄어쓰기, 문장 부호, 문법을 자연스럽게 교정합니다.
+- 어떤 경우에도 설명이나 부가적인 내용은 포함하지 않습니다.
+- 각 문장의 번호를 그대로 유지하고, 한 줄에 교정된 문장 하나만 출력합니다.
+
+# 예시
+<원문>
+[1] 오늘 날씨가 않좋은데, 김치찌게 먹으러 갈려고.
+[2] 그는 삼성전자의 제안을 탐탁치 않게 여겼다.
+<교정>
+[1] 오늘 날씨가 안 좋은데, 김치찌개 먹으러 가려고.
+[2] 그는 삼성전자의 제안을 탐탁지 않게 여겼다.
+
+# 교정할 문장
+<원문>
+{text}
+<교정>""")
+
+
+# 단일 문장 프롬프트 이름 → 묶음 프롬프트 클래스
+_PACKED_PROMPTS: Dict[str, Type[PackedPrompt]] = {
+    "baseline": BaselinePackedPrompt,
+}
+
+
+def get_packed_prompt(prompt_name: str) -> PackedPrompt:
+    """
+    단일 문장 프롬프트에 대응하는 묶음 프롬프트 조회
+
+    Args:
+        prompt_name: 단일 문장 프롬프트 이름
+
+    Returns:
+        PackedPrompt: 묶음 프롬프트 인스턴스
+
+    Raises:
+        ValueError: 묶음 버전이 없는 프롬프트인 경우
+    """
+    packed_cls = _PACKED_PROMPTS.get(prompt_name)
+    if packed_cls is None:
+        raise ValueError(
+            f"Prompt '{prompt_name}' has no packed variant. "
+            f"Packed prompts are available for: {sorted(_PACKED_PROMPTS)}"
+        )
+    return packed_cls()
@@ -7,7 +7,7 @@ Zero-shot 프롬프트 (예시 없음)
 - 출력 형식 제약을 명확히 하여 메타데이터 방지
 """
 
-from .base import BasePrompt
+from .base import BasePrompt, PromptTemplate
 
 
 class ZeroShotPrompt(BasePrompt):
@@ -20,25 +20,8 @@ class ZeroShotPrompt(BasePrompt):
     - 모든 오류 유형 교정 강조
     """
 
-    @property
-    def name(self) -> str:
-        return "zero_shot"
-
-    def system_message(self) -> str:
-        """시스템 메시지 반환 (사용하지 않음)"""
-        return ""
-
-    def format_user_message(self, text: str) -> str:
-        """
-        사용자 메시지 생성
-
-        Args:
-            text: 교정할 원문
-
-        Returns:
-            str: 포맷팅된 사용자 메시지
-        """
-        template = """# 지시사항
+    # 사용자 메시지 템플릿 (import 시 한 번만 컴파일)
+    template = PromptTemplate("""# 지시사항
 다음 한국어 문장을 교정하세요.
 
 # 교정 범위
@@ -60,5 +43,12 @@ class ZeroShotPrompt(BasePrompt):
 6. 원문의 내용을 임의로 추가하거나 삭제하지 마세요
 
 # 교정할 문장
-{text}"""
-        return template.format(text=text)
+{text}""")
+
+    @property
+    def name(self) -> str:
+        return "zero_shot"
+
+    def system_message(self) -> str:
+        """시스템 메시지 반환 (사용하지 않음)"""
+        return ""
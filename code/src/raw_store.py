@@ -0,0 +1,121 @@
+"""
+모델 원본 출력 저장소 모듈
+
+생성 시 후처리 전 모델 출력을 최종 결과 옆에 CSV로 남겨두어,
+후처리기만 바꾸는 실험을 API 호출 없이 다시 돌릴 수 있도록 함
+
+형식: err_sentence, raw_sentence, status 컬럼 CSV
+(status가 ok면 모델 출력이 있는 행으로 빈 문자열도 그대로 출력, missing이면 API 호출 실패·건너뛴 행)
+"""
+
+from typing import List, Optional
+
+import pandas as pd
+
+from src.postprocessors.base import BasePostprocessor
+
+
+RAW_COLUMNS = ["err_sentence", "raw_sentence"]
+STATUS_COLUMN = "status"
+
+# 모델 출력 있음 / 없음 (실패했거나 사전 분류기로 건너뛴 행)
+STATUS_OK = "ok"
+STATUS_MISSING = "missing"
+
+
+def default_raw_path(output_path: str) -> str:
+    """
+    출력 CSV에 대응하는 기본 원본 출력 경로
+
+    Args:
+        output_path: 출력 CSV 경로
+
+    Returns:
+        str: '<output_path>.raw.csv'
+    """
+    return f"{output_path}.raw.csv"
+
+
+def read_raw_outputs(path: str) -> pd.DataFrame:
+    """
+    원본 출력 저장소 읽기
+
+    Args:
+        path: 원본 출력 CSV 경로
+
+    Returns:
+        pd.DataFrame: err_sentence, raw_sentence (출력이 없는 행은 None, 빈 출력은 "")
+
+    Raises:
+        ValueError: 필요한 컬럼이 없는 경우
+    """
+    df = pd.read_csv(path, keep_default_na=False, dtype=str)
+    missing = [column for column in RAW_COLUMNS if column not in df.columns]
+    if missing:
+        raise ValueError(f"Raw output file {path} must contain columns {RAW_COLUMNS} (missing: {missing})")
+
+    if STATUS_COLUMN in df.columns:
+        has_raw = df[STATUS_COLUMN] == STATUS_OK
+    else:
+        # status 컬럼이 없는 이전 형식은 빈 값을 출력 없음으로 봄
+        has_raw = df["raw_sentence"] != ""
+
+    df = df[RAW_COLUMNS].copy()
+    df["raw_sentence"] = df["raw_sentence"].astype(object).where(has_raw, None)
+    return df
+
+
+def raw_frame(err_sentences: List[str], raw_sentences: List[Optional[str]]) -> pd.DataFrame:
+    """
+    원본 출력 데이터프레임 생성
+
+    Args:
+        err_sentences: 원문 리스트
+        raw_sentences: 후처리 전 모델 출력 리스트 (실패 행은 None)
+
+    Returns:
+        pd.DataFrame: err_sentence, raw_sentence, status (None인 행은 missing)
+    """
+    raw_sentences = list(raw_sentences)
+    return pd.DataFrame({
+        "err_sentence": list(err_sentences),
+        "raw_sentence": raw_sentences,
+        STATUS_COLUMN: [STATUS_MISSING if pd.isna(raw) else STATUS_OK for raw in raw_sentences],
+    })
+
+
+def apply_postprocessor(
+    raw_df: pd.DataFrame,
+    postprocessor: Optional[BasePostprocessor],
+    workers: int = 1
+) -> pd.DataFrame:
+    """
+    저장된 원본 출력에 후처리기를 다시 적용하여 제출 형식으로 변환
+
+    API 호출에 실패했던 행(raw_sentence 없음)은 생성 시와 같이 원문을 그대로 사용함
+
+    Args:
+        raw_df: read_raw_outputs() 결과
+        postprocessor: 적용할 후처리기 (None이면 원본 출력 그대로)
+        workers: 후처리 프로세스 수
+
+    Returns:
+        pd.DataFrame: err_sentence, cor_sentence
+    """
+    err_sentences = raw_df["err_sentence"].tolist()
+    raw_sentences = raw_df["raw_sentence"].tolist()
+    rows = [i for i, raw in enumerate(raw_sentences) if not pd.isna(raw)]
+
+    corrections = list(err_sentences)
+    if postprocessor is None:
+        processed = [raw_sentences[i] for i in rows]
+    else:
+        processed = postprocessor.process_batch(
+            [err_sentences[i] for i in rows],
+            [raw_sentences[i] for i in rows],
+            workers=workers
+        )
+    for i, corrected in zip(rows, processed):
+        corrections[i] = corrected
+
+    return pd.DataFrame({"err_sentence": err_sentences, "cor_sentence": corrections})
@@ -0,0 +1,34 @@
+"""
+공용 pytest fixture
+"""
+
+import pytest
+
+from src.generator import SentenceGenerator
+from tests.openai_stub import OpenAIStubServer
+
+@pytest.fixture
+def openai_stub():
+    """로컬 OpenAI 호환 스텁 서버 (테스트마다 새로 기동)"""
+    server = OpenAIStubServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def make_generator():
+    """
+    스텁 서버에 연결된 SentenceGenerator 생성 함수
+
+    기본값은 baseline 프롬프트, 후처리 끔. 키워드 인자로 덮어씀
+    """
+    def factory(stub, **kwargs):
+        options = {
+            "prompt_name": "baseline",
+            "api_key": "test-key",
+            "base_url": stub.base_url,
+            "enable_postprocessing": False,
+        }
+        options.update(kwargs)
+        return SentenceGenerator(**options)
+    return factory
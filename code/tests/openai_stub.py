@@ -0,0 +1,290 @@
+"""
+테스트용 OpenAI 호환 로컬 서버
+실제 API 대신 /chat/completions 엔드포인트를 흉내내어 동시성·순서 검증에 사용
+배치 작업 검증용으로 /files, /batches 엔드포인트도 흉내냄
+"""
+
+import json
+import threading
+import time
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+def default_responder(user_content: str) -> str:
+    """
+    기본 응답 생성기: 사용자 메시지의 마지막 줄 앞에 '교정_' 접두사 부여
+
+    Args:
+        user_content: 사용자 메시지 내용
+
+    Returns:
+        str: 모델 응답 텍스트
+    """
+    lines = [line for line in user_content.strip().split('\n') if line.strip()]
+    # 프롬프트 마지막 '<교정>' 라벨 바로 앞 줄이 원문
+    if len(lines) >= 2 and lines[-1].strip() == '<교정>':
+        return f"교정_{lines[-2].strip()}"
+    return f"교정_{lines[-1].strip()}" if lines else ""
+
+
+class OpenAIStubServer:
+    """
+    OpenAI 호환 스텁 서버
+
+    - responder: 사용자 메시지 → 응답 텍스트 함수
+    - fail_inputs: 응답 대신 500 에러를 반환할 사용자 메시지 부분 문자열
+    - throttle_inputs: 429 에러를 반환할 사용자 메시지 부분 문자열
+    - transient_failures: 부분 문자열 → 남은 503 실패 횟수 (일시적 장애 흉내)
+    - latency: 요청당 지연 시간(초)
+    - max_in_flight: 관측된 최대 동시 요청 수
+    - batch_polls: 배치가 완료되기까지 필요한 상태 조회 횟수
+    - batch_expire_after: 설정하면 배치가 처음 N개 요청만 처리하고 만료됨 (None이면 모두 처리)
+    - batch_requests: 배치로 처리된 요청 본문 목록 (requests와 별도)
+    """
+
+    def __init__(
+        self,
+        responder: Callable[[str], str] = default_responder,
+        latency: float = 0.0,
+        fail_inputs: Optional[List[str]] = None,
+        throttle_inputs: Optional[List[str]] = None,
+        transient_failures: Optional[Dict[str, int]] = None
+    ):
+        self.responder = responder
+        self.latency = latency
+        self.fail_inputs = fail_inputs or []
+        self.throttle_inputs = throttle_inputs or []
+        self.transient_failures = transient_failures or {}
+        self.requests: List[dict] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.batch_polls = 1
+        self.batch_expire_after: Optional[int] = None
+        self.batch_requests: List[dict] = []
+        self.files: Dict[str, bytes] = {}
+        self.batches: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+        handler = self._make_handler()
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.httpd.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self.httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+
+    @property
+    def base_url(self) -> str:
+        """클라이언트에 전달할 base_url"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "OpenAIStubServer":
+        """서버 스레드 시작"""
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """서버 종료"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _send_json(self, status: int, payload: dict, headers: Optional[dict] = None) -> None:
+                body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length)
+
+                if self.path.endswith("/chat/completions"):
+                    server._handle_chat(self, json.loads(body or b"{}"))
+                elif self.path.endswith("/files"):
+                    server._handle_file_upload(self, body)
+                elif self.path.endswith("/batches"):
+                    server._handle_batch_create(self, json.loads(body or b"{}"))
+                else:
+                    self._send_json(404, {"error": {"message": "not found"}})
+
+            def do_GET(self):
+                parts = self.path.split("?")[0].rstrip("/").split("/")
+                if len(parts) >= 2 and parts[-2] == "batches":
+                    server._handle_batch_retrieve(self, parts[-1])
+                elif len(parts) >= 3 and parts[-3] == "files" and parts[-1] == "content":
+                    server._handle_file_content(self, parts[-2])
+                else:
+                    self._send_json(404, {"error": {"message": "not found"}})
+
+        return Handler
+
+    def _chat_response(self, payload: dict) -> Tuple[int, dict, Optional[dict]]:
+        """
+        chat completion 요청 하나의 (상태 코드, 응답 본문, 응답 헤더)
+        """
+        user_content = payload["messages"][-1]["content"]
+        if any(throttle in user_content for throttle in self.throttle_inputs):
+            # SDK 자체 재시도가 즉시 다시 시도하도록 짧은 retry-after 지정
+            return 429, {"error": {"message": "rate limited"}}, {"retry-after-ms": "1"}
+        with self._lock:
+            transient = next(
+                (key for key, remaining in self.transient_failures.items()
+                 if remaining > 0 and key in user_content),
+                None
+            )
+            if transient is not None:
+                self.transient_failures[transient] -= 1
+        if transient is not None:
+            return 503, {"error": {"message": "temporarily unavailable"}}, {"retry-after-ms": "1"}
+        if any(fail in user_content for fail in self.fail_inputs):
+            return 500, {"error": {"message": "stub failure"}}, None
+
+        content = self.responder(user_content)
+        return 200, {
+            "id": f"chatcmpl-{len(self.requests) + len(self.batch_requests)}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": payload.get("model", "stub"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": len(user_content),
+                "completion_tokens": len(content),
+                "total_tokens": len(user_content) + len(content),
+            },
+        }, None
+
+    def _handle_chat(self, handler, payload: dict) -> None:
+        with self._lock:
+            self.requests.append(payload)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            handler._send_json(*self._chat_response(payload))
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def _store_file(self, content: bytes, filename: str, purpose: str) -> dict:
+        with self._lock:
+            file_id = f"file-{len(self.files) + 1}"
+            self.files[file_id] = content
+        return {
+            "id": file_id,
+            "object": "file",
+            "bytes": len(content),
+            "created_at": int(time.time()),
+            "filename": filename,
+            "purpose": purpose,
+            "status": "processed",
+        }
+
+    def _handle_file_upload(self, handler, body: bytes) -> None:
+        # multipart/form-data 본문을 email 파서로 분리
+        message = BytesParser(policy=HTTP).parsebytes(
+            f"Content-Type: {handler.headers['Content-Type']}\r\n\r\n".encode("utf-8") + body
+        )
+        fields = {part.get_param("name", header="content-disposition"): part for part in message.iter_parts()}
+        upload = fields["file"]
+        purpose = fields["purpose"].get_content().strip() if "purpose" in fields else "batch"
+        handler._send_json(200, self._store_file(
+            upload.get_payload(decode=True), upload.get_filename() or "upload.jsonl", purpose
+        ))
+
+    def _handle_file_content(self, handler, file_id: str) -> None:
+        content = self.files.get(file_id)
+        if content is None:
+            handler._send_json(404, {"error": {"message": "file not found"}})
+            return
+        handler.send_response(200)
+        handler.send_header("Content-Type", "application/octet-stream")
+        handler.send_header("Content-Length", str(len(content)))
+        handler.end_headers()
+        handler.wfile.write(content)
+
+    def _handle_batch_create(self, handler, payload: dict) -> None:
+        if payload.get("input_file_id") not in self.files:
+            handler._send_json(400, {"error": {"message": "input file not found"}})
+            return
+        with self._lock:
+            batch_id = f"batch-{len(self.batches) + 1}"
+            self.batches[batch_id] = {
+                "id": batch_id,
+                "object": "batch",
+                "endpoint": payload["endpoint"],
+                "completion_window": payload["completion_window"],
+                "input_file_id": payload["input_file_id"],
+                "created_at": int(time.time()),
+                "status": "validating",
+                "output_file_id": None,
+                "error_file_id": None,
+                "request_counts": {"total": 0, "completed": 0, "failed": 0},
+                "polls": 0,
+            }
+        handler._send_json(200, self._batch_view(batch_id))
+
+    def _batch_view(self, batch_id: str) -> dict:
+        return {key: value for key, value in self.batches[batch_id].items() if key != "polls"}
+
+    def _handle_batch_retrieve(self, handler, batch_id: str) -> None:
+        batch = self.batches.get(batch_id)
+        if batch is None:
+            handler._send_json(404, {"error": {"message": "batch not found"}})
+            return
+        batch["polls"] += 1
+        if batch["status"] in ("validating", "in_progress"):
+            if batch["polls"] >= self.batch_polls:
+                self._complete_batch(batch)
+            else:
+                batch["status"] = "in_progress"
+        handler._send_json(200, self._batch_view(batch_id))
+
+    def _complete_batch(self, batch: dict) -> None:
+        """입력 파일의 요청을 모두 처리하여 출력/오류 파일 생성"""
+        outputs, errors = [], []
+        lines = [line for line in self.files[batch["input_file_id"]].decode("utf-8").splitlines() if line.strip()]
+        if self.batch_expire_after is not None:
+            lines = lines[:self.batch_expire_after]
+        for line in lines:
+            request = json.loads(line)
+            self.batch_requests.append(request["body"])
+            status, body, _ = self._chat_response(request["body"])
+            record = {
+                "id": f"batch_req-{len(self.batch_requests)}",
+                "custom_id": request["custom_id"],
+                "response": {"status_code": status, "body": body},
+                "error": None,
+            }
+            (outputs if status == 200 else errors).append(json.dumps(record, ensure_ascii=False))
+
+        batch["output_file_id"] = self._store_file(
+            "\n".join(outputs).encode("utf-8"), "output.jsonl", "batch_output"
+        )["id"]
+        if errors:
+            batch["error_file_id"] = self._store_file(
+                "\n".join(errors).encode("utf-8"), "errors.jsonl", "batch_output"
+            )["id"]
+        batch["request_counts"] = {
+            "total": len(outputs) + len(errors), "completed": len(outputs), "failed": len(errors)
+        }
+        batch["status"] = "completed" if self.batch_expire_after is None else "expired"
@@ -0,0 +1,153 @@
+"""
+배치 작업(Batch API) 모드 테스트 (로컬 스텁 서버 사용)
+"""
+
+import json
+
+import pandas as pd
+import pytest
+
+from src.api.batch import BatchJob, BatchJobError, default_batch_state_path
+from src.api.cache import ResponseCache
+from src.raw_store import read_raw_outputs
+from tests.openai_stub import OpenAIStubServer
+
+
+@pytest.fixture
+def stub():
+    server = OpenAIStubServer(fail_inputs=["실패"]).start()
+    server.batch_polls = 3
+    yield server
+    server.stop()
+
+
+class TestBatchJob:
+    """BatchJob 제출·폴링·재개 테스트"""
+
+    def _requests(self, generator, texts):
+        return [(f"row-{i}", generator._completion_params(text)) for i, text in enumerate(texts)]
+
+    def test_run(self, stub, make_generator, tmp_path):
+        generator = make_generator(stub)
+        job = BatchJob(generator.client, str(tmp_path / "job.jsonl"), poll_interval=0)
+
+        outputs = job.run(self._requests(generator, ["문장A", "실패B"]))
+
+        assert outputs == {"row-0": "교정_문장A", "row-1": None}
+        assert stub.requests == []
+        lines = [json.loads(line) for line in open(tmp_path / "job.jsonl", encoding="utf-8")]
+        assert [line["custom_id"] for line in lines] == ["row-0", "row-1"]
+        assert lines[0]["body"]["messages"] == generator.prompt.to_messages("문장A")
+        assert job.load_state()["status"] == "completed"
+
+    def test_resume_polls_existing_batch(self, stub, make_generator, tmp_path):
+        generator = make_generator(stub)
+        requests = self._requests(generator, ["문장A"])
+        job = BatchJob(generator.client, str(tmp_path / "job.jsonl"), poll_interval=0, timeout=0)
+
+        with pytest.raises(BatchJobError):
+            job.run(requests)
+        assert job.load_state()["status"] == "in_progress"
+
+        outputs = BatchJob(generator.client, str(tmp_path / "job.jsonl"), poll_interval=0).run(requests)
+
+        assert outputs == {"row-0": "교정_문장A"}
+        assert len(stub.batches) == 1
+
+    def test_different_job_while_in_progress(self, stub, make_generator, tmp_path):
+        generator = make_generator(stub)
+        job = BatchJob(generator.client, str(tmp_path / "job.jsonl"), poll_interval=0, timeout=0)
+        with pytest.raises(BatchJobError):
+            job.run(self._requests(generator, ["문장A"]))
+
+        with pytest.raises(ValueError):
+            job.submit(self._requests(generator, ["문장B"]))
+
+    def test_expired_batch_resubmits_unfinished(self, stub, make_generator, tmp_path):
+        """만료된 배치는 완료된 요청의 결과를 유지하고 나머지만 다시 제출"""
+        generator = make_generator(stub)
+        requests = self._requests(generator, ["문장A", "문장B", "문장C"])
+        job = BatchJob(generator.client, str(tmp_path / "job.jsonl"), poll_interval=0)
+        stub.batch_expire_after = 2
+
+        assert job.run(requests) == {"row-0": "교정_문장A", "row-1": "교정_문장B"}
+        assert job.load_state()["status"] == "expired"
+
+        stub.batch_expire_after = None
+        outputs = job.run(requests)
+
+        assert outputs == {"row-0": "교정_문장A", "row-1": "교정_문장B", "row-2": "교정_문장C"}
+        assert [body["messages"] for body in stub.batch_requests[2:]] == [generator.prompt.to_messages("문장C")]
+        assert job.run(requests) == outputs
+        assert len(stub.batches) == 2
+
+
+class TestGeneratorBatchJob:
+    """생성기 배치 작업 모드 테스트"""
+
+    def test_generate_batch_job(self, stub, make_generator, tmp_path):
+        generator = make_generator(stub)
+
+        result_df = generator.generate_batch_job(["문장A", "실패B", "문장C"], str(tmp_path / "job.jsonl"), poll_interval=0)
+
+        assert result_df["cor_sentence"].tolist() == ["교정_문장A", "실패B", "교정_문장C"]
+        assert generator.last_raw == ["교정_문장A", None, "교정_문장C"]
+        assert stub.requests == []
+        assert len(stub.batch_requests) == 3
+
+    def test_cached_rows_not_submitted(self, stub, make_generator, tmp_path):
+        cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+        generator = make_generator(stub, cache=cache)
+        generator.generate_batch(["문장A"])
+
+        generator.generate_batch_job(["문장A", "문장B"], str(tmp_path / "job.jsonl"), poll_interval=0)
+
+        assert [body["messages"] for body in stub.batch_requests] == [generator.prompt.to_messages("문장B")]
+        assert generator.last_attempts == [0, 1]
+
+    def test_readonly_cache_miss(self, stub, make_generator, tmp_path):
+        """읽기 전용 캐시에 없는 행이 있으면 제출하지 않고 ValueError"""
+        path = str(tmp_path / "cache.sqlite")
+        make_generator(stub, cache=ResponseCache(path)).generate_batch(["문장A"])
+        generator = make_generator(stub, cache=ResponseCache(path, readonly=True))
+
+        result_df = generator.generate_batch_job(["문장A"], str(tmp_path / "job.jsonl"), poll_interval=0)
+        assert result_df["cor_sentence"].tolist() == ["교정_문장A"]
+
+        with pytest.raises(ValueError, match="read-only cache"):
+            generator.generate_batch_job(["문장A", "문장B"], str(tmp_path / "job.jsonl"), poll_interval=0)
+        assert stub.batches == {}
+
+    def test_generate_from_csv(self, stub, make_generator, tmp_path):
+        input_path = tmp_path / "input.csv"
+        output_path = tmp_path / "output.csv"
+        raw_path = tmp_path / "output.raw.csv"
+        job_path = tmp_path / "job.jsonl"
+        pd.DataFrame({"err_sentence": ["문장A", "문장B"]}).to_csv(input_path, index=False)
+
+        make_generator(stub).generate_from_csv(
+            str(input_path), str(output_path),
+            raw_output_path=str(raw_path), batch_job_path=str(job_path), batch_poll_interval=0
+        )
+
+        assert pd.read_csv(output_path)["cor_sentence"].tolist() == ["교정_문장A", "교정_문장B"]
+        assert read_raw_outputs(str(raw_path))["raw_sentence"].tolist() == ["교정_문장A", "교정_문장B"]
+        assert json.load(open(default_batch_state_path(str(job_path))))["status"] == "completed"
+
+    def test_rejects_packing(self, stub, make_generator, tmp_path):
+        generator = make_generator(stub, pack_size=4)
+
+        with pytest.raises(ValueError):
+            generator.generate_batch_job(["문장A"], str(tmp_path / "job.jsonl"))
+
+    @pytest.mark.parametrize("kwargs", [{"chunksize": 2}, {"resume": True}, {"journal_path": "run.journal.jsonl"}])
+    def test_from_csv_rejects_journal_options(self, stub, make_generator, tmp_path, kwargs):
+        """배치 작업은 상태 파일로 이어서 실행하므로 저널·재개·청크 옵션은 거부"""
+        input_path = tmp_path / "input.csv"
+        pd.DataFrame({"err_sentence": ["문장A"]}).to_csv(input_path, index=False)
+
+        with pytest.raises(ValueError):
+            make_generator(stub).generate_from_csv(
+                str(input_path), str(tmp_path / "output.csv"), batch_job_path=str(tmp_path / "job.jsonl"), **kwargs
+            )
+        assert stub.batch_requests == []
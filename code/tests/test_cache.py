@@ -0,0 +1,138 @@
+"""
+ResponseCache 테스트
+"""
+
+import pytest
+
+from src.api.cache import ResponseCache, CacheMissError
+
+
+MESSAGES = [{"role": "user", "content": "오늘 날씨가 않좋다"}]
+
+
+class TestCacheKey:
+    """캐시 키 생성 테스트"""
+
+    def test_same_payload_same_key(self):
+        """동일한 페이로드는 동일한 키"""
+        key1 = ResponseCache.make_key("solar-pro2", "baseline", MESSAGES, 0.0)
+        key2 = ResponseCache.make_key("solar-pro2", "baseline", [dict(MESSAGES[0])], 0.0)
+
+        assert key1 == key2
+
+    def test_parameters_change_key(self):
+        """모델, 프롬프트, 메시지, 온도가 다르면 키도 다름"""
+        base = ResponseCache.make_key("solar-pro2", "baseline", MESSAGES, 0.0)
+
+        assert base != ResponseCache.make_key("solar-mini", "baseline", MESSAGES, 0.0)
+        assert base != ResponseCache.make_key("solar-pro2", "zero_shot", MESSAGES, 0.0)
+        assert base != ResponseCache.make_key("solar-pro2", "baseline", MESSAGES, 0.7)
+        assert base != ResponseCache.make_key(
+            "solar-pro2", "baseline", [{"role": "user", "content": "다른 문장"}], 0.0
+        )
+
+    def test_prefix_key_replaces_system_message(self):
+        """prefix_key를 주면 시스템 메시지 대신 접두부 키로 구분"""
+        system = [{"role": "system", "content": "시스템"}] + MESSAGES
+
+        key = ResponseCache.make_key("solar-pro2", "baseline", system, 0.0, prefix_key="a" * 64)
+
+        assert key == ResponseCache.make_key("solar-pro2", "baseline", MESSAGES, 0.0, prefix_key="a" * 64)
+        assert key != ResponseCache.make_key("solar-pro2", "baseline", system, 0.0, prefix_key="b" * 64)
+        assert key != ResponseCache.make_key("solar-pro2", "baseline", system, 0.0)
+
+
+class TestResponseCache:
+    """캐시 저장/조회 테스트"""
+
+    def test_put_and_get(self, tmp_path):
+        """저장한 응답 조회 및 hit/miss 집계"""
+        cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+
+        assert cache.get("k1") is None
+        cache.put("k1", "교정 결과")
+        assert cache.get("k1") == "교정 결과"
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        """파일에 저장되어 재시작 후에도 조회 가능"""
+        path = str(tmp_path / "cache.sqlite")
+        with ResponseCache(path) as cache:
+            cache.put("k1", "교정 결과")
+
+        with ResponseCache(path) as cache:
+            assert cache.get("k1") == "교정 결과"
+            assert len(cache) == 1
+
+    def test_lru_eviction(self, tmp_path):
+        """max_entries 초과 시 가장 오래 사용하지 않은 항목 삭제"""
+        cache = ResponseCache(str(tmp_path / "cache.sqlite"), max_entries=2)
+
+        cache.put("k1", "a")
+        cache.put("k2", "b")
+        cache.get("k1")          # k1 최근 사용 → k2가 가장 오래됨
+        cache.put("k3", "c")
+
+        assert len(cache) == 2
+        assert cache.get("k2") is None
+        assert cache.get("k1") == "a"
+        assert cache.get("k3") == "c"
+
+    def test_readonly_mode(self, tmp_path):
+        """읽기 전용 모드는 기록하지 않음"""
+        path = str(tmp_path / "cache.sqlite")
+        with ResponseCache(path) as cache:
+            cache.put("k1", "a")
+
+        replay = ResponseCache(path, readonly=True)
+        replay.put("k2", "b")
+
+        assert replay.get("k1") == "a"
+        assert replay.get("k2") is None
+        assert len(replay) == 1
+
+    def test_readonly_missing_file(self, tmp_path):
+        """읽기 전용 모드에서 파일이 없으면 예외 발생"""
+        with pytest.raises(FileNotFoundError):
+            ResponseCache(str(tmp_path / "missing.sqlite"), readonly=True)
+
+
+class TestGeneratorWithCache:
+    """SentenceGenerator 캐시 연동 테스트 (로컬 스텁 서버 사용)"""
+
+    def test_rerun_served_from_cache(self, openai_stub, make_generator, tmp_path):
+        """동일 요청 재실행 시 API를 호출하지 않음"""
+        cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+        generator = make_generator(openai_stub, cache=cache)
+
+        first = generator.generate_batch(["문장A", "문장B"])
+        second = generator.generate_batch(["문장A", "문장B"], concurrency=2)
+
+        assert first["cor_sentence"].tolist() == second["cor_sentence"].tolist()
+        assert len(openai_stub.requests) == 2
+        assert cache.stats()["hits"] == 2
+
+    def test_key_uses_prompt_prefix_key(self, openai_stub, make_generator, tmp_path):
+        """캐시 키는 프롬프트의 prefix_key로 고정 접두부를 구분"""
+        cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+        generator = make_generator(openai_stub, cache=cache)
+        params = generator._completion_params("문장A")
+
+        assert generator._cache_key(params) == ResponseCache.make_key(
+            "solar-pro2", "baseline", params["messages"], 0.0, prefix_key=generator.prompt.prefix_key
+        )
+
+    def test_readonly_miss_falls_back(self, openai_stub, make_generator, tmp_path):
+        """읽기 전용 캐시 미스는 API 호출 없이 원문으로 대체"""
+        path = str(tmp_path / "cache.sqlite")
+        make_generator(openai_stub, cache=ResponseCache(path)).generate_single("문장A")
+
+        generator = make_generator(openai_stub, cache=ResponseCache(path, readonly=True))
+        result = generator.generate_batch(["문장A", "문장B"])
+
+        assert result["cor_sentence"].tolist() == ["교정_문장A", "문장B"]
+        assert len(openai_stub.requests) == 1
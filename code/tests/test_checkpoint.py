@@ -0,0 +1,156 @@
+"""
+GenerationJournal 및 이어서 실행(resume) 테스트
+"""
+
+import json
+
+import pandas as pd
+import pytest
+
+from src.checkpoint import GenerationJournal, default_journal_path
+from src.generator import SentenceGenerator
+
+
+class TestGenerationJournal:
+    """저널 기록/복구 테스트"""
+
+    def test_append_and_load(self, tmp_path):
+        """기록한 행을 인덱스로 복구"""
+        path = tmp_path / "run.journal.jsonl"
+        with GenerationJournal(str(path)) as journal:
+            journal.append(0, "문장A", "교정A", attempts=1)
+            journal.append(2, "문장C", "교정C", attempts=2)
+
+        done = GenerationJournal(str(path)).load()
+
+        assert set(done) == {0, 2}
+        assert done[2]["cor_sentence"] == "교정C"
+        assert done[2]["attempts"] == 2
+
+    def test_truncated_last_line_ignored(self, tmp_path):
+        """기록 도중 중단된 마지막 줄은 무시"""
+        path = tmp_path / "run.journal.jsonl"
+        with GenerationJournal(str(path)) as journal:
+            journal.append(0, "문장A", "교정A")
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"index": 1, "err_sen')
+
+        assert list(GenerationJournal(str(path)).load()) == [0]
+
+    def test_mismatched_input_raises(self, tmp_path):
+        """다른 입력으로 만든 저널은 거부"""
+        path = tmp_path / "run.journal.jsonl"
+        with GenerationJournal(str(path)) as journal:
+            journal.append(0, "문장A", "교정A")
+
+        with pytest.raises(ValueError):
+            GenerationJournal(str(path)).load(["다른 문장"])
+
+    def test_default_path(self):
+        """기본 저널 경로는 출력 파일 옆"""
+        assert default_journal_path("out/sub.csv") == "out/sub.csv.journal.jsonl"
+
+
+class TestResumableGeneration:
+    """generate_from_csv 이어서 실행 테스트 (로컬 스텁 서버 사용)"""
+
+    def _setup(self, tmp_path, sentences):
+        input_path = tmp_path / "input.csv"
+        pd.DataFrame({"err_sentence": sentences}).to_csv(input_path, index=False)
+        return str(input_path), str(tmp_path / "output.csv")
+
+    @pytest.mark.parametrize("concurrency", [1, 3])
+    def test_resume_skips_done_rows(self, openai_stub, make_generator, tmp_path, concurrency):
+        """저널에 있는 행은 다시 호출하지 않고 그대로 사용"""
+        sentences = ["문장A", "문장B", "문장C", "문장D"]
+        input_path, output_path = self._setup(tmp_path, sentences)
+        with GenerationJournal(default_journal_path(output_path)) as journal:
+            journal.append(0, "문장A", "저장된A")
+            journal.append(2, "문장C", "저장된C")
+
+        generator = make_generator(openai_stub)
+        generator.max_concurrency = concurrency
+        generator.generate_from_csv(input_path, output_path, resume=True)
+
+        result = pd.read_csv(output_path)
+        assert result["cor_sentence"].tolist() == ["저장된A", "교정_문장B", "저장된C", "교정_문장D"]
+        assert len(openai_stub.requests) == 2
+
+        # 새로 완료된 행도 저널에 추가됨 → 재실행 시 호출 없음
+        generator.generate_from_csv(input_path, output_path, resume=True)
+        assert len(openai_stub.requests) == 2
+
+    def test_without_resume_resets_journal(self, openai_stub, make_generator, tmp_path):
+        """resume 없이 저널 경로만 주면 처음부터 다시 기록"""
+        sentences = ["문장A", "문장B"]
+        input_path, output_path = self._setup(tmp_path, sentences)
+        journal_path = default_journal_path(output_path)
+        with GenerationJournal(journal_path) as journal:
+            journal.append(0, "문장A", "저장된A")
+
+        make_generator(openai_stub).generate_from_csv(
+            input_path, output_path, journal_path=journal_path
+        )
+
+        with open(journal_path, encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        assert sorted(r["index"] for r in records) == [0, 1]
+        assert len(openai_stub.requests) == 2
+        assert pd.read_csv(output_path)["cor_sentence"].tolist() == ["교정_문장A", "교정_문장B"]
+
+
+class TestStreamingGeneration:
+    """chunksize 스트리밍 생성 테스트"""
+
+    def _setup(self, tmp_path, sentences):
+        input_path = tmp_path / "input.csv"
+        pd.DataFrame({"err_sentence": sentences}).to_csv(input_path, index=False)
+        return str(input_path), str(tmp_path / "output.csv")
+
+    @pytest.mark.parametrize("chunksize", [1, 3, 10])
+    def test_matches_non_streaming_output(self, openai_stub, make_generator, tmp_path, chunksize):
+        """청크 크기와 무관하게 일괄 처리와 같은 결과"""
+        sentences = [f"문장{i}" for i in range(7)]
+        input_path, output_path = self._setup(tmp_path, sentences)
+        generator = make_generator(openai_stub)
+
+        generator.generate_from_csv(input_path, output_path, chunksize=chunksize)
+        streamed = pd.read_csv(output_path)
+        generator.generate_from_csv(input_path, output_path)
+        batched = pd.read_csv(output_path)
+
+        pd.testing.assert_frame_equal(streamed, batched)
+        assert streamed["cor_sentence"].tolist() == [f"교정_문장{i}" for i in range(7)]
+
+    def test_resume_after_written_rows(self, openai_stub, make_generator, tmp_path):
+        """출력에 기록된 행과 저널의 진행 중 청크 행은 다시 호출하지 않음"""
+        sentences = [f"문장{i}" for i in range(6)]
+        input_path, output_path = self._setup(tmp_path, sentences)
+        # 첫 청크(0~1)는 출력에 기록되었고, 두 번째 청크는 2번 행까지 저널에만 기록된 상태
+        pd.DataFrame({
+            "err_sentence": ["문장0", "문장1"],
+            "cor_sentence": ["기록0", "기록1"],
+        }).to_csv(output_path, index=False)
+        with GenerationJournal(default_journal_path(output_path)) as journal:
+            journal.append(0, "문장0", "기록0")
+            journal.append(1, "문장1", "기록1")
+            journal.append(2, "문장2", "저장된2")
+
+        make_generator(openai_stub).generate_from_csv(
+            input_path, output_path, resume=True, chunksize=2
+        )
+
+        result = pd.read_csv(output_path)
+        assert result["err_sentence"].tolist() == sentences
+        assert result["cor_sentence"].tolist() == [
+            "기록0", "기록1", "저장된2", "교정_문장3", "교정_문장4", "교정_문장5"
+        ]
+        assert len(openai_stub.requests) == 3
+
+    def test_missing_column_raises(self, tmp_path):
+        """err_sentence 컬럼이 없으면 ValueError"""
+        input_path = tmp_path / "input.csv"
+        pd.DataFrame({"text": ["문장"]}).to_csv(input_path, index=False)
+
+        with pytest.raises(ValueError, match="err_sentence"):
+            list(SentenceGenerator.iter_input_chunks(str(input_path), chunksize=2))
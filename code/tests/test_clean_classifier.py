@@ -0,0 +1,157 @@
+"""
+교정 불필요 문장 사전 분류기 테스트
+"""
+
+import pandas as pd
+import pytest
+
+from src.clean_classifier import CleanSentenceClassifier, skip_impact_report
+
+
+TRAIN = [
+    ("오늘 날씨가 않좋다.", "오늘 날씨가 안 좋다."),
+    ("김치찌게를 먹었다.", "김치찌개를 먹었다."),
+    ("오늘 날씨가 좋다.", "오늘 날씨가 좋다."),
+    ("김치를 먹었다.", "김치를 먹었다."),
+    ("날씨가 않좋아서 집에 있었다.", "날씨가 안 좋아서 집에 있었다."),
+    ("오늘 김치를 먹었다.", "오늘 김치를 먹었다."),
+    ("나도 오늘 김치를 먹었다.", "나도 오늘 김치를 먹었다."),
+]
+
+
+@pytest.fixture
+def classifier():
+    return CleanSentenceClassifier(threshold=0.9).fit(*zip(*TRAIN))
+
+
+class TestCleanSentenceClassifier:
+    """분류기 신뢰도 테스트"""
+
+    def test_clean_sentence(self, classifier):
+        assert classifier.is_clean("오늘 김치를 먹었다.")
+
+    def test_error_ngram(self, classifier):
+        assert classifier.confidence("내일 날씨가 않좋다.") < 0.9
+        assert not classifier.is_clean("김치찌게가 맛있다.")
+
+    def test_unseen_typo_not_clean(self, classifier):
+        """기본 설정에서 Train에 없던 오타가 섞인 문장은 건너뛰지 않음"""
+        assert not classifier.is_clean("김치를 먹엇다.")
+        assert not classifier.is_clean("어제 밥을 먹엇다")
+
+    def test_rarely_seen_ngram_not_clean(self):
+        """정답 문장에 min_clean_count번 미만 나온 n-gram은 근거 없음"""
+        classifier = CleanSentenceClassifier().fit(["나는 학교에 갔다."], ["나는 학교에 갔다."])
+
+        assert not classifier.is_clean("나는 학교에 갔다.")
+        assert CleanSentenceClassifier(min_clean_count=1).fit(
+            ["나는 학교에 갔다."], ["나는 학교에 갔다."]
+        ).is_clean("나는 학교에 갔다.")
+
+    def test_unfitted_classifier(self):
+        """학습 전에는 규칙에 걸리지 않는 문장도 건너뛰지 않음"""
+        classifier = CleanSentenceClassifier()
+
+        assert not classifier.is_fitted
+        assert not classifier.is_clean("qwerty zxcv")
+
+    def test_rule_patterns(self, classifier):
+        """후처리기 규칙 패턴에 걸리면 신뢰도 0"""
+        assert classifier.confidence("금새 끝났다.") == 0.0
+        assert classifier.confidence("그렇게 해보자.") == 0.0
+
+    def test_unseen_risk(self):
+        classifier = CleanSentenceClassifier(unseen_risk=0.2)
+
+        assert classifier.confidence("처음 보는 문장") == pytest.approx(0.8)
+        assert classifier.confidence("  ") == 0.0
+
+    def test_from_csv(self, tmp_path):
+        path = tmp_path / "train.csv"
+        pd.DataFrame(TRAIN, columns=["err_sentence", "cor_sentence"]).to_csv(path, index=False)
+
+        assert CleanSentenceClassifier.from_csv(str(path)).error_counts["않좋"] == 2
+
+        pd.DataFrame({"err_sentence": ["a"]}).to_csv(path, index=False)
+        with pytest.raises(ValueError):
+            CleanSentenceClassifier.from_csv(str(path))
+
+        pd.DataFrame({"err_sentence": [], "cor_sentence": []}).to_csv(path, index=False)
+        with pytest.raises(ValueError):
+            CleanSentenceClassifier.from_csv(str(path))
+
+    @pytest.mark.parametrize("kwargs", [
+        {"threshold": 1.5}, {"unseen_risk": -0.1}, {"min_clean_count": 0}, {"ngram_sizes": ()}
+    ])
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            CleanSentenceClassifier(**kwargs)
+
+
+class TestSkipImpactReport:
+    """Recall 영향 보고서 테스트"""
+
+    def test_report(self):
+        classifier = CleanSentenceClassifier().fit(*zip(*TRAIN))
+        true_df = pd.DataFrame({
+            "err_sentence": ["오늘 김치를 먹었다.", "날씨가 않좋다.", "김치찌개를 먹엇다."],
+            "cor_sentence": ["오늘 김치를 먹었다.", "날씨가 안 좋다.", "김치찌개를 먹었다."],
+        })
+
+        report = skip_impact_report(classifier, true_df, thresholds=[0.0, 0.9])
+
+        assert report["threshold"].tolist()[1:] == [0.0, 0.9]
+        baseline, skip_all, skip_clean = report.to_dict("records")
+        assert baseline["recall"] == pytest.approx(100.0)
+        assert skip_all["skipped"] == 3 and skip_all["recall"] == 0.0
+        # 학습에 없던 오류(먹엇다)는 근거가 없으므로 건너뛰지 않아 Recall이 유지됨
+        assert skip_clean["skipped"] == 1
+        assert skip_clean["skipped_needing_correction"] == 0
+        assert skip_clean["recall_delta"] == 0.0
+
+    def test_length_mismatch(self, classifier):
+        true_df = pd.DataFrame({"err_sentence": ["a"], "cor_sentence": ["a"]})
+
+        with pytest.raises(ValueError):
+            skip_impact_report(classifier, true_df, pd.DataFrame({"cor_sentence": ["a", "b"]}))
+
+
+class TestGeneratorSkip:
+    """생성기 사전 분류기 연동 테스트 (로컬 스텁 서버 사용)"""
+
+    @pytest.mark.parametrize("kwargs", [{}, {"max_concurrency": 4}, {"pack_size": 4}])
+    def test_clean_rows_skip_api(self, openai_stub, make_generator, classifier, kwargs):
+        generator = make_generator(openai_stub, clean_classifier=classifier, **kwargs)
+        sentences = ["오늘 김치를 먹었다.", "날씨가 않좋다.", "김치를 먹었다.", "오늘 김치를 먹었다."]
+
+        result_df = generator.generate_batch(sentences)
+
+        assert result_df["cor_sentence"].tolist() == [
+            "오늘 김치를 먹었다.", "교정_날씨가 않좋다.", "김치를 먹었다.", "오늘 김치를 먹었다."
+        ]
+        assert len(openai_stub.requests) == 1
+        assert generator.skipped_clean == 2
+        assert generator.last_attempts == [0, 1, 0, 0]
+
+    def test_batch_job_skips_clean_rows(self, openai_stub, make_generator, classifier, tmp_path):
+        generator = make_generator(openai_stub, enable_postprocessing=True, clean_classifier=classifier)
+
+        result_df = generator.generate_batch_job(
+            ["오늘 김치를 먹었다.", "날씨가 않좋다.", "김치를 먹었다.", "오늘 김치를 먹었다."],
+            str(tmp_path / "job.jsonl"), poll_interval=0
+        )
+
+        assert result_df["cor_sentence"].tolist()[0] == "오늘 김치를 먹었다."
+        assert len(openai_stub.batch_requests) == 1
+        assert generator.skipped_clean == 2
+
+    def test_unfitted_classifier_rejected(self, openai_stub, make_generator):
+        with pytest.raises(ValueError):
+            make_generator(openai_stub, clean_classifier=CleanSentenceClassifier())
+
+    def test_generate_single_skips_clean(self, openai_stub, make_generator, classifier):
+        generator = make_generator(openai_stub, clean_classifier=classifier)
+
+        assert generator.generate_single("오늘 김치를 먹었다.") == "오늘 김치를 먹었다."
+        assert openai_stub.requests == []
+        assert generator.skipped_clean == 1
@@ -6,6 +6,7 @@ import pytest
 import pandas as pd
 
 from src.evaluator import Evaluator
+from src.metrics import incremental as incremental_module
 
 
 class TestEvaluatorInit:
@@ -375,3 +376,94 @@ class TestEvaluatorEdgeCases:
 
         # 교정이 필요 없는 경우
         assert result is not None
+
+
+class TestEvaluatorParallel:
+    """workers 옵션 (프로세스 풀 병렬 평가) 테스트"""
+
+    def _make_data(self, n):
+        words = ["오늘", "날씨가", "좋다", "않좋다", "안", "매우"]
+        originals = [" ".join(words[(i + k) % 6] for k in range(1 + i % 5)) for i in range(n)]
+        goldens = [o.replace("않좋다", "안좋다") for o in originals]
+        predictions = [o.replace("않좋다", "안좋다") if i % 3 else o.replace("매우", "아주") for i, o in enumerate(originals)]
+        return (
+            pd.DataFrame({'err_sentence': originals, 'cor_sentence': goldens}),
+            pd.DataFrame({'cor_sentence': predictions})
+        )
+
+    def test_parallel_matches_sequential(self):
+        """병렬 결과가 순차 결과와 같고 행 순서 유지"""
+        true_df, pred_df = self._make_data(103)
+        evaluator = Evaluator()
+
+        sequential = evaluator.evaluate(true_df, pred_df)
+        parallel = evaluator.evaluate(true_df, pred_df, workers=3)
+
+        for key in ['recall', 'precision', 'true_positives', 'false_positives',
+                    'false_missings', 'false_redundants']:
+            assert parallel[key] == sequential[key]
+        pd.testing.assert_frame_equal(parallel['analysis_df'], sequential['analysis_df'])
+
+    def test_invalid_workers(self):
+        """workers가 1 미만이면 ValueError"""
+        true_df, pred_df = self._make_data(3)
+
+        with pytest.raises(ValueError):
+            Evaluator().evaluate(true_df, pred_df, workers=0)
+
+
+class TestEvaluatorIncremental:
+    """증분 평가 모드 테스트"""
+
+    def _make_data(self):
+        true_df = pd.DataFrame({
+            'err_sentence': ['오늘 날씨가 않좋다', '나는 학교에 갔다', '밥을 먹었다'],
+            'cor_sentence': ['오늘 날씨가 안좋다', '나는 학교에 갔다', '밥을 먹었어요']
+        })
+        return true_df, ['오늘 날씨가 안좋다', '나는 학교를 갔다', '밥을 먹었다']
+
+    def test_rescores_changed_rows_only(self):
+        """같은 정답으로 반복 평가하면 달라진 행만 다시 채점하고 결과는 전체 평가와 같음"""
+        true_df, predictions = self._make_data()
+        evaluator = Evaluator(incremental=True)
+
+        first = evaluator.evaluate(true_df, pd.DataFrame({'cor_sentence': predictions}))
+        predictions[1] = '나는 학교에 갔다'
+        second = evaluator.evaluate(true_df, pd.DataFrame({'cor_sentence': predictions}))
+        expected = Evaluator().evaluate(true_df, pd.DataFrame({'cor_sentence': predictions}))
+
+        assert first['changed_rows'] == 3
+        assert second['changed_rows'] == 1
+        for key in ['recall', 'precision', 'true_positives', 'false_positives',
+                    'false_missings', 'false_redundants']:
+            assert second[key] == expected[key]
+        pd.testing.assert_frame_equal(second['analysis_df'], expected['analysis_df'])
+
+    def test_new_truth_rebuilds(self):
+        """정답 데이터가 바뀌면 새로 채점"""
+        true_df, predictions = self._make_data()
+        evaluator = Evaluator(incremental=True)
+        evaluator.evaluate(true_df, pd.DataFrame({'cor_sentence': predictions}))
+
+        result = evaluator.evaluate(true_df.iloc[:2], pd.DataFrame({'cor_sentence': predictions[:2]}))
+
+        assert result['changed_rows'] == 2
+        assert len(result['analysis_df']) == 2
+
+    def test_workers_shard_changed_rows(self, monkeypatch):
+        """workers > 1이면 달라진 행을 프로세스 풀로 나눠 채점"""
+        true_df, predictions = self._make_data()
+        calls = []
+        original_fn = incremental_module._score_parallel
+
+        def counting(originals, *args):
+            calls.append(len(originals))
+            return original_fn(originals, *args)
+
+        monkeypatch.setattr(incremental_module, "_score_parallel", counting)
+        result = Evaluator(incremental=True).evaluate(true_df, pd.DataFrame({'cor_sentence': predictions}), workers=2)
+        expected = Evaluator().evaluate(true_df, pd.DataFrame({'cor_sentence': predictions}))
+
+        assert calls == [3]
+        assert result['recall'] == expected['recall']
+        assert result['precision'] == expected['precision']
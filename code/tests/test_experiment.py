@@ -0,0 +1,85 @@
+"""
+ExperimentRunner (프로세스 내 실험 실행기) 테스트
+"""
+
+import pandas as pd
+import pytest
+
+from src.evaluator import Evaluator
+from src.experiment import ExperimentRunner
+from src.generator import SentenceGenerator
+from src.raw_store import default_raw_path, read_raw_outputs
+
+
+def _make_runner(stub, tmp_path, test_columns=None):
+    train_path = tmp_path / "train.csv"
+    test_path = tmp_path / "test.csv"
+    pd.DataFrame({
+        "err_sentence": ["문장A", "문장B"],
+        "cor_sentence": ["교정_문장A", "문장B"],
+    }).to_csv(train_path, index=False)
+    pd.DataFrame(test_columns or {"id": ["t1", "t2", "t3"], "err_sentence": ["문장C", "문장D", "문장E"]}).to_csv(
+        test_path, index=False
+    )
+    generator = SentenceGenerator(
+        prompt_name="baseline",
+        api_key="test-key",
+        base_url=stub.base_url,
+        enable_postprocessing=False
+    )
+    return ExperimentRunner(
+        generator=generator,
+        evaluator=Evaluator(),
+        train_path=str(train_path),
+        test_path=str(test_path),
+        output_dir=str(tmp_path / "outputs")
+    )
+
+
+class TestExperimentRunner:
+    """단계 실행, 결과 파일, 단계별 시간 기록 테스트"""
+
+    def test_run_writes_outputs_and_timings(self, openai_stub, tmp_path):
+        runner = _make_runner(openai_stub, tmp_path)
+
+        result = runner.run()
+
+        assert list(result["timings"]) == ["load", "generate_train", "evaluate", "generate_test"]
+        assert all(seconds >= 0 for seconds in result["timings"].values())
+        assert len(openai_stub.requests) == 5
+        assert result["evaluation"]["true_positives"] == 1
+
+        test_df = pd.read_csv(result["test_output"])
+        assert list(test_df.columns) == ["id", "err_sentence", "cor_sentence"]
+        assert test_df["cor_sentence"].tolist() == ["교정_문장C", "교정_문장D", "교정_문장E"]
+        assert len(pd.read_csv(result["analysis_output"])) == 2
+        assert read_raw_outputs(default_raw_path(result["train_output"]))["raw_sentence"].tolist() == [
+            "교정_문장A", "교정_문장B"
+        ]
+
+    def test_test_without_id(self, openai_stub, tmp_path):
+        runner = _make_runner(openai_stub, tmp_path, {"err_sentence": ["문장C"]})
+
+        result = runner.run()
+
+        assert list(pd.read_csv(result["test_output"]).columns) == ["err_sentence", "cor_sentence"]
+
+    def test_missing_column_raises(self, openai_stub, tmp_path):
+        runner = _make_runner(openai_stub, tmp_path, {"sentence": ["문장C"]})
+
+        with pytest.raises(ValueError):
+            runner.run()
+        assert "load" in runner.timings
+        assert len(openai_stub.requests) == 0
+
+    def test_incremental_evaluator_reused_across_runs(self, openai_stub, tmp_path):
+        """incremental 평가기를 주면 반복 실행 시 달라진 행만 다시 채점"""
+        runner = _make_runner(openai_stub, tmp_path)
+        runner.evaluator = Evaluator(incremental=True)
+
+        first = runner.run()
+        second = runner.run()
+
+        assert first["evaluation"]["changed_rows"] == 2
+        assert second["evaluation"]["changed_rows"] == 0
+        assert second["evaluation"]["true_positives"] == first["evaluation"]["true_positives"] == 1
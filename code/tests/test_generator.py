@@ -4,10 +4,12 @@ Mock을 사용하여 API 호출 없이 테스트
 """
 
 import os
+import asyncio
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import pandas as pd
 
+from src.api.retry import RetryPolicy
 from src.generator import SentenceGenerator
 
 
@@ -208,6 +210,164 @@ class TestSentenceGeneratorBatch:
         assert result_df["err_sentence"].tolist() == sentences
 
 
+class TestSentenceGeneratorAsyncBatch:
+    """비동기 동시 배치 생성 테스트 (로컬 스텁 서버 사용)"""
+
+    def test_concurrent_batch_preserves_order(self, openai_stub):
+        """동시 실행 시에도 입력 순서대로 결과 반환"""
+        openai_stub.latency = 0.05
+        generator = SentenceGenerator(
+            prompt_name="baseline",
+            api_key="test-key",
+            base_url=openai_stub.base_url,
+            enable_postprocessing=False,
+            max_concurrency=8
+        )
+        sentences = [f"문장{i}" for i in range(20)]
+
+        result_df = generator.generate_batch(sentences)
+
+        assert result_df["err_sentence"].tolist() == sentences
+        assert result_df["cor_sentence"].tolist() == [f"교정_{s}" for s in sentences]
+
+    def test_concurrency_limit_respected(self, openai_stub):
+        """동시 요청 수가 설정값을 넘지 않음"""
+        openai_stub.latency = 0.05
+        generator = SentenceGenerator(
+            prompt_name="baseline",
+            api_key="test-key",
+            base_url=openai_stub.base_url,
+            enable_postprocessing=False
+        )
+
+        generator.generate_batch([f"문장{i}" for i in range(12)], concurrency=4)
+
+        assert 1 < openai_stub.max_in_flight <= 4
+        assert len(openai_stub.requests) == 12
+
+    def test_failed_row_falls_back_to_original(self, openai_stub):
+        """실패한 행만 원문으로 대체"""
+        openai_stub.fail_inputs = ["실패문장"]
+        generator = SentenceGenerator(
+            prompt_name="baseline",
+            api_key="test-key",
+            base_url=openai_stub.base_url,
+            enable_postprocessing=False,
+            max_concurrency=4,
+            retry_policy=RetryPolicy(max_attempts=2, base_delay=0.01)
+        )
+
+        result_df = generator.generate_batch(["문장A", "실패문장", "문장C"])
+
+        assert result_df["cor_sentence"].tolist() == ["교정_문장A", "실패문장", "교정_문장C"]
+
+    def test_invalid_concurrency(self):
+        """max_concurrency가 1 미만이면 예외 발생"""
+        with pytest.raises(ValueError):
+            SentenceGenerator(prompt_name="baseline", api_key="test-key", max_concurrency=0)
+
+
+class TestSentenceGeneratorDedup:
+    """배치 내 중복 요청 제거 테스트 (로컬 스텁 서버 사용)"""
+
+    @pytest.mark.parametrize("concurrency", [1, 4])
+    def test_duplicates_coalesced(self, openai_stub, make_generator, concurrency):
+        """정규화 결과가 같은 입력은 요청 하나로 처리하고 결과를 모든 행에 나눠줌"""
+        generator = make_generator(openai_stub, max_concurrency=concurrency)
+        sentences = ["문장A", "문장B", "문장A", " 문장A ", "문장B"]
+        rows = []
+
+        result_df = generator.generate_batch(sentences, on_row=lambda index, *row: rows.append(index))
+
+        assert result_df["cor_sentence"].tolist() == ["교정_문장A", "교정_문장B", "교정_문장A", "교정_문장A", "교정_문장B"]
+        assert len(openai_stub.requests) == 2
+        assert generator.last_attempts == [1, 1, 0, 0, 0]
+        assert generator.last_raw == ["교정_문장A", "교정_문장B", "교정_문장A", "교정_문장A", "교정_문장B"]
+        assert sorted(rows) == list(range(5))
+        stats = generator.dedup_stats()
+        assert (stats["rows"], stats["unique"], stats["duplicates"]) == (5, 2, 3)
+        assert stats["dedup_ratio"] == pytest.approx(60.0)
+
+    def test_failed_duplicates_keep_own_original(self, openai_stub, make_generator):
+        """실패한 입력의 중복 행은 각자의 원문 유지"""
+        openai_stub.fail_inputs = ["실패"]
+        generator = make_generator(openai_stub, retry_policy=RetryPolicy(max_attempts=1))
+
+        result_df = generator.generate_batch(["실패문장", "실패문장 "])
+
+        assert result_df["cor_sentence"].tolist() == ["실패문장", "실패문장 "]
+        assert generator.last_raw == [None, None]
+        assert len(openai_stub.requests) == 1
+
+    def test_disabled(self, openai_stub, make_generator):
+        """deduplicate=False면 행마다 요청"""
+        generator = make_generator(openai_stub, deduplicate=False)
+
+        generator.generate_batch(["문장A", "문장A"])
+
+        assert len(openai_stub.requests) == 2
+
+    def test_concurrent_callers_share_future(self, openai_stub, make_generator):
+        """동시에 실행되는 비동기 배치가 같은 입력의 진행 중인 요청을 공유"""
+        openai_stub.latency = 0.1
+        generator = make_generator(openai_stub, max_concurrency=4)
+
+        async def run():
+            return await asyncio.gather(
+                generator.agenerate_batch(["문장A", "문장B"]),
+                generator.agenerate_batch(["문장A", "문장C"])
+            )
+
+        first, second = asyncio.run(run())
+
+        assert first == ["교정_문장A", "교정_문장B"]
+        assert second == ["교정_문장A", "교정_문장C"]
+        assert len(openai_stub.requests) == 3
+        assert generator.dedup_stats()["shared_in_flight"] == 1
+        assert generator._inflight == {}
+
+    def test_shared_failure_counts_calls_once(self, openai_stub, make_generator):
+        """진행 중인 요청이 실패하면 기다린 쪽은 원문을 유지하고 호출 횟수는 0으로 기록"""
+        openai_stub.latency = 0.1
+        openai_stub.fail_inputs = ["실패"]
+        generator = make_generator(
+            openai_stub, max_concurrency=4, retry_policy=RetryPolicy(max_attempts=2, base_delay=0.01)
+        )
+        attempts = []
+
+        async def run():
+            return await asyncio.gather(
+                generator.agenerate_batch(["실패문장"], on_row=lambda index, *row: attempts.append(row[1])),
+                generator.agenerate_batch(["실패문장"], on_row=lambda index, *row: attempts.append(row[1]))
+            )
+
+        first, second = asyncio.run(run())
+
+        assert first == second == ["실패문장"]
+        assert generator.dedup_stats()["shared_in_flight"] == 1
+        assert sorted(attempts) == [0, 2]
+        assert sum(attempts) == len(openai_stub.requests)
+
+    def test_owner_cancel_does_not_abort_waiter(self, openai_stub, make_generator):
+        """요청한 쪽이 취소되어도 기다리던 쪽은 직접 요청해 결과를 받음"""
+        openai_stub.latency = 0.2
+        generator = make_generator(openai_stub, max_concurrency=4)
+
+        async def run():
+            owner = asyncio.create_task(generator.agenerate_batch(["문장A"]))
+            await asyncio.sleep(0.05)
+            waiter = asyncio.create_task(generator.agenerate_batch(["문장A"]))
+            await asyncio.sleep(0.05)
+            owner.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await owner
+            return await waiter
+
+        assert asyncio.run(run()) == ["교정_문장A"]
+        assert generator.dedup_stats()["shared_in_flight"] == 0
+        assert len(openai_stub.requests) == 2
+
+
 class TestSentenceGeneratorFromCSV:
     """generate_from_csv 메서드 테스트"""
 
@@ -0,0 +1,109 @@
+"""
+GoldenDiffIndex (정답 차이점 인덱스) 테스트
+"""
+
+import pandas as pd
+import pytest
+
+from src.evaluator import Evaluator
+from src.metrics import golden_index as golden_index_module
+from src.metrics.evaluator import evaluate_correction
+from src.metrics.golden_index import GoldenDiffIndex
+from src.metrics.lcs import find_differences_with_offsets
+
+
+ORIGINALS = ["오늘 날씨가 않좋다", "나는 학교에 갔다", "밥을 먹었다"]
+GOLDENS = ["오늘 날씨가 안좋다", "나는 학교에 갔다", "밥을 먹었어요"]
+PREDICTIONS = ["오늘 날씨가 안좋다", "나는 학교를 갔다", "밥을 먹었다"]
+
+
+class TestGoldenDiffIndex:
+    """인덱스 생성/저장/재사용 테스트"""
+
+    def test_build(self):
+        """행별 원문→정답 차이점 계산"""
+        index = GoldenDiffIndex.build(ORIGINALS, GOLDENS)
+
+        assert len(index) == 3
+        assert index.differences[0] == find_differences_with_offsets(ORIGINALS[0], GOLDENS[0])
+        assert index.differences[1] == []
+
+    def test_hash_depends_on_content(self):
+        """내용이 바뀌면 해시도 바뀜 (NaN과 문자열 'nan' 구분)"""
+        base = GoldenDiffIndex.hash_dataset(ORIGINALS, GOLDENS)
+
+        assert GoldenDiffIndex.hash_dataset(ORIGINALS, GOLDENS) == base
+        assert GoldenDiffIndex.hash_dataset(ORIGINALS, GOLDENS[:2] + ["밥을 먹었다"]) != base
+        assert GoldenDiffIndex.hash_dataset(["nan"], ["a"]) != GoldenDiffIndex.hash_dataset([float("nan")], ["a"])
+
+    def test_save_and_load(self, tmp_path):
+        """저장 후 읽으면 같은 차이점(튜플) 복원"""
+        index = GoldenDiffIndex.build(ORIGINALS, GOLDENS)
+        path = tmp_path / "golden.json"
+        index.save(str(path))
+
+        loaded = GoldenDiffIndex.load(str(path))
+
+        assert loaded.dataset_hash == index.dataset_hash
+        assert loaded.differences == index.differences
+
+    def test_load_or_build_reuses_cached_index(self, tmp_path, monkeypatch):
+        """같은 데이터셋이면 두 번째 호출에서 차이점을 계산하지 않음"""
+        GoldenDiffIndex.load_or_build(ORIGINALS, GOLDENS, str(tmp_path))
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+        def fail(*args):
+            raise AssertionError("golden diffs recomputed")
+
+        monkeypatch.setattr(golden_index_module, "find_differences_with_offsets", fail)
+        index = GoldenDiffIndex.load_or_build(ORIGINALS, GOLDENS, str(tmp_path))
+
+        assert index.matches(ORIGINALS, GOLDENS)
+
+
+class TestEvaluateWithGoldenIndex:
+    """golden_index를 사용한 평가 테스트"""
+
+    def _frames(self):
+        return (
+            pd.DataFrame({"err_sentence": ORIGINALS, "cor_sentence": GOLDENS}),
+            pd.DataFrame({"cor_sentence": PREDICTIONS}),
+        )
+
+    def test_same_result_as_without_index(self):
+        """인덱스 사용 여부와 무관하게 같은 점수"""
+        true_df, pred_df = self._frames()
+        index = GoldenDiffIndex.from_dataframe(true_df)
+
+        expected = evaluate_correction(true_df, pred_df)
+        result = evaluate_correction(true_df, pred_df, golden_index=index)
+
+        for key in ["true_positives", "false_positives", "false_missings", "false_redundants"]:
+            assert result[key] == expected[key]
+        pd.testing.assert_frame_equal(result["analysis_df"], expected["analysis_df"])
+
+    def test_mismatched_index_raises(self):
+        """다른 데이터셋의 인덱스면 ValueError"""
+        true_df, pred_df = self._frames()
+        index = GoldenDiffIndex.build(ORIGINALS, ["다른 정답"] * 3)
+
+        with pytest.raises(ValueError):
+            evaluate_correction(true_df, pred_df, golden_index=index)
+
+    def test_evaluator_computes_only_prediction_diffs(self, tmp_path, monkeypatch):
+        """캐시된 인덱스가 있으면 행마다 예측 쪽 차이점만 계산"""
+        true_df, pred_df = self._frames()
+        evaluator = Evaluator(golden_cache_dir=str(tmp_path))
+        evaluator.evaluate(true_df, pred_df)
+
+        calls = []
+        original_fn = find_differences_with_offsets
+
+        def counting(original, corrected, vocab=None):
+            calls.append(corrected)
+            return original_fn(original, corrected, vocab)
+
+        monkeypatch.setattr("src.metrics.evaluator.find_differences_with_offsets", counting)
+        evaluator.evaluate(true_df, pred_df)
+
+        assert calls == PREDICTIONS
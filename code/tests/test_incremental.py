@@ -0,0 +1,133 @@
+"""
+IncrementalEvaluator (증분 평가) 테스트
+"""
+
+import pandas as pd
+import pytest
+
+from src.metrics import incremental as incremental_module
+from src.metrics.evaluator import evaluate_correction
+from src.metrics.golden_index import GoldenDiffIndex
+from src.metrics.incremental import IncrementalEvaluator
+
+
+ORIGINALS = ["오늘 날씨가 않좋다", "나는 학교에 갔다", "밥을 먹었다", "그는 빨리 달렸다"]
+GOLDENS = ["오늘 날씨가 안좋다", "나는 학교에 갔다", "밥을 먹었어요", "그는 빨리 달렸다"]
+
+
+def _true_df():
+    return pd.DataFrame({"err_sentence": ORIGINALS, "cor_sentence": GOLDENS})
+
+
+def _assert_same_as_full(result, predictions):
+    expected = evaluate_correction(_true_df(), pd.DataFrame({"cor_sentence": predictions}))
+    for key in ["recall", "precision", "true_positives", "false_positives",
+                "false_missings", "false_redundants"]:
+        assert result[key] == expected[key]
+    return expected
+
+
+class TestIncrementalEvaluator:
+    """증분 채점 테스트"""
+
+    def test_first_update_matches_full_evaluation(self):
+        """첫 채점은 전체 평가와 같은 결과"""
+        predictions = ["오늘 날씨가 안좋다", "나는 학교를 갔다", "밥을 먹었다", "그는 빨리 달렸다"]
+        evaluator = IncrementalEvaluator(_true_df())
+
+        result = evaluator.update(predictions)
+
+        expected = _assert_same_as_full(result, predictions)
+        assert result["changed_rows"] == 4
+        pd.testing.assert_frame_equal(evaluator.analysis_df(), expected["analysis_df"])
+
+    def test_only_changed_rows_rescored(self, monkeypatch):
+        """바뀐 행만 다시 채점하고 합계는 전체 평가와 일치"""
+        first = ["오늘 날씨가 안좋다", "나는 학교를 갔다", "밥을 먹었다", "그는 빨리 달렸다"]
+        second = ["오늘 날씨가 안좋다", "나는 학교에 갔다", "밥을 먹었다", "그는 빨리 달렸다"]
+        evaluator = IncrementalEvaluator(_true_df())
+        evaluator.update(first)
+
+        calls = []
+        original_fn = incremental_module.find_differences_with_offsets
+
+        def counting(original, corrected, vocab=None):
+            calls.append(corrected)
+            return original_fn(original, corrected, vocab)
+
+        monkeypatch.setattr(incremental_module, "find_differences_with_offsets", counting)
+        result = evaluator.update(second)
+
+        assert calls == ["나는 학교에 갔다"]
+        assert result["changed_rows"] == 1
+        _assert_same_as_full(result, second)
+
+        # 이전 예측으로 되돌리면 캐시에서 점수를 가져옴
+        result = evaluator.update(first)
+        assert calls == ["나는 학교에 갔다"]
+        _assert_same_as_full(result, first)
+
+    def test_accepts_dataframe_and_golden_index(self):
+        """cor_sentence 컬럼 데이터프레임과 미리 계산한 인덱스 사용"""
+        predictions = pd.DataFrame({"cor_sentence": GOLDENS})
+        index = GoldenDiffIndex.build(ORIGINALS, GOLDENS)
+
+        result = IncrementalEvaluator(_true_df(), golden_index=index).update(predictions)
+
+        assert result["recall"] == 100.0
+        assert result["precision"] == 100.0
+
+    def test_cache_limit(self):
+        """캐시 항목 수 제한"""
+        evaluator = IncrementalEvaluator(_true_df(), max_cache_entries=2)
+        evaluator.update(GOLDENS)
+
+        assert len(evaluator._cache) == 2
+
+    def test_cache_reset_drops_vocab(self):
+        """캐시가 차면 어휘도 함께 비우고 점수는 전체 평가와 같음"""
+        predictions = ["오늘 날씨가 안좋다", "나는 학교를 갔다", "밥을 먹었다", "그는 아주 빨리 달렸다"]
+        evaluator = IncrementalEvaluator(_true_df(), max_cache_entries=2)
+
+        result = evaluator.update(predictions)
+
+        # 세 번째 행을 넣을 때 캐시가 비워지므로 마지막 행의 토큰만 어휘에 남음
+        assert "않좋다" not in evaluator.vocab
+        assert "밥을" not in evaluator.vocab
+        assert "아주" in evaluator.vocab
+        _assert_same_as_full(result, predictions)
+
+    def test_nan_prediction_not_rescored(self, monkeypatch):
+        """NaN 예측이 그대로면 다시 채점하지 않음"""
+        predictions = [float("nan"), "나는 학교에 갔다", None, "그는 빨리 달렸다"]
+        evaluator = IncrementalEvaluator(_true_df())
+        evaluator.update(predictions)
+
+        calls = []
+        monkeypatch.setattr(
+            incremental_module, "find_differences_with_offsets", lambda *args: calls.append(args)
+        )
+        result = evaluator.update([float("nan"), "나는 학교에 갔다", float("nan"), "그는 빨리 달렸다"])
+
+        assert calls == []
+        assert result["changed_rows"] == 0
+
+    def test_parallel_matches_sequential(self):
+        """workers > 1이면 바뀐 행을 프로세스 풀에서 채점하고 결과는 같음"""
+        first = ["오늘 날씨가 안좋다", "나는 학교를 갔다", "밥을 먹었다", "그는 빨리 달렸다"]
+        evaluator = IncrementalEvaluator(_true_df())
+
+        result = evaluator.update(first, workers=2)
+
+        assert result["changed_rows"] == 4
+        _assert_same_as_full(result, first)
+        assert len(evaluator._cache) == 4
+
+    def test_invalid_workers(self):
+        with pytest.raises(ValueError):
+            IncrementalEvaluator(_true_df()).update(GOLDENS, workers=0)
+
+    def test_length_mismatch_raises(self):
+        """예측 행 수가 다르면 ValueError"""
+        with pytest.raises(ValueError):
+            IncrementalEvaluator(_true_df()).update(GOLDENS[:2])
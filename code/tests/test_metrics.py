@@ -2,15 +2,22 @@
 LCS 기반 메트릭 모듈 테스트
 """
 
+import random
+
 import pytest
 import pandas as pd
+from src.metrics import lcs as lcs_module
 from src.metrics.lcs import (
     tokenize,
     lcs_table,
+    lcs_bit_rows,
     find_lcs,
+    find_lcs_reference,
+    find_lcs_linear,
     find_differences_with_offsets
 )
-from src.metrics.evaluator import evaluate_correction
+from src.metrics.evaluator import evaluate_correction, score_pair
+from src.metrics.vocab import Vocabulary
 
 
 class TestTokenize:
@@ -200,6 +207,132 @@ class TestFindDifferences:
         assert differences == []
 
 
+def _random_tokens(rng, alphabet, max_len):
+    """작은 어휘에서 무작위 토큰열 생성 (동점 경로가 많이 생기도록)"""
+    return [rng.choice(alphabet) for _ in range(rng.randint(0, max_len))]
+
+
+class TestBitParallelLCS:
+    """비트 병렬 LCS와 원본 테이블 구현의 동치성 테스트 (시드 고정 무작위 속성 테스트)"""
+
+    ALPHABET = ["가", "나", "다", "라", "마"]
+
+    def test_bit_rows_reproduce_table(self):
+        """비트 행 벡터로 복원한 값이 lcs_table과 같음"""
+        rng = random.Random(0)
+        for _ in range(200):
+            X = _random_tokens(rng, self.ALPHABET, 12)
+            Y = _random_tokens(rng, self.ALPHABET, 12)
+            table = lcs_table(X, Y)
+            rows = lcs_bit_rows(X, Y)
+            for i, V in enumerate(rows):
+                for j in range(len(Y) + 1):
+                    assert j - (V & ((1 << j) - 1)).bit_count() == table[i][j]
+
+    @pytest.mark.parametrize("seed,max_len", [(1, 8), (2, 30), (3, 150)])
+    def test_find_lcs_matches_reference(self, seed, max_len):
+        """동점 처리까지 포함해 원본과 같은 LCS 반환 (64토큰 초과 포함)"""
+        rng = random.Random(seed)
+        for _ in range(300 if max_len < 100 else 30):
+            X = _random_tokens(rng, self.ALPHABET, max_len)
+            Y = _random_tokens(rng, self.ALPHABET, max_len)
+            assert find_lcs(X, Y) == find_lcs_reference(X, Y)
+
+    def test_differences_match_reference(self, monkeypatch):
+        """find_differences_with_offsets 결과가 원본 LCS 사용 시와 같음"""
+        rng = random.Random(4)
+        pairs = []
+        for _ in range(300):
+            original = _random_tokens(rng, self.ALPHABET, 20)
+            # 원문 일부를 바꾼 교정문 (실제 교정과 비슷한 분포)
+            corrected = [
+                rng.choice(self.ALPHABET) if rng.random() < 0.2 else token
+                for token in original if rng.random() > 0.1
+            ]
+            pairs.append((" ".join(original), " ".join(corrected)))
+
+        fast = [find_differences_with_offsets(o, c) for o, c in pairs]
+        monkeypatch.setattr(lcs_module, "find_lcs", find_lcs_reference)
+        reference = [find_differences_with_offsets(o, c) for o, c in pairs]
+
+        assert fast == reference
+
+
+class TestVocabulary:
+    """토큰 ID 어휘 테스트"""
+
+    def test_ids_are_stable_and_dense(self):
+        """같은 토큰은 같은 ID, 새 토큰은 순서대로 부여"""
+        vocab = Vocabulary()
+
+        assert vocab.ids(["가", "나", "가"]) == [0, 1, 0]
+        assert vocab.ids(["다", "나"]) == [2, 1]
+        assert vocab.tokens == ["가", "나", "다"]
+        assert len(vocab) == 3
+
+    def test_encode_decode_roundtrip(self):
+        """array('i') 인코딩 후 디코딩하면 원래 토큰"""
+        vocab = Vocabulary()
+        tokens = tokenize("오늘 날씨가 좋다 오늘")
+
+        encoded = vocab.encode(tokens)
+
+        assert encoded.typecode == 'i'
+        assert vocab.decode(encoded) == tokens
+
+    def test_differences_same_with_shared_vocab(self):
+        """공유 어휘 사용 여부와 무관하게 같은 문자열 차이점 반환"""
+        rng = random.Random(8)
+        words = ["오늘", "날씨가", "좋다", "않좋다", "안", "매우"]
+        vocab = Vocabulary()
+        for _ in range(200):
+            original = " ".join(rng.choice(words) for _ in range(rng.randint(0, 10)))
+            corrected = " ".join(rng.choice(words) for _ in range(rng.randint(0, 10)))
+            assert (find_differences_with_offsets(original, corrected, vocab)
+                    == find_differences_with_offsets(original, corrected))
+
+
+class TestLinearLCS:
+    """저메모리 LCS(체크포인트 방식) 테스트"""
+
+    ALPHABET = ["가", "나", "다", "라"]
+
+    @pytest.mark.parametrize("block", [None, 1, 3, 7])
+    def test_matches_find_lcs(self, block):
+        """체크포인트 간격과 무관하게 find_lcs와 같은 LCS 반환"""
+        rng = random.Random(5)
+        for _ in range(200):
+            X = _random_tokens(rng, self.ALPHABET, 40)
+            Y = _random_tokens(rng, self.ALPHABET, 40)
+            assert find_lcs_linear(X, Y, block=block) == find_lcs(X, Y)
+
+    def test_long_document(self):
+        """문단 길이 입력에서도 같은 결과"""
+        rng = random.Random(6)
+        X = _random_tokens(rng, self.ALPHABET * 50, 1500)
+        Y = [token for token in X if rng.random() > 0.05]
+
+        assert find_lcs_linear(X, Y) == find_lcs(X, Y)
+
+    def test_threshold_switches_to_linear(self, monkeypatch):
+        """임계값을 넘으면 find_differences_with_offsets가 저메모리 LCS 사용"""
+        calls = []
+
+        def spy(X, Y, block=None):
+            calls.append(len(X))
+            return find_lcs_linear(X, Y, block)
+
+        original = "오늘 날씨가 않좋다 그래서 집에 있었다"
+        corrected = "오늘 날씨가 안좋다 그래서 집에 있었다"
+        expected = find_differences_with_offsets(original, corrected)
+
+        monkeypatch.setattr(lcs_module, "find_lcs_linear", spy)
+        monkeypatch.setattr(lcs_module, "LINEAR_LCS_THRESHOLD", 4)
+
+        assert find_differences_with_offsets(original, corrected) == expected
+        assert calls == [6]
+
+
 class TestEvaluateCorrection:
     """evaluate_correction 함수 테스트"""
 
@@ -308,6 +441,51 @@ class TestEvaluateCorrection:
         assert isinstance(result['analysis_df'], pd.DataFrame)
 
 
+class TestScorePair:
+    """score_pair 및 컬럼 단위 평가 테스트"""
+
+    def test_true_positive(self):
+        """정답과 같은 위치·같은 교정이면 TP"""
+        assert score_pair("오늘 날씨가 않좋다", "오늘 날씨가 안좋다", "오늘 날씨가 안좋다") == (1, 0, 0, 0)
+
+    def test_false_positive(self):
+        """같은 위치·다른 교정이면 FP"""
+        assert score_pair("오늘 날씨가 않좋다", "오늘 날씨가 안좋다", "오늘 날씨가 나쁘다") == (0, 1, 0, 0)
+
+    def test_missing_and_redundant(self):
+        """교정하지 않으면 FM, 불필요한 교정은 FR"""
+        assert score_pair("오늘 날씨가 않좋다", "오늘 날씨가 안좋다", "오늘 날씨가 않좋다") == (0, 0, 1, 0)
+        assert score_pair("오늘 날씨가 좋다", "오늘 날씨가 좋다", "어제 날씨가 좋다") == (0, 0, 0, 1)
+
+    def test_totals_match_per_row_scores(self):
+        """전체 집계와 analysis_df가 행별 score_pair 결과와 일치"""
+        rng = random.Random(7)
+        words = ["오늘", "날씨가", "좋다", "않좋다", "안", "매우"]
+        originals = [" ".join(rng.choice(words) for _ in range(rng.randint(1, 8))) for _ in range(50)]
+        goldens = [" ".join(rng.choice(words) if rng.random() < 0.2 else t for t in o.split()) for o in originals]
+        predictions = [" ".join(rng.choice(words) if rng.random() < 0.2 else t for t in o.split()) for o in originals]
+
+        result = evaluate_correction(
+            pd.DataFrame({'err_sentence': originals, 'cor_sentence': goldens}),
+            pd.DataFrame({'cor_sentence': predictions})
+        )
+
+        scores = [score_pair(o, g, p) for o, g, p in zip(originals, goldens, predictions)]
+        analysis_df = result['analysis_df']
+        assert list(analysis_df.columns) == ['original', 'golden', 'prediction', 'tp', 'fp', 'fm', 'fr']
+        assert list(zip(analysis_df['tp'], analysis_df['fp'], analysis_df['fm'], analysis_df['fr'])) == scores
+        assert result['true_positives'] == sum(s[0] for s in scores)
+        assert result['false_redundants'] == sum(s[3] for s in scores)
+
+    def test_short_prediction_raises(self):
+        """예측 행이 부족하면 ValueError"""
+        with pytest.raises(ValueError):
+            evaluate_correction(
+                pd.DataFrame({'err_sentence': ['가 나', '다 라'], 'cor_sentence': ['가 나', '다 라']}),
+                pd.DataFrame({'cor_sentence': ['가 나']})
+            )
+
+
 class TestRecallPrecisionCalculation:
     """Recall과 Precision 계산 로직 테스트"""
 
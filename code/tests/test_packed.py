@@ -0,0 +1,150 @@
+"""
+다중 문장 묶음 요청 테스트
+"""
+
+import re
+
+import pytest
+
+from src.api.cache import ResponseCache
+from src.api.retry import RetryPolicy
+from src.generator import SentenceGenerator
+from src.prompts.packed import BaselinePackedPrompt, PackedPrompt, get_packed_prompt
+from tests.openai_stub import OpenAIStubServer, default_responder
+
+
+def _inputs(user_content: str):
+    """묶음 사용자 메시지에서 (번호, 원문) 추출"""
+    block = user_content.rsplit("# 교정할 문장", 1)[-1]
+    return re.findall(r"^\[(\d+)\] (.*)$", block, re.M)
+
+
+def packed_responder(user_content: str) -> str:
+    """묶음 요청이면 번호별로 '교정_' 접두사, 아니면 기본 응답"""
+    inputs = _inputs(user_content)
+    if not inputs:
+        return default_responder(user_content)
+    lines = [f"[{number}] 교정_{text}" for number, text in inputs]
+    # 번호를 빠뜨린 응답 흉내
+    if any("누락" in text for _, text in inputs):
+        lines = lines[:-1]
+    return "\n".join(lines)
+
+
+@pytest.fixture
+def stub():
+    server = OpenAIStubServer(responder=packed_responder).start()
+    yield server
+    server.stop()
+
+
+class TestPackedPrompt:
+    """묶음 프롬프트 렌더링·응답 분리 테스트"""
+
+    def test_format(self):
+        message = BaselinePackedPrompt().format_user_message(["가 나", "다"])
+
+        assert message.endswith("<원문>\n[1] 가 나\n[2] 다\n<교정>")
+
+    @pytest.mark.parametrize("response, expected", [
+        ("[1] 가\n[2] 나", ["가", "나"]),
+        ("<교정>\n\n [1] 가 \n[2]나\n", ["가", "나"]),
+        ("교정 결과:\n[1] [2] 가\n[2] 나", ["[2] 가", "나"]),
+    ])
+    def test_parse(self, response, expected):
+        assert PackedPrompt.parse(response, 2) == expected
+
+    @pytest.mark.parametrize("response", [
+        "[1] 가",
+        "[1] 가\n[2] 나\n[3] 다",
+        "[2] 나\n[1] 가",
+        "[1] 가\n[1] 나",
+        "[1] 가\n설명\n[2] 나",
+        "[1] 가\n[2]",
+        "가\n나",
+    ])
+    def test_parse_failure(self, response):
+        assert PackedPrompt.parse(response, 2) is None
+
+    def test_can_pack(self):
+        assert PackedPrompt.can_pack("한 줄 문장")
+        assert not PackedPrompt.can_pack("두 줄\n문장")
+        assert not PackedPrompt.can_pack("  ")
+
+    def test_unknown_prompt(self):
+        with pytest.raises(ValueError):
+            get_packed_prompt("zero_shot")
+
+
+class TestPackedGeneration:
+    """묶음 모드 생성 테스트 (로컬 스텁 서버 사용)"""
+
+    @pytest.mark.parametrize("concurrency", [1, 3])
+    def test_packs_requests(self, stub, make_generator, concurrency):
+        sentences = [f"문장{i}" for i in range(10)]
+        generator = make_generator(stub, pack_size=4, max_concurrency=concurrency)
+
+        result_df = generator.generate_batch(sentences)
+
+        assert result_df["cor_sentence"].tolist() == [f"교정_{s}" for s in sentences]
+        assert len(stub.requests) == 3
+        assert generator.last_raw == [f"교정_{s}" for s in sentences]
+        assert sum(generator.last_attempts) == 3
+        assert generator.packed_fallbacks == 0
+
+    @pytest.mark.parametrize("concurrency", [1, 3])
+    def test_parse_failure_falls_back(self, stub, make_generator, concurrency):
+        sentences = ["문장A", "누락B", "문장C", "문장D", "문장E"]
+        generator = make_generator(stub, pack_size=4, max_concurrency=concurrency)
+
+        result_df = generator.generate_batch(sentences)
+
+        assert result_df["cor_sentence"].tolist() == [f"교정_{s}" for s in sentences]
+        # 묶음 2개 + 실패한 첫 묶음의 단일 호출 4개
+        assert len(stub.requests) == 6
+        assert sum(generator.last_attempts) == 6
+        assert generator.packed_fallbacks == 1
+
+    def test_unpackable_rows_sent_alone(self, stub, make_generator):
+        sentences = ["문장A", "여러\n줄", "문장C"]
+        generator = make_generator(stub, pack_size=4)
+
+        assert generator._pack_groups(sentences, [False] * 3) == [[0], [1], [2]]
+        assert generator._pack_groups(["a", "b", "c", "d", "e", "f\ng", "h"], [False] * 7) == [[0, 1, 2, 3], [4], [5], [6]]
+        assert generator._pack_groups(["a", "b", "c"], [False, True, False]) == [[0], [1], [2]]
+
+    def test_request_failure_falls_back(self, stub, make_generator):
+        stub.fail_inputs = ["실패"]
+        generator = make_generator(stub, pack_size=4, retry_policy=RetryPolicy(max_attempts=1, base_delay=0.01))
+
+        result_df = generator.generate_batch(["문장A", "실패B"])
+
+        assert result_df["cor_sentence"].tolist() == ["교정_문장A", "실패B"]
+        assert generator.last_raw == ["교정_문장A", None]
+
+    def test_on_row_called_per_row(self, stub, make_generator):
+        rows = []
+        generator = make_generator(stub, pack_size=4)
+
+        generator.generate_batch(["문장A", "문장B"], on_row=lambda index, *row: rows.append(index))
+
+        assert sorted(rows) == [0, 1]
+
+    def test_packed_response_cached(self, stub, make_generator, tmp_path):
+        sentences = ["문장A", "문장B", "문장C"]
+        cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+        make_generator(stub, pack_size=4, cache=cache).generate_batch(sentences)
+        requests = len(stub.requests)
+
+        generator = make_generator(stub, pack_size=4, cache=cache)
+        result_df = generator.generate_batch(sentences)
+
+        assert len(stub.requests) == requests == 1
+        assert result_df["cor_sentence"].tolist() == [f"교정_{s}" for s in sentences]
+        assert generator.last_attempts == [0, 0, 0]
+
+    def test_invalid_pack_size(self):
+        with pytest.raises(ValueError):
+            SentenceGenerator(prompt_name="baseline", api_key="test-key", pack_size=0)
+        with pytest.raises(ValueError):
+            SentenceGenerator(prompt_name="zero_shot", api_key="test-key", pack_size=4)
@@ -104,3 +104,41 @@ class TestIntegration:
         result3 = processor.process("원문", "교정문")
 
         assert result1 == result2 == result3
+
+
+class TestProcessBatch:
+    """process_batch (배치/프로세스 풀 후처리) 테스트"""
+
+    def _make_pairs(self, n):
+        originals = [f"그가 {i}번 금새 왔다." for i in range(n)]
+        corrections = [
+            f"※ 원칙 준수: 그가 {i}번 금새 왔다." if i % 3 == 0 else original
+            for i, original in enumerate(originals)
+        ]
+        return originals, corrections
+
+    @pytest.mark.parametrize("processor_cls", [EnhancedPostprocessor, MinimalRulePostprocessor])
+    def test_batch_matches_process(self, processor_cls):
+        originals, corrections = self._make_pairs(20)
+        processor = processor_cls()
+
+        expected = [processor.process(o, c) for o, c in zip(originals, corrections)]
+        assert processor_cls().process_batch(originals, corrections) == expected
+
+    def test_parallel_matches_sequential_and_merges_log(self):
+        originals, corrections = self._make_pairs(40)
+        sequential = EnhancedPostprocessor()
+        parallel = EnhancedPostprocessor()
+
+        expected = sequential.process_batch(originals, corrections)
+        assert parallel.process_batch(originals, corrections, workers=2) == expected
+        assert parallel.get_processing_summary() == sequential.get_processing_summary()
+        assert list(parallel.processing_log) == list(sequential.processing_log)
+
+    def test_length_mismatch(self):
+        with pytest.raises(ValueError):
+            MinimalRulePostprocessor().process_batch(["a", "b"], ["a"])
+
+    def test_invalid_workers(self):
+        with pytest.raises(ValueError):
+            MinimalRulePostprocessor().process_batch(["a"], ["a"], workers=0)
@@ -0,0 +1,142 @@
+"""
+후처리 로그(ProcessingLog) 테스트
+"""
+
+import json
+
+import pytest
+
+from src.postprocessors.enhanced_postprocessor import EnhancedPostprocessor
+from src.postprocessors.processing_log import ProcessingLog
+
+
+def _entry(i, removed=False):
+    return {
+        'original': f"원문 {i}",
+        'before_postprocess': f"원문 {i}",
+        'after_postprocess': f"원문 {i}",
+        'metadata_removed': removed,
+        'length_ratio_before': 1.0,
+        'length_ratio_after': 0.5 if removed else 1.0,
+    }
+
+
+class TestProcessingLog:
+    """링 버퍼, 누적 집계, JSONL 기록 테스트"""
+
+    def test_ring_buffer_keeps_recent_entries(self):
+        log = ProcessingLog(max_entries=3)
+        for i in range(10):
+            log.append(_entry(i))
+
+        assert len(log) == 3
+        assert [entry['original'] for entry in log] == ["원문 7", "원문 8", "원문 9"]
+
+    def test_summary_uses_all_entries(self):
+        log = ProcessingLog(max_entries=2, sample_rate=0.1, seed=0)
+        for i in range(100):
+            log.append(_entry(i, removed=i % 4 == 0))
+
+        summary = log.get_summary()
+        assert summary['total_cases'] == 100
+        assert summary['metadata_removed_count'] == 25
+        assert summary['metadata_removed_rate'] == pytest.approx(25.0)
+        assert summary['avg_length_ratio_after'] == pytest.approx(87.5)
+
+    def test_empty_summary(self):
+        assert ProcessingLog().get_summary() == {}
+
+    def test_invalid_sample_rate(self):
+        with pytest.raises(ValueError):
+            ProcessingLog(sample_rate=1.5)
+
+    def test_sink_writes_compact_jsonl(self, tmp_path):
+        path = tmp_path / "log" / "postprocess.jsonl"
+        log = ProcessingLog(max_entries=1, sink_path=str(path))
+        for i in range(50):
+            log.append(_entry(i))
+        log.flush()
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 50
+        assert json.loads(lines[-1])['original'] == "원문 49"
+        assert ': ' not in lines[0]
+        log.close()
+        log.close()
+
+    def test_close_flushes_pending_entries(self, tmp_path):
+        path = tmp_path / "postprocess.jsonl"
+        log = ProcessingLog(sink_path=str(path), flush_interval=60)
+        for i in range(5):
+            log.append(_entry(i))
+        log.close()
+
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 5
+
+
+class TestEnhancedProcessingLog:
+    """EnhancedPostprocessor 로그 연동 테스트"""
+
+    def test_summary_and_bounded_log(self, tmp_path):
+        processor = EnhancedPostprocessor(log_max_entries=2)
+        for _ in range(5):
+            processor.process("리조트 수요가 급증했다.", "※ 원칙 준수: 리조트 수요가 급증했다.")
+
+        assert len(processor.processing_log) == 2
+        summary = processor.get_processing_summary()
+        assert summary['total_cases'] == 5
+        assert summary['metadata_removed_count'] == 5
+
+        output = tmp_path / "log.json"
+        processor.save_processing_log(str(output))
+        assert len(json.loads(output.read_text(encoding="utf-8"))) == 2
+
+    def test_default_keeps_full_log(self, tmp_path):
+        processor = EnhancedPostprocessor()
+        for _ in range(1500):
+            processor.process("원문입니다.", "원문입니다.")
+
+        output = tmp_path / "log.json"
+        processor.save_processing_log(str(output))
+        assert len(json.loads(output.read_text(encoding="utf-8"))) == 1500
+
+    def test_streaming_log_path(self, tmp_path):
+        path = tmp_path / "postprocess.jsonl"
+        processor = EnhancedPostprocessor(log_max_entries=0, log_path=str(path))
+        for _ in range(3):
+            processor.process("원문입니다.", "원문입니다.")
+        processor.processing_log.close()
+
+        assert len(processor.processing_log) == 0
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 3
+
+
+class TestGeneratorProcessingLog:
+    """생성기 Enhanced 후처리 로그 설정 테스트 (로컬 스텁 서버 사용)"""
+
+    def test_generator_bounds_log_and_streams(self, openai_stub, make_generator, tmp_path):
+        path = tmp_path / "postprocess.jsonl"
+        generator = make_generator(
+            openai_stub, enable_postprocessing=True, use_enhanced_postprocessor=True,
+            log_max_entries=2, log_path=str(path)
+        )
+
+        generator.generate_batch([f"문장{i}" for i in range(5)])
+        log = generator.postprocessor.processing_log
+        log.close()
+
+        assert len(log) == 2
+        assert log.get_summary()['total_cases'] == 5
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 5
+
+    def test_generator_default_is_bounded(self, openai_stub, make_generator):
+        generator = make_generator(openai_stub, enable_postprocessing=True, use_enhanced_postprocessor=True)
+
+        assert generator.postprocessor.processing_log.entries.maxlen == 1000
+
+    def test_generator_unbounded_opt_in(self, openai_stub, make_generator):
+        generator = make_generator(
+            openai_stub, enable_postprocessing=True, use_enhanced_postprocessor=True, log_max_entries=None
+        )
+
+        assert generator.postprocessor.processing_log.entries.maxlen is None
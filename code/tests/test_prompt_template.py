@@ -0,0 +1,95 @@
+"""
+미리 컴파일된 프롬프트 템플릿 테스트
+"""
+
+import pytest
+
+from src.prompts.base import BasePrompt, PromptTemplate
+from src.prompts.registry import get_registry
+
+
+class TestPromptTemplate:
+    """PromptTemplate 분할·렌더링 테스트"""
+
+    def test_split(self):
+        template = PromptTemplate("앞 {{x}}\n{text}\n뒤 }}")
+
+        assert template.prefix == "앞 {x}\n"
+        assert template.suffix == "\n뒤 }"
+
+    @pytest.mark.parametrize("text", ["문장", "", "중괄호 {text} {{x}} }"])
+    def test_render_matches_format(self, text):
+        source = "# 지시 {{예시}}\n<원문>\n{text}\n<교정>"
+
+        assert PromptTemplate(source).render(text) == source.format(text=text)
+
+    @pytest.mark.parametrize("source", ["슬롯 없음", "{text} {text}", "{text} {other}", "{text!r}", "{text:>10}"])
+    def test_invalid_template(self, source):
+        with pytest.raises(ValueError):
+            PromptTemplate(source)
+
+    def test_immutable(self):
+        template = PromptTemplate("{text}")
+
+        with pytest.raises(AttributeError):
+            template.prefix = "x"
+
+
+class _SystemPrompt(BasePrompt):
+    template = PromptTemplate("접두 {text} 접미")
+
+    @property
+    def name(self) -> str:
+        return "system_test"
+
+    def system_message(self) -> str:
+        return "시스템"
+
+
+class _CustomPrompt(BasePrompt):
+    @property
+    def name(self) -> str:
+        return "custom_test"
+
+    def system_message(self) -> str:
+        return ""
+
+    def format_user_message(self, text: str) -> str:
+        return f"직접 구현: {text}!"
+
+
+class TestPromptMessages:
+    """to_messages와 prefix_key 테스트"""
+
+    @pytest.mark.parametrize("name", sorted(get_registry()))
+    def test_registered_prompts_use_template(self, name):
+        prompt = get_registry()[name]()
+
+        assert prompt.template is not None
+        message = prompt.format_user_message("문장")
+        assert message == prompt.template.prefix + "문장" + prompt.template.suffix
+        assert prompt.to_messages("문장") == [{"role": "user", "content": message}]
+
+    def test_messages_not_shared(self):
+        """반환한 메시지를 수정해도 다음 호출에 영향 없음"""
+        prompt = _SystemPrompt()
+        first = prompt.to_messages("가")
+        first[0]["content"] = "변경"
+        first.append({"role": "assistant", "content": "추가"})
+
+        assert prompt.to_messages("가") == [{"role": "system", "content": "시스템"}, {"role": "user", "content": "접두 가 접미"}]
+
+    def test_prefix_key(self):
+        prompt = _SystemPrompt()
+
+        assert prompt.prefix_key == _SystemPrompt().prefix_key
+        assert len(prompt.prefix_key) == 64
+        keys = {cls().prefix_key for cls in get_registry().values()}
+        assert len(keys) == len(get_registry())
+
+    def test_custom_format_user_message(self):
+        prompt = _CustomPrompt()
+
+        assert prompt.user_prefix() == "직접 구현: "
+        assert prompt.to_messages("가") == [{"role": "user", "content": "직접 구현: 가!"}]
+        assert prompt.prefix_key != _SystemPrompt().prefix_key
@@ -0,0 +1,201 @@
+"""
+RateLimiter / AdaptiveConcurrency 테스트
+"""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+from openai import RateLimitError, APITimeoutError, APIStatusError
+
+from src.api.rate_limiter import (
+    TokenBucket,
+    RateLimiter,
+    AdaptiveConcurrency,
+    estimate_tokens,
+    is_throttle_error,
+)
+from src.generator import SentenceGenerator
+
+
+class FakeClock:
+    """테스트용 수동 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket:
+    """TokenBucket 테스트"""
+
+    def test_within_capacity_no_wait(self):
+        """잔량 안에서는 대기 없음"""
+        bucket = TokenBucket(60, clock=FakeClock())
+
+        assert bucket.reserve(30) == 0.0
+        assert bucket.reserve(30) == 0.0
+
+    def test_over_capacity_returns_wait(self):
+        """잔량 초과 시 부족분만큼 대기 시간 반환 (분당 60 → 초당 1)"""
+        bucket = TokenBucket(60, clock=FakeClock())
+        bucket.reserve(60)
+
+        assert bucket.reserve(2) == pytest.approx(2.0)
+
+    def test_refill_over_time(self):
+        """시간 경과에 따라 충전되고 capacity를 넘지 않음"""
+        clock = FakeClock()
+        bucket = TokenBucket(60, clock=clock)
+        bucket.reserve(60)
+
+        clock.now = 10.0
+        assert bucket.available == pytest.approx(10.0)
+
+        clock.now = 1000.0
+        assert bucket.available == pytest.approx(60.0)
+
+    def test_invalid_rate(self):
+        """0 이하 속도는 예외"""
+        with pytest.raises(ValueError):
+            TokenBucket(0)
+
+
+class TestRateLimiter:
+    """RateLimiter 테스트"""
+
+    def test_token_budget_dominates(self):
+        """요청/토큰 중 더 긴 대기 시간 적용"""
+        limiter = RateLimiter(requests_per_minute=600, tokens_per_minute=60, clock=FakeClock())
+
+        assert limiter.reserve(60) == 0.0
+        assert limiter.reserve(30) == pytest.approx(30.0)
+
+    def test_record_usage_refunds(self):
+        """실제 사용량이 추정보다 적으면 예산 반환"""
+        limiter = RateLimiter(tokens_per_minute=100, clock=FakeClock())
+        limiter.reserve(100)
+        limiter.record_usage(estimated=100, actual=40)
+
+        assert limiter.token_bucket.available == pytest.approx(60.0)
+
+    def test_unlimited(self):
+        """한도 미설정 시 대기 없음"""
+        limiter = RateLimiter()
+
+        assert limiter.reserve(10_000) == 0.0
+
+    def test_estimate_tokens(self):
+        """메시지 글자 수 기반 추정"""
+        messages = [{"role": "system", "content": "abc"}, {"role": "user", "content": "가나"}]
+
+        assert estimate_tokens(messages) == 5
+
+
+class TestAdaptiveConcurrency:
+    """AIMD 동시성 창 테스트"""
+
+    def test_throttle_halves_window(self):
+        """429 신호 시 창 절반으로 감소, cooldown 내 중복 신호는 무시"""
+        clock = FakeClock()
+        window = AdaptiveConcurrency(maximum=16, initial=16, clock=clock)
+
+        window.on_throttle()
+        window.on_throttle()
+        assert window.window == 8
+
+        clock.now = 5.0
+        window.on_throttle()
+        assert window.window == 4
+        assert window.throttle_events == 3
+
+    def test_success_grows_to_maximum(self):
+        """성공이 누적되면 창이 증가하되 maximum을 넘지 않음"""
+        window = AdaptiveConcurrency(maximum=8, initial=2)
+
+        for _ in range(200):
+            window.on_success()
+
+        assert window.window == 8
+
+    def test_never_below_minimum(self):
+        """창은 minimum 아래로 줄지 않음"""
+        clock = FakeClock()
+        window = AdaptiveConcurrency(maximum=4, initial=1, clock=clock)
+
+        for i in range(5):
+            clock.now = i * 10.0
+            window.on_throttle()
+
+        assert window.window == 1
+
+    def test_slot_limits_in_flight(self):
+        """slot()은 창 크기 이상 동시에 진입하지 못함"""
+        window = AdaptiveConcurrency(maximum=3, initial=3)
+        observed = []
+
+        async def task():
+            async with window.slot():
+                observed.append(window.in_flight)
+                await asyncio.sleep(0.01)
+
+        async def main():
+            await asyncio.gather(*(task() for _ in range(10)))
+
+        asyncio.run(main())
+
+        assert max(observed) == 3
+        assert window.in_flight == 0
+
+    def test_is_throttle_error(self):
+        """429/타임아웃만 처리량 초과로 분류"""
+        status_429 = Mock(spec=APIStatusError)
+        status_429.status_code = 429
+        status_500 = Mock(spec=APIStatusError)
+        status_500.status_code = 500
+
+        assert is_throttle_error(Mock(spec=RateLimitError))
+        assert is_throttle_error(Mock(spec=APITimeoutError))
+        assert is_throttle_error(status_429)
+        assert not is_throttle_error(status_500)
+        assert not is_throttle_error(ValueError("bad"))
+
+
+class TestGeneratorThrottling:
+    """SentenceGenerator 연동 테스트 (로컬 스텁 서버 사용)"""
+
+    def test_throttle_shrinks_window(self, openai_stub):
+        """스텁이 429를 반환하면 동시성 창이 줄어듦"""
+        openai_stub.throttle_inputs = ["혼잡"]
+        generator = SentenceGenerator(
+            prompt_name="baseline",
+            api_key="test-key",
+            base_url=openai_stub.base_url,
+            enable_postprocessing=False,
+            max_concurrency=8,
+            adaptive_concurrency=True
+        )
+        initial = generator.concurrency_window.window
+
+        result = generator.generate_batch(["문장A", "혼잡 문장", "문장C"])
+
+        assert result["cor_sentence"].tolist()[0] == "교정_문장A"
+        assert generator.concurrency_window.throttle_events >= 1
+        assert generator.concurrency_window.window < initial
+
+    def test_shared_limiter_counts_requests(self, openai_stub):
+        """속도 제한기를 거친 요청은 예산에서 차감됨"""
+        limiter = RateLimiter(requests_per_minute=1000)
+        generator = SentenceGenerator(
+            prompt_name="baseline",
+            api_key="test-key",
+            base_url=openai_stub.base_url,
+            enable_postprocessing=False,
+            rate_limiter=limiter
+        )
+
+        generator.generate_batch(["문장A", "문장B"])
+
+        assert limiter.request_bucket.available < 1000
@@ -0,0 +1,169 @@
+"""
+모델 원본 출력 저장소 및 후처리 재적용 테스트
+"""
+
+import pandas as pd
+import pytest
+
+from src.clean_classifier import CleanSentenceClassifier
+from src.postprocessors.enhanced_postprocessor import EnhancedPostprocessor
+from src.postprocessors.minimal_rule import MinimalRulePostprocessor
+from src.postprocessors.registry import PostprocessorChain, create_postprocessor, list_postprocessors
+from src.raw_store import apply_postprocessor, default_raw_path, raw_frame, read_raw_outputs
+from tests.openai_stub import OpenAIStubServer, default_responder
+
+
+def _metadata_responder(user_content: str) -> str:
+    """일부 응답에 메타데이터를 붙여 후처리 결과가 달라지도록 함"""
+    response = default_responder(user_content)
+    if "문장F" in response:
+        return ""
+    return f"※ 원칙 준수: {response}" if "B" in response else response
+
+
+@pytest.fixture
+def stub():
+    server = OpenAIStubServer(responder=_metadata_responder, fail_inputs=["문장D"]).start()
+    yield server
+    server.stop()
+
+
+def _setup(tmp_path, sentences):
+    input_path = tmp_path / "input.csv"
+    pd.DataFrame({"err_sentence": sentences}).to_csv(input_path, index=False)
+    output_path = str(tmp_path / "output.csv")
+    return str(input_path), output_path, default_raw_path(output_path)
+
+
+class TestRawOutputStore:
+    """생성 시 원본 출력 저장 테스트"""
+
+    @pytest.mark.parametrize("chunksize", [None, 2])
+    def test_repostprocess_reproduces_output(self, stub, make_generator, tmp_path, chunksize):
+        """저장한 원본 출력에 같은 후처리기를 적용하면 생성 결과와 같음"""
+        sentences = ["문장A", "문장B", "문장C", "문장D", "문장E"]
+        input_path, output_path, raw_path = _setup(tmp_path, sentences)
+
+        make_generator(stub, enable_postprocessing=True, use_enhanced_postprocessor=True).generate_from_csv(
+            input_path, output_path, chunksize=chunksize, raw_output_path=raw_path
+        )
+        output_df = pd.read_csv(output_path)
+        raw_df = read_raw_outputs(raw_path)
+
+        assert list(output_df.columns) == ["err_sentence", "cor_sentence"]
+        assert raw_df["raw_sentence"].tolist() == [
+            "교정_문장A", "※ 원칙 준수: 교정_문장B", "교정_문장C", None, "교정_문장E"
+        ]
+        requests = len(stub.requests)
+        result_df = apply_postprocessor(raw_df, create_postprocessor(["enhanced"]))
+        assert result_df["cor_sentence"].tolist() == output_df["cor_sentence"].tolist()
+        assert len(stub.requests) == requests
+
+    @pytest.mark.parametrize("kwargs", [{}, {"chunksize": 2}, {"batch_job_path": "job.jsonl"}])
+    def test_skipped_rows_have_no_raw_output(self, stub, make_generator, tmp_path, kwargs):
+        """사전 분류기로 건너뛴 행은 원본 출력이 없고, 후처리 재적용 시 원문 유지"""
+        sentences = ["문장A", "※ 원칙 준수: 깨끗한 문장.", "문장B", "※ 원칙 준수: 깨끗한 문장."]
+        input_path, output_path, raw_path = _setup(tmp_path, sentences)
+        classifier = CleanSentenceClassifier(min_clean_count=1, rule_patterns=[]).fit([sentences[1]], [sentences[1]])
+        if "batch_job_path" in kwargs:
+            kwargs = {"batch_job_path": str(tmp_path / kwargs["batch_job_path"]), "batch_poll_interval": 0}
+
+        generator = make_generator(
+            stub, enable_postprocessing=True, use_enhanced_postprocessor=True, clean_classifier=classifier
+        )
+        generator.generate_from_csv(input_path, output_path, raw_output_path=raw_path, **kwargs)
+        output_df = pd.read_csv(output_path)
+        raw_df = read_raw_outputs(raw_path)
+
+        assert output_df["cor_sentence"].tolist()[1::2] == sentences[1::2]
+        assert raw_df["raw_sentence"].tolist() == ["교정_문장A", None, "※ 원칙 준수: 교정_문장B", None]
+        result_df = apply_postprocessor(raw_df, create_postprocessor(["enhanced"]))
+        assert result_df["cor_sentence"].tolist() == output_df["cor_sentence"].tolist()
+
+    @pytest.mark.parametrize("chunksize", [None, 2])
+    def test_empty_output_is_not_failure(self, stub, make_generator, tmp_path, chunksize):
+        """빈 문자열 모델 출력은 실패 행과 구분되어 후처리 재적용 시에도 빈 출력 유지"""
+        sentences = ["문장A", "문장F", "문장D"]
+        input_path, output_path, raw_path = _setup(tmp_path, sentences)
+
+        make_generator(stub).generate_from_csv(input_path, output_path, chunksize=chunksize, raw_output_path=raw_path)
+        output_df = pd.read_csv(output_path, keep_default_na=False)
+        raw_df = read_raw_outputs(raw_path)
+
+        assert raw_df["raw_sentence"].tolist() == ["교정_문장A", "", None]
+        result_df = apply_postprocessor(raw_df, None)
+        assert result_df["cor_sentence"].tolist() == output_df["cor_sentence"].tolist() == ["교정_문장A", "", "문장D"]
+
+    def test_legacy_file_without_status(self, tmp_path):
+        """status 컬럼이 없는 이전 형식은 빈 값을 출력 없음으로 읽음"""
+        path = tmp_path / "raw.csv"
+        pd.DataFrame({"err_sentence": ["a", "b"], "raw_sentence": ["출력", ""]}).to_csv(path, index=False)
+
+        assert read_raw_outputs(str(path))["raw_sentence"].tolist() == ["출력", None]
+
+    def test_streaming_resume_truncates_raw(self, stub, make_generator, tmp_path):
+        """원본 출력 파일이 출력 파일보다 앞서 있으면 재개 시 맞춰 잘라냄"""
+        sentences = ["문장A", "문장B", "문장C", "문장E"]
+        input_path, output_path, raw_path = _setup(tmp_path, sentences)
+        pd.DataFrame({"err_sentence": ["문장A"], "cor_sentence": ["교정_문장A"]}).to_csv(output_path, index=False)
+        raw_frame(["문장A", "문장B"], ["교정_문장A", "원본_B"]).to_csv(raw_path, index=False)
+
+        make_generator(stub, enable_postprocessing=True, use_enhanced_postprocessor=True).generate_from_csv(
+            input_path, output_path, resume=True, chunksize=2, raw_output_path=raw_path
+        )
+        raw_df = read_raw_outputs(raw_path)
+
+        assert raw_df["err_sentence"].tolist() == sentences
+        assert raw_df["raw_sentence"].tolist()[1] == "※ 원칙 준수: 교정_문장B"
+
+    def test_journal_keeps_raw_for_resume(self, stub, make_generator, tmp_path):
+        """저널로 복구한 행도 원본 출력이 유지됨"""
+        sentences = ["문장A", "문장B"]
+        input_path, output_path, raw_path = _setup(tmp_path, sentences)
+        make_generator(stub, enable_postprocessing=True, use_enhanced_postprocessor=True).generate_from_csv(
+            input_path, output_path, journal_path=str(tmp_path / "run.journal.jsonl"), raw_output_path=raw_path
+        )
+        requests = len(stub.requests)
+
+        make_generator(stub, enable_postprocessing=True, use_enhanced_postprocessor=True).generate_from_csv(
+            input_path, output_path, resume=True,
+            journal_path=str(tmp_path / "run.journal.jsonl"), raw_output_path=raw_path
+        )
+
+        assert len(stub.requests) == requests
+        assert read_raw_outputs(raw_path)["raw_sentence"].tolist() == ["교정_문장A", "※ 원칙 준수: 교정_문장B"]
+
+    def test_missing_columns(self, tmp_path):
+        path = tmp_path / "raw.csv"
+        pd.DataFrame({"err_sentence": ["a"]}).to_csv(path, index=False)
+
+        with pytest.raises(ValueError):
+            read_raw_outputs(str(path))
+
+
+class TestPostprocessorRegistry:
+    """후처리기 레지스트리와 체인 테스트"""
+
+    def test_default_postprocessors(self):
+        assert {"enhanced", "minimal_rule"} <= set(list_postprocessors())
+        assert isinstance(create_postprocessor(["minimal_rule"]), MinimalRulePostprocessor)
+
+    def test_chain_applies_in_order(self):
+        chain = create_postprocessor(["enhanced", "minimal_rule"], {"enhanced": {"enable_logging": False}})
+
+        assert isinstance(chain, PostprocessorChain)
+        assert chain.name == "enhanced+minimal_rule"
+        enhanced = EnhancedPostprocessor(enable_logging=False)
+        minimal = MinimalRulePostprocessor()
+        original = "금새 끝났다."
+        corrected = "※ 원칙 준수: 금새 끝났다."
+        assert chain.process(original, corrected) == minimal.process(original, enhanced.process(original, corrected))
+
+    def test_unknown_name(self):
+        with pytest.raises(ValueError):
+            create_postprocessor(["nope"])
+
+    def test_none_keeps_raw(self):
+        raw_df = raw_frame(["원문A", "원문B"], ["출력A", None])
+
+        assert apply_postprocessor(raw_df, None)["cor_sentence"].tolist() == ["출력A", "원문B"]
@@ -0,0 +1,168 @@
+"""
+RetryPolicy 테스트
+"""
+
+import json
+import random
+from unittest.mock import Mock
+
+import pytest
+from openai import (
+    APIConnectionError,
+    APIStatusError,
+    AuthenticationError,
+    BadRequestError,
+    InternalServerError,
+    RateLimitError,
+)
+
+from src.api.retry import RetryPolicy, RetryError, is_retryable
+from src.generator import SentenceGenerator
+
+
+def status_error(code: int) -> Mock:
+    """지정한 상태 코드의 APIStatusError 대역"""
+    exc = Mock(spec=APIStatusError)
+    exc.status_code = code
+    exc.response = None
+    return exc
+
+
+class ServiceUnavailable(InternalServerError):
+    """실제로 raise 가능한 503 오류 (HTTP 응답 객체 없이 생성)"""
+
+    def __init__(self):
+        Exception.__init__(self, "503 Service Unavailable")
+        self.status_code = 503
+        self.response = None
+
+
+def fast_policy(max_attempts: int = 3, **kwargs) -> RetryPolicy:
+    """대기 없이 동작하는 테스트용 정책"""
+    return RetryPolicy(max_attempts=max_attempts, base_delay=0.0, rng=random.Random(0), **kwargs)
+
+
+class TestErrorClassification:
+    """오류 분류 테스트"""
+
+    def test_retryable_errors(self):
+        """연결 오류, 429, 5xx는 재시도"""
+        assert is_retryable(Mock(spec=APIConnectionError))
+        assert is_retryable(Mock(spec=RateLimitError))
+        assert is_retryable(status_error(503))
+        assert is_retryable(status_error(408))
+
+    def test_fatal_errors(self):
+        """인증/잘못된 요청/일반 예외는 재시도하지 않음"""
+        assert not is_retryable(Mock(spec=AuthenticationError, status_code=401))
+        assert not is_retryable(Mock(spec=BadRequestError, status_code=400))
+        assert not is_retryable(status_error(404))
+        assert not is_retryable(ValueError("parse error"))
+
+
+class TestRetryPolicy:
+    """재시도 동작 테스트"""
+
+    def test_success_after_transient_failures(self):
+        """일시적 실패 후 성공 시 결과와 호출 횟수 반환"""
+        calls = []
+
+        def fn():
+            calls.append(1)
+            if len(calls) < 3:
+                raise ServiceUnavailable()
+            return "ok"
+
+        result, attempts = fast_policy().call(fn)
+
+        assert result == "ok"
+        assert attempts == 3
+
+    def test_budget_exhausted(self):
+        """호출 예산 소진 시 RetryError, 호출 횟수는 max_attempts"""
+        fn = Mock(side_effect=ServiceUnavailable())
+
+        with pytest.raises(RetryError) as exc_info:
+            fast_policy(max_attempts=3).call(fn)
+
+        assert exc_info.value.attempts == 3
+        assert fn.call_count == 3
+
+    def test_fatal_error_not_retried(self):
+        """치명적 오류는 즉시 중단"""
+        fn = Mock(side_effect=ValueError("bad"))
+
+        with pytest.raises(RetryError) as exc_info:
+            fast_policy().call(fn)
+
+        assert exc_info.value.attempts == 1
+        assert isinstance(exc_info.value.last_exception, ValueError)
+
+    def test_backoff_bounds(self):
+        """지터 대기 시간은 [0, min(max_delay, base * 2^(n-1))] 범위"""
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0, rng=random.Random(42))
+
+        for attempt in range(1, 8):
+            delay = policy.backoff(attempt)
+            assert 0.0 <= delay <= min(5.0, 2 ** (attempt - 1))
+
+    def test_deadline_stops_retries(self):
+        """다음 대기가 전체 기한을 넘기면 재시도하지 않음"""
+        policy = RetryPolicy(max_attempts=5, base_delay=10.0, deadline=0.5, rng=random.Random(1))
+        policy.backoff = lambda attempt, exc=None: 1.0
+        fn = Mock(side_effect=ServiceUnavailable())
+
+        with pytest.raises(RetryError) as exc_info:
+            policy.call(fn)
+
+        assert exc_info.value.attempts == 1
+
+    def test_from_config(self, tmp_path):
+        """calls_per_case 설정을 호출 예산으로 사용"""
+        config = tmp_path / "prompt_templates.json"
+        config.write_text(json.dumps({"api_call_strategy": {"calls_per_case": 5}}))
+
+        assert RetryPolicy.from_config(str(config)).max_attempts == 5
+        assert RetryPolicy.from_config(str(tmp_path / "missing.json")).max_attempts == 3
+
+    def test_repo_config_budget(self):
+        """저장소 설정 파일의 calls_per_case(3) 반영"""
+        assert RetryPolicy.from_config().max_attempts == 3
+
+
+class TestGeneratorRetry:
+    """SentenceGenerator 재시도 연동 테스트 (로컬 스텁 서버 사용)"""
+
+    @pytest.mark.parametrize("concurrency", [1, 4])
+    def test_transient_failure_recovered(self, openai_stub, concurrency):
+        """일시적 503은 재시도로 복구되고 행별 호출 횟수 기록"""
+        openai_stub.transient_failures = {"문장B": 2}
+        generator = SentenceGenerator(
+            prompt_name="baseline",
+            api_key="test-key",
+            base_url=openai_stub.base_url,
+            enable_postprocessing=False,
+            retry_policy=fast_policy()
+        )
+
+        result = generator.generate_batch(["문장A", "문장B"], concurrency=concurrency)
+
+        assert result["cor_sentence"].tolist() == ["교정_문장A", "교정_문장B"]
+        assert generator.last_attempts == [1, 3]
+
+    def test_budget_respected(self, openai_stub):
+        """지속 실패 시 calls_per_case 이상 호출하지 않고 원문 유지"""
+        openai_stub.fail_inputs = ["문장A"]
+        generator = SentenceGenerator(
+            prompt_name="baseline",
+            api_key="test-key",
+            base_url=openai_stub.base_url,
+            enable_postprocessing=False,
+            retry_policy=fast_policy(max_attempts=3)
+        )
+
+        result = generator.generate_batch(["문장A"])
+
+        assert result["cor_sentence"].tolist() == ["문장A"]
+        assert generator.last_attempts == [3]
+        assert len(openai_stub.requests) == 3
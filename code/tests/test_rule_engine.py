@@ -0,0 +1,171 @@
+"""
+규칙 컴파일 엔진(RuleSet) 및 EnhancedPostprocessor 골든 코퍼스 테스트
+"""
+
+import json
+import random
+import re
+from pathlib import Path
+
+import pytest
+
+from src.postprocessors.enhanced_postprocessor import DEFAULT_GRAMMAR_RULE_PACK, EnhancedPostprocessor
+from src.postprocessors.rule_engine import (
+    AhoCorasick, FusedLiteralRule, RuleSet, can_fuse, literal_text
+)
+from src.postprocessors.rule_pack import RulePack
+
+
+GOLDEN_PATH = Path(__file__).parent / "data" / "enhanced_postprocessor_golden.jsonl"
+
+
+def _sequential(rules, text):
+    """규칙을 순서대로 re.sub 하는 기준 구현"""
+    for rule in rules:
+        text = re.sub(rule['pattern'], rule['replacement'], text,
+                      count=rule.get('count', 0), flags=rule.get('flags', 0))
+    return text
+
+
+class TestLiteralDetection:
+    """리터럴 판별 테스트"""
+
+    def test_literal_patterns(self):
+        assert literal_text(r'해보자') == '해보자'
+        assert literal_text(r'다\[') == '다['
+
+    def test_non_literal_patterns(self):
+        assert literal_text(r'안돼(?![가-힣])') is None
+        assert literal_text(r'수정\s*불필요') is None
+        assert literal_text(r'a.b') is None
+        assert literal_text('') is None
+
+
+class TestFusionSafety:
+    """리터럴 합치기 안전성 조건 테스트"""
+
+    def test_disjoint_literals_fuse(self):
+        assert can_fuse([('되여요', '돼요')], '되여서', '돼서')
+
+    def test_replacement_creating_later_pattern_blocks(self):
+        """앞 규칙 치환 결과가 뒤 패턴의 일부가 되면 합치지 않음 ('되여요'→'돼요' 후 '안돼요')"""
+        assert not can_fuse([('되여요', '돼요')], '안돼요', '안 돼요')
+
+    def test_prefix_patterns_block(self):
+        assert not can_fuse([('해보았', '해 보았')], '해보았다', '해 보았다')
+
+    def test_deletion_blocks(self):
+        """빈 치환은 양옆을 붙여 새 매칭을 만들 수 있으므로 합치지 않음"""
+        assert not can_fuse([('다[', '')], '다최종', '')
+
+    def test_grammar_rules_are_partially_fused(self):
+        grammar_rules = RulePack.load(str(DEFAULT_GRAMMAR_RULE_PACK)).rules
+        rule_set = RuleSet(grammar_rules)
+
+        fused = [step for step in rule_set.steps if isinstance(step, FusedLiteralRule)]
+        assert fused
+        assert len(rule_set.steps) < len(grammar_rules)
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_random_literal_rules_match_sequential(self, seed):
+        """무작위 리터럴 규칙 표에서 합친 결과가 순차 적용과 같음 (시드 고정 속성 테스트)"""
+        rng = random.Random(seed)
+        alphabet = "가나다라"
+
+        def word(lo, hi):
+            return ''.join(rng.choice(alphabet) for _ in range(rng.randint(lo, hi)))
+
+        for _ in range(100):
+            rules = [{'pattern': word(1, 3), 'replacement': word(0, 3)} for _ in range(rng.randint(1, 6))]
+            rule_set = RuleSet(rules)
+            for _ in range(20):
+                text = word(0, 20)
+                assert rule_set.apply(text) == _sequential(rules, text)
+
+
+class TestAhoCorasick:
+    """Aho–Corasick 리터럴 매처 테스트"""
+
+    def test_finditer_matches_regex_alternation(self):
+        literals = ["되여요", "되여서", "할께요", "몇일"]
+        automaton = AhoCorasick(literals)
+        pattern = re.compile('|'.join(map(re.escape, literals)))
+        text = "몇일 뒤에 할께요, 되여서 되여요"
+
+        found = [(start, end, literals[index]) for start, end, index in automaton.finditer(text)]
+        assert found == [(m.start(), m.end(), m.group()) for m in pattern.finditer(text)]
+
+    def test_empty_literal_rejected(self):
+        with pytest.raises(ValueError):
+            AhoCorasick(["가", ""])
+
+    def test_large_group_uses_automaton(self, monkeypatch):
+        monkeypatch.setattr(FusedLiteralRule, "AHO_CORASICK_MIN_LITERALS", 3)
+        rules = [
+            {'name': 'a', 'pattern': '되여요', 'replacement': '돼요'},
+            {'name': 'b', 'pattern': '할께', 'replacement': '할게'},
+            {'name': 'c', 'pattern': '몇일', 'replacement': '며칠'},
+        ]
+        rule_set = RuleSet(rules)
+
+        assert len(rule_set.steps) == 1
+        assert rule_set.steps[0].automaton is not None
+        assert rule_set.apply("몇일 뒤에 할께 되여요") == "며칠 뒤에 할게 돼요"
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_random_rules_with_automaton_match_sequential(self, seed, monkeypatch):
+        """모든 리터럴 묶음을 Aho–Corasick으로 적용해도 순차 적용과 같음"""
+        monkeypatch.setattr(FusedLiteralRule, "AHO_CORASICK_MIN_LITERALS", 2)
+        rng = random.Random(seed)
+        alphabet = "가나다라"
+
+        def word(lo, hi):
+            return ''.join(rng.choice(alphabet) for _ in range(rng.randint(lo, hi)))
+
+        for _ in range(100):
+            rules = [{'pattern': word(1, 3), 'replacement': word(0, 3)} for _ in range(rng.randint(1, 6))]
+            rule_set = RuleSet(rules)
+            for _ in range(20):
+                text = word(0, 20)
+                assert rule_set.apply(text) == _sequential(rules, text)
+
+    def test_thousands_of_rules(self):
+        """수천 개 리터럴 규칙도 빠르게 컴파일되고 순차 적용과 같은 결과"""
+        rng = random.Random(0)
+        heads = [chr(0xAC00 + i) for i in range(0, 2000, 7)]
+        tails = [chr(0xB000 + i) for i in range(0, 2000, 7)]
+        literals = sorted({rng.choice(heads) + rng.choice(heads + tails) + rng.choice(tails)
+                           for _ in range(3000)})
+        rules = [{'pattern': literal, 'replacement': f"<{literal}>"} for literal in literals]
+        rule_set = RuleSet(rules)
+
+        assert any(step.automaton is not None for step in rule_set.steps
+                   if isinstance(step, FusedLiteralRule))
+        alphabet = heads + tails + [' '] * 50
+        for _ in range(5):
+            text = ''.join(rng.choice(alphabet) for _ in range(60))
+            assert rule_set.apply(text) == _sequential(rules, text)
+
+
+@pytest.fixture(scope="module")
+def cases():
+    """골든 코퍼스 (규칙 컴파일 전 구현의 출력)"""
+    with open(GOLDEN_PATH, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+class TestEnhancedGoldenCorpus:
+    """규칙 컴파일 전 구현으로 만든 골든 코퍼스와 바이트 단위 동일성 검증"""
+
+    def test_process_matches_golden(self, cases):
+        processor = EnhancedPostprocessor(enable_logging=False)
+        for case in cases:
+            assert processor.process(case["original"], case["corrected"]) == case["expected"]
+
+    def test_stages_match_golden(self, cases):
+        processor = EnhancedPostprocessor(enable_logging=False)
+        for case in cases:
+            text = case["corrected"] or ""
+            assert processor._apply_grammar_rules(text) == case["grammar"]
+            assert processor._clean_metadata_enhanced(text) == case["metadata"]
+            assert processor._clean_response(text) == case["response"]
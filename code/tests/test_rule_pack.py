@@ -0,0 +1,213 @@
+"""
+규칙 팩(RulePack, ReloadingRulePack) 테스트
+"""
+
+import json
+import os
+import re
+
+import pytest
+
+from src.postprocessors.enhanced_postprocessor import DEFAULT_GRAMMAR_RULE_PACK, EnhancedPostprocessor
+from src.postprocessors.minimal_rule import MinimalRulePostprocessor
+from src.postprocessors.rule_engine import FusedLiteralRule, RuleSet
+from src.postprocessors.rule_pack import ReloadingRulePack, RulePack
+
+
+def _write_pack(path, rules, name="test"):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"name": name, "rules": rules}, f, ensure_ascii=False)
+
+
+def _touch_later(path):
+    """mtime을 확실히 바꿔 변경으로 인식되게 함 (파일 시스템 시간 해상도 대비)"""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestRulePackParsing:
+    """팩 형식 검증 테스트"""
+
+    def test_precedence_orders_rules(self):
+        pack = RulePack.from_dict({"rules": [
+            {"name": "b", "pattern": "가", "replacement": "나", "precedence": 1},
+            {"name": "a", "pattern": "나", "replacement": "다", "precedence": 0},
+            {"name": "c", "pattern": "다", "replacement": "라", "precedence": 1},
+        ]})
+
+        assert [rule["name"] for rule in pack.rules] == ["a", "b", "c"]
+        # a(나→다) → b(가→나) → c(다→라) 순서 (파일 순서였다면 '라라')
+        assert pack.apply("가나") == "나라"
+
+    def test_flags_and_guards(self):
+        pack = RulePack.from_dict({"rules": [
+            {"name": "upper", "pattern": "abc", "replacement": "x", "flags": ["IGNORECASE"]},
+            {"name": "guarded", "pattern": "됬", "replacement": "됐", "guards": {"forbids": "원문"}},
+        ]})
+
+        assert pack.rules[0]["flags"] == re.IGNORECASE
+        assert pack.apply("ABC 됬다") == "x 됐다"
+        assert pack.apply("원문: 됬다") == "원문: 됬다"
+
+    def test_min_confidence_filters_rules(self):
+        payload = {"rules": [
+            {"name": "high", "pattern": "가", "replacement": "나", "confidence": "HIGH"},
+            {"name": "low", "pattern": "다", "replacement": "라", "confidence": "LOW"},
+        ]}
+
+        assert len(RulePack.from_dict(payload)) == 2
+        assert [rule["name"] for rule in RulePack.from_dict(payload, min_confidence="MEDIUM").rules] == ["high"]
+
+    @pytest.mark.parametrize("rule", [
+        {"pattern": "가"},
+        {"pattern": "(", "replacement": ""},
+        {"pattern": "가", "replacement": "나", "confidence": "SURE"},
+        {"pattern": "가", "replacement": "나", "flags": ["NOPE"]},
+        {"pattern": "가", "replacement": "나", "guards": {"when": "x"}},
+        {"pattern": "가", "replacement": "나", "priority": 1},
+    ])
+    def test_invalid_rules_rejected(self, rule):
+        with pytest.raises(ValueError):
+            RulePack.from_dict({"rules": [rule]})
+
+    def test_save_roundtrip_matches_default_grammar_pack(self, tmp_path):
+        path = tmp_path / "grammar.json"
+        RulePack.save(str(path), "grammar", RulePack.load(str(DEFAULT_GRAMMAR_RULE_PACK)).rules)
+        processor = EnhancedPostprocessor(enable_logging=False, grammar_rule_pack=str(path))
+        builtin = EnhancedPostprocessor(enable_logging=False)
+
+        text = "그렇게 되요. 안되요, 할께요 몇일 뒤에 봬요"
+        assert processor._apply_grammar_rules(text) == builtin._apply_grammar_rules(text)
+
+
+class TestRulePackCache:
+    """컴파일 아티팩트 캐시 테스트"""
+
+    def test_artifact_written_and_reused(self, tmp_path, monkeypatch):
+        pack_path = tmp_path / "pack.json"
+        cache_dir = tmp_path / "cache"
+        _write_pack(pack_path, [{"name": "a", "pattern": "금새", "replacement": "금세"}])
+
+        first = RulePack.load(str(pack_path), cache_dir=str(cache_dir))
+        assert len(list(cache_dir.glob("*.pickle"))) == 1
+
+        # 두 번째 로드는 컴파일(parse_rules)을 거치지 않음
+        def fail(*args, **kwargs):
+            raise AssertionError("rule pack was recompiled")
+        monkeypatch.setattr(RulePack, "parse_rules", staticmethod(fail))
+        second = RulePack.load(str(pack_path), cache_dir=str(cache_dir))
+
+        assert second.source_hash == first.source_hash
+        assert second.apply("금새 왔다") == "금세 왔다"
+
+    def test_artifact_keeps_fused_automaton(self, tmp_path, monkeypatch):
+        """아티팩트에서 읽으면 리터럴 묶음 분석과 오토마톤 생성을 다시 하지 않음"""
+        pack_path = tmp_path / "pack.json"
+        cache_dir = tmp_path / "cache"
+        literals = [f"가{i:04d}나" for i in range(FusedLiteralRule.AHO_CORASICK_MIN_LITERALS)]
+        _write_pack(pack_path, [{"pattern": literal, "replacement": "X"} for literal in literals])
+        RulePack.load(str(pack_path), cache_dir=str(cache_dir))
+
+        def fail(*args, **kwargs):
+            raise AssertionError("rule set was recompiled")
+        monkeypatch.setattr(RuleSet, "_compile", staticmethod(fail))
+        pack = RulePack.load(str(pack_path), cache_dir=str(cache_dir))
+
+        [step] = pack.rule_set.steps
+        assert step.automaton is not None
+        assert pack.apply("가0001나 가9999나") == "X 가9999나"
+
+    def test_changed_pack_gets_new_artifact(self, tmp_path):
+        pack_path = tmp_path / "pack.json"
+        cache_dir = tmp_path / "cache"
+        _write_pack(pack_path, [{"pattern": "가", "replacement": "나"}])
+        RulePack.load(str(pack_path), cache_dir=str(cache_dir))
+        _write_pack(pack_path, [{"pattern": "가", "replacement": "다"}])
+
+        assert RulePack.load(str(pack_path), cache_dir=str(cache_dir)).apply("가") == "다"
+        assert len(list(cache_dir.glob("*.pickle"))) == 2
+
+    def test_corrupt_artifact_is_rebuilt(self, tmp_path):
+        pack_path = tmp_path / "pack.json"
+        cache_dir = tmp_path / "cache"
+        _write_pack(pack_path, [{"pattern": "가", "replacement": "나"}])
+        RulePack.load(str(pack_path), cache_dir=str(cache_dir))
+        artifact = next(cache_dir.glob("*.pickle"))
+        artifact.write_bytes(b"not a pickle")
+
+        assert RulePack.load(str(pack_path), cache_dir=str(cache_dir)).apply("가") == "나"
+
+
+class TestReloadingRulePack:
+    """파일 변경 시 다시 읽기 테스트"""
+
+    def test_reloads_on_change(self, tmp_path):
+        pack_path = tmp_path / "pack.json"
+        _write_pack(pack_path, [{"pattern": "가", "replacement": "나"}])
+        pack = ReloadingRulePack(str(pack_path), check_interval=0)
+        assert pack.apply("가") == "나"
+
+        _write_pack(pack_path, [{"pattern": "가", "replacement": "다"}])
+        _touch_later(pack_path)
+
+        assert pack.apply("가") == "다"
+        assert pack.reloads == 1
+
+    def test_check_interval_limits_stat_calls(self, tmp_path):
+        pack_path = tmp_path / "pack.json"
+        _write_pack(pack_path, [{"pattern": "가", "replacement": "나"}])
+        pack = ReloadingRulePack(str(pack_path), check_interval=3600)
+
+        _write_pack(pack_path, [{"pattern": "가", "replacement": "다"}])
+        _touch_later(pack_path)
+
+        assert pack.apply("가") == "나"
+        assert pack.reload()
+        assert pack.apply("가") == "다"
+
+    def test_invalid_update_keeps_previous_rules(self, tmp_path):
+        pack_path = tmp_path / "pack.json"
+        _write_pack(pack_path, [{"pattern": "가", "replacement": "나"}])
+        pack = ReloadingRulePack(str(pack_path), check_interval=0)
+
+        pack_path.write_text("{not json", encoding="utf-8")
+        _touch_later(pack_path)
+
+        assert pack.apply("가") == "나"
+        assert pack.reloads == 0
+
+
+class TestMinimalRulePack:
+    """MinimalRulePostprocessor 규칙 팩 연동 테스트"""
+
+    def test_default_pack_rules(self):
+        processor = MinimalRulePostprocessor()
+
+        assert [rule["name"] for rule in processor.rules] == ["금새→금세", "치않→지않", "추측컨대→추측건대"]
+        assert processor.process("금새 끝났다", "금새 끝났다") == "금세 끝났다"
+        assert processor.process("좋치 않다", "좋치 않다") == "좋지 않다"
+        assert processor.process("추측컨대 맞다", "추측컨대 맞다") == "추측건대 맞다"
+
+    def test_enhanced_default_grammar_pack_reloads(self, tmp_path):
+        """EnhancedPostprocessor 문법 규칙도 기본 팩에서 읽고 파일 변경 시 다시 읽음"""
+        builtin = EnhancedPostprocessor(enable_logging=False)
+        assert isinstance(builtin.grammar_rules, ReloadingRulePack)
+        assert builtin.grammar_rules.path == str(DEFAULT_GRAMMAR_RULE_PACK)
+
+        pack_path = tmp_path / "grammar.json"
+        pack_path.write_bytes(DEFAULT_GRAMMAR_RULE_PACK.read_bytes())
+        processor = EnhancedPostprocessor(enable_logging=False, grammar_rule_pack=str(pack_path))
+        assert processor._apply_grammar_rules("몇일 뒤에 되요") == "몇일 뒤에 돼요"
+
+        _write_pack(pack_path, [{"pattern": "몇일", "replacement": "며칠"}])
+        _touch_later(pack_path)
+
+        assert processor.grammar_rules.reload()
+        assert processor._apply_grammar_rules("몇일 뒤에 되요") == "며칠 뒤에 되요"
+
+    def test_custom_pack(self, tmp_path):
+        pack_path = tmp_path / "pack.json"
+        _write_pack(pack_path, [{"pattern": "몇일", "replacement": "며칠"}])
+        processor = MinimalRulePostprocessor(rule_pack=str(pack_path))
+
+        assert processor.process("몇일 뒤", "몇일 뒤") == "며칠 뒤"